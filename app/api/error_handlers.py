@@ -1,6 +1,13 @@
 import sys
 from dataclasses import dataclass
 
+from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
 
 @dataclass
 class ErrorLocation:
@@ -67,4 +74,54 @@ class CustomExceptionError(Exception):
             f"Error occurred in file '{self.error_location.filename}' "
             f"at line {self.error_location.line_number}: "
             f"{self.error_location.error_message}"
-        )
\ No newline at end of file
+        )
+
+
+async def custom_exception_handler(request: Request, exc: CustomExceptionError) -> ORJSONResponse:
+    """
+    Global handler for service-level `CustomExceptionError`s.
+
+    Logs the full error location and returns a 500 response whose detail
+    carries only the error message, not the file path.
+
+    Args:
+        request: The request during which the error was raised
+        exc: The raised service error
+
+    Returns:
+        ORJSONResponse: 500 response with the error message
+    """
+    logger.error("Service error on %s: %s", request.url.path, exc)
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": exc.error_location.error_message},
+    )
+
+
+async def unhandled_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """
+    Global fallback handler for any exception not handled by a route.
+
+    Args:
+        request: The request during which the error was raised
+        exc: The unhandled exception
+
+    Returns:
+        ORJSONResponse: Generic 500 response
+    """
+    logger.error("Unhandled error on %s: %s", request.url.path, exc, exc_info=exc)
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "An unexpected error occurred while processing the request"},
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Register the global exception handlers on the application.
+
+    Args:
+        app: The FastAPI application
+    """
+    app.add_exception_handler(CustomExceptionError, custom_exception_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
@@ -20,22 +20,26 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from app.api.error_handlers import CustomExceptionError
 from app.core.logging import get_logger
 from app.schemas.validator import (
+    MAX_JOB_DESCRIPTION_LENGTH,
     ATSCheckResponse,
     JobDescriptionValidator,
+    check_input_length,
     validate_resume_file,
 )
 from app.service.ats_checker_service import ATSCheckerService
+from app.utils.file_handler import FileHandler
+from app.utils.worker_pool import llm_pool
 
 # Initialize module logger
 logger = get_logger(__name__)
 ats_service = ATSCheckerService()
 # Create API router with prefix and tags for documentation
 router = APIRouter(
+    default_response_class=ORJSONResponse,
     prefix="/api/ats-checker",
     tags=["ATS Checker"],
     responses={
@@ -44,18 +48,22 @@ router = APIRouter(
     }
 )
 
+# Parameter markers built once at import time
 depends = Depends(validate_resume_file)
+job_description_form = Form(..., description="The full text of the job description.")
 @router.post(
     "/check", 
-    response_model=ATSCheckResponse,
+    response_model=None,
+    response_class=ORJSONResponse,
+    responses={status.HTTP_200_OK: {"model": ATSCheckResponse}},
     summary="Analyze resume against job description",
     description="Uploads a resume and job description for ATS compatibility analysis",
     status_code=status.HTTP_200_OK
 )
 async def check_resume_ats_compatibility(
     file: UploadFile = depends,
-    job_description: str = Form(..., description="The full text of the job description.")
-) -> ATSCheckResponse:
+    job_description: str = job_description_form
+) -> ORJSONResponse:
     """
     Analyzes a resume against a job description for ATS compatibility.
 
@@ -75,30 +83,41 @@ async def check_resume_ats_compatibility(
         job_description (str): The job description text, submitted as form data.
 
     Returns:
-        ATSCheckResponse: A Pydantic model containing the ATS compatibility report,
-                          including overall match score and detailed feedback.
-                          The actual response is a JSONResponse wrapping this model.
+        ORJSONResponse: The ATS compatibility report, including overall match score
+                        and detailed feedback. The payload is serialized directly
+                        without Pydantic response validation; `ATSCheckResponse`
+                        only documents it in the OpenAPI schema.
 
     Raises:
         HTTPException:
             - 400 Bad Request: If resume file or job description is invalid (e.g., empty,
               wrong format, or fails Pydantic validation).
-            - 500 Internal Server Error: If an unexpected error occurs during the
-              ATS analysis process or a service-level error is encountered.
+            - 413 Request Entity Too Large: If the job description is oversized.
+        Service-level and unexpected errors propagate to the global exception
+        handlers, which respond with 500 Internal Server Error.
     """
-    logger.info(f"ATS check requested for file: {file.filename}")
+    logger.info("ATS check requested for file: %s", file.filename)
+    check_input_length(job_description, "job_description", MAX_JOB_DESCRIPTION_LENGTH)
     
     try:
         # Validate job description using Pydantic model
         job_validator = JobDescriptionValidator(job_description=job_description)
         validated_job_description = job_validator.job_description
-        
-        # Read file content
-        logger.debug(f"Reading resume file: {file.filename}")
-        resume_content = await file.read()
-        
+    except ValueError as e:
+        # Handle validation errors
+        logger.error("Validation error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
+    
+    # Stream file content into a spooled buffer
+    logger.debug("Reading resume file: %s", file.filename)
+    resume_buffer, resume_size, resume_hash = await FileHandler.spool_upload(file)
+    
+    with resume_buffer:
         # Validate file content is not empty
-        if not resume_content:
+        if not resume_size:
             logger.error("Empty resume file content")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -107,34 +126,15 @@ async def check_resume_ats_compatibility(
         
         # Process resume through ATS checker service
         logger.debug("Calling ATS analysis service")
-        report = ats_service.analyze(
-            file_bytes=resume_content,
-            job_description=validated_job_description
+        report = await llm_pool.run(
+            ats_service.analyze,
+            resume_file=resume_buffer,
+            job_description=validated_job_description,
+            file_hash=resume_hash
         )
-        
-        logger.info("ATS analysis completed successfully")
+    
+    logger.info("ATS analysis completed successfully")
 
-        return JSONResponse(content={
-            "response": report
-        }, status_code=200)        
-    except CustomExceptionError as e:
-        # Handle service-level exceptions
-        logger.error(f"ATS service error: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"ATS analysis error: {str(e)}"
-        ) from e
-    except ValueError as e:
-        # Handle validation errors
-        logger.error(f"Validation error: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        ) from e
-    except Exception as e:
-        # Handle unexpected errors
-        logger.error(f"Unexpected error in ATS check endpoint: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred during ATS analysis"
-        ) from e
\ No newline at end of file
+    return ORJSONResponse(content={
+        "response": report
+    }, status_code=200)
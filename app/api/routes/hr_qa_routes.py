@@ -8,17 +8,24 @@ system based on company policies or documents.
 
 The primary endpoint is:
     POST /api/hr-qa/answer: Submits a question and gets an answer.
+    POST /api/hr-qa/answer/stream: Submits a question and streams the answer
+                                   as server-sent events.
 """
 
-import os
-from typing import Any
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Optional
 
-from fastapi import APIRouter, Body, HTTPException, status
+import orjson
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from app.core.logging import get_logger
-from app.service.hr_qa_service import HRQuestionAnswerService
+from app.service.hr_qa_service import HRQuestionAnswerService, get_hr_qa_service
+from app.utils.worker_pool import llm_pool
 
 router = APIRouter(
+    default_response_class=ORJSONResponse,
     prefix="/api/hr-qa",
     tags=["hr question answer"],
     responses={404: {"description": "Not found"}}
@@ -27,8 +34,24 @@ router = APIRouter(
 
 logger = get_logger(__name__)
 
+
+def get_hr_service() -> HRQuestionAnswerService:
+    """
+    Dependency provider for the shared HR QA service.
+
+    Returns the lazily created HR QA singleton so the RAG index, LLM client
+    and agents are built once per process instead of once per request.
+    """
+    return get_hr_qa_service()
+
+
+# Parameter markers built once at import time
+hr_service_dependency = Depends(get_hr_service)
+question_body = Body(..., description="The user's HR-related question as a plain string.", example="What is the company policy on remote work?")
+
+
 @router.post("/answer",
-            response_model=dict[str, Any],
+            response_model=None,
             summary="Get HR policy answer",
             description="Processes HR-related questions using RAG system",
             responses={
@@ -36,16 +59,22 @@ logger = get_logger(__name__)
                 400: {"description": "Invalid input format"},
                 500: {"description": "Internal processing error"}
             })
-async def hr_qa_check(request: str = Body(..., description="The user's HR-related question as a plain string.", example="What is the company policy on remote work?")):
+async def hr_qa_check(
+    request: str = question_body,
+    service: HRQuestionAnswerService = hr_service_dependency
+):
     """
     Handles HR policy-related questions and provides answers.
 
     This endpoint receives a user's question as a plain string in the request body.
-    It then utilizes the `HRQuestionAnswerService` to find and return an appropriate
-    answer based on available HR documentation or policies.
+    It then utilizes the shared `HRQuestionAnswerService` to find and return an
+    appropriate answer based on available HR documentation or policies. Questions
+    that are semantically close to a recently answered one are served from cache.
 
     Args:
         request (str): The user's question submitted in the request body.
+        service (HRQuestionAnswerService): The shared HR QA service, injected via
+                                           `get_hr_service`.
 
     Returns:
         dict[str, Any]: A dictionary containing:
@@ -57,17 +86,16 @@ async def hr_qa_check(request: str = Body(..., description="The user's HR-relate
         HTTPException:
             - 400 Bad Request: If the input question is invalid (e.g., empty, though
               primary validation might be on service level).
-            - 500 Internal Server Error: If an unexpected error occurs during question
-              processing or if the HR QA service fails.
+        Service-level and unexpected errors propagate to the global exception
+        handlers, which respond with 500 Internal Server Error.
     """
     try:
-        logger.info(f"Processing HR query: {request[:50]}...")
-        
-        # Initialize service (consider dependency injection for production)
-        service = HRQuestionAnswerService()
+        logger.info("Processing HR query: %s...", request[:50])
         
         # Get processed answer
-        answer = service.get_answer(request)
+        # Batched with concurrent questions and the service's retriever tool lookups
+        embedding = await service.query_batcher.embed(request)
+        answer = await llm_pool.run_async(service.get_answer, request, embedding)
         
         if not answer:
             logger.warning("Received empty answer for query")
@@ -77,7 +105,7 @@ async def hr_qa_check(request: str = Body(..., description="The user's HR-relate
             "message": "Job analysis completed successfully"
         }
         
-        logger.debug(f"Successfully processed query: {request[:30]}...")
+        logger.debug("Successfully processed query: %s...", request[:30])
         return {
             "status": "success",
             "response": answer,
@@ -85,14 +113,102 @@ async def hr_qa_check(request: str = Body(..., description="The user's HR-relate
         }
 
     except ValueError as ve:
-        logger.error(f"Validation error: {str(ve)}")
+        logger.error("Validation error: %s", ve)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(ve)
         ) from ve
-    except Exception as e:
-        logger.exception(f"Failed to process query: {str(e)}")
+
+
+def _sse(data: str, event: Optional[str] = None) -> str:
+    """Format one server-sent event; the data is JSON-encoded so newlines stay inside one event"""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {orjson.dumps(data).decode()}\n\n"
+
+
+async def _answer_events(
+    service: HRQuestionAnswerService, query: str, embedding: list[float]
+) -> AsyncIterator[str]:
+    """Yield the answer to `query` as server-sent events while the QA agent generates it"""
+    cached_answer = service.answer_cache.get(embedding)
+    if cached_answer is not None:
+        logger.info("Serving streamed HR answer from semantic cache")
+        yield _sse(cached_answer)
+        yield _sse("", event="done")
+        return
+
+    loop = asyncio.get_running_loop()
+    chunks: asyncio.Queue[Optional[str]] = asyncio.Queue()
+
+    def on_chunk(chunk: str) -> None:
+        loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+
+    run = asyncio.ensure_future(
+        llm_pool.run(service.stream_answer, query, on_chunk, embedding)
+    )
+    # Queued after every chunk the worker thread scheduled before returning
+    run.add_done_callback(lambda _: chunks.put_nowait(None))
+
+    streamed = False
+    while (chunk := await chunks.get()) is not None:
+        streamed = True
+        yield _sse(chunk)
+
+    try:
+        answer = run.result()
+    except Exception:
+        logger.error("Streaming HR answer failed", exc_info=True)
+        yield _sse("HR QA service error", event="error")
+        return
+
+    if not streamed and answer:
+        # The agent's output had no final answer marker; send it whole
+        yield _sse(answer)
+    yield _sse("", event="done")
+
+
+@router.post("/answer/stream",
+            response_class=StreamingResponse,
+            summary="Stream HR policy answer",
+            description="Processes HR-related questions using RAG system and streams the answer as server-sent events",
+            responses={
+                200: {"description": "Answer chunks as server-sent events"},
+                400: {"description": "Invalid input format"}
+            })
+async def hr_qa_stream(
+    request: str = question_body,
+    service: HRQuestionAnswerService = hr_service_dependency
+):
+    """
+    Streams the answer to an HR policy-related question.
+
+    Same input as `/answer`, but the answer is sent as it is generated instead of
+    after the whole crew run, so clients see the first words after the first
+    tokens of the QA agent's final answer. Every event's data is a JSON string
+    holding the next piece of the answer; the stream ends with a `done` event,
+    or an `error` event if answering fails.
+
+    Args:
+        request (str): The user's question submitted in the request body.
+        service (HRQuestionAnswerService): The shared HR QA service, injected via
+                                           `get_hr_service`.
+
+    Returns:
+        StreamingResponse: A `text/event-stream` response with the answer chunks.
+
+    Raises:
+        HTTPException:
+            - 400 Bad Request: If the question is empty.
+    """
+    if not request.strip():
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error while processing request"
-        ) from e
\ No newline at end of file
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Question must not be empty"
+        )
+
+    logger.info("Streaming HR query: %s...", request[:50])
+    embedding = await service.query_batcher.embed(request)
+    return StreamingResponse(
+        _answer_events(service, request, embedding),
+        media_type="text/event-stream"
+    )
@@ -9,14 +9,21 @@ The primary endpoint is:
     POST /api/job-analysis/analyze: Submits a job posting URL for analysis.
 """
 
-from typing import Any
+import asyncio
 
-from fastapi import APIRouter, Body, HTTPException
+from cachetools import TTLCache
+from fastapi import APIRouter, Body, Depends
+from fastapi.responses import ORJSONResponse
 
+from app.core.config import settings
 from app.core.logging import get_logger
-from app.service.jp_analyser import JobPostingAnalyzer
+from app.schemas.validator import MAX_URL_LENGTH, check_input_length
+from app.service.jp_analyser import JobPostingAnalyzer, get_job_posting_analyzer
+from app.utils.url import normalize_url
+from app.utils.worker_pool import scrape_pool
 
 router = APIRouter(
+    default_response_class=ORJSONResponse,
     prefix="/api/job-analysis",
     tags=["job_posting_analysis"],
     responses={404: {"description": "Not found"}}
@@ -24,8 +31,16 @@ router = APIRouter(
 
 logger = get_logger(__name__)
 
-# Initialize the analyzer once when the module loads
-analyzer = JobPostingAnalyzer()
+# Insights keyed by normalized job posting URL
+insights_cache: TTLCache = TTLCache(
+    maxsize=settings.JOB_INSIGHTS_CACHE_MAX_SIZE,
+    ttl=settings.JOB_INSIGHTS_CACHE_TTL_SECONDS
+)
+insights_cache_lock = asyncio.Lock()
+
+# Parameter markers built once at import time
+analyzer_dependency = Depends(get_job_posting_analyzer)
+url_body = Body(..., description="The URL of the job posting to be analyzed.", example="https://www.linkedin.com/jobs/view/1234567890")
 
 @router.post(
     "/analyze",
@@ -35,9 +50,12 @@ analyzer = JobPostingAnalyzer()
     - Company research
     - Compiled insights report""",
     response_description="Job insights analysis report",
-    response_model=dict[str, Any]
+    response_model=None
 )
-async def analyze_job_posting(url: str = Body(..., description="The URL of the job posting to be analyzed.", example="https://www.linkedin.com/jobs/view/1234567890")):
+async def analyze_job_posting(
+    url: str = url_body,
+    analyzer: JobPostingAnalyzer = analyzer_dependency
+):
     """
     Analyzes a given job posting URL to extract and report insights.
 
@@ -47,8 +65,13 @@ async def analyze_job_posting(url: str = Body(..., description="The URL of the j
     - Perform company research.
     - Compile a comprehensive insights report.
 
+    Reports are cached per normalized URL, so repeated requests for the same
+    posting are answered without re-running the analysis.
+
     Args:
         url (str): The URL of the job posting, provided in the request body.
+        analyzer (JobPostingAnalyzer): The shared analyzer, injected via
+                                       `get_job_posting_analyzer`.
 
     Returns:
         dict[str, Any]: A dictionary structured as:
@@ -58,32 +81,30 @@ async def analyze_job_posting(url: str = Body(..., description="The URL of the j
 
     Raises:
         HTTPException:
-            - 500 Internal Server Error: If any error occurs during the analysis process.
-              The error detail will contain:
-                - `status` (str): "error"
-                - `message` (str): "Failed to analyze job posting"
-                - `error` (str): The specific error message.
+            - 400 Bad Request: If the URL is empty.
+            - 413 Request Entity Too Large: If the URL is oversized.
+        Analysis failures propagate to the global exception handlers, which
+        respond with 500 Internal Server Error.
     """
-    try:
-        logger.info(f"Starting analysis for job posting URL: {url}")
-        
+    check_input_length(url, "url", MAX_URL_LENGTH)
+
+    logger.info("Starting analysis for job posting URL: %s", url)
+    
+    cache_key = normalize_url(url)
+    async with insights_cache_lock:
+        insights = insights_cache.get(cache_key)
+
+    if insights is not None:
+        logger.info("Serving job insights from cache")
+    else:
         # Generate insights using the analyzer service
-        insights = analyzer.generate_insights(url)
-        
-        logger.info("Successfully generated job insights")
-        return {
-            "status": "success",
-            "response": insights,
-            "message": "Job analysis completed successfully"
-        }
-        
-    except Exception as e:
-        logger.error(f"Job analysis failed for URL {url}: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "status": "error",
-                "message": "Failed to analyze job posting",
-                "error": str(e)
-            }
-        ) from e
\ No newline at end of file
+        insights = await scrape_pool.run_async(analyzer.generate_insights_async, url)
+        async with insights_cache_lock:
+            insights_cache[cache_key] = insights
+    
+    logger.info("Successfully generated job insights")
+    return {
+        "status": "success",
+        "response": insights,
+        "message": "Job analysis completed successfully"
+    }
@@ -8,31 +8,128 @@ a tailored resume based on these inputs.
 
 The primary endpoint is:
     POST /api/resume-builder/check: Submits resume and details for tailoring.
+
+To tailor one resume for several job postings at once:
+    POST /api/resume-builder/batch: Returns one result per job posting.
+
+For clients that should not hold a connection open during the run:
+    POST /api/resume-builder/jobs: Queues a tailoring request, returns a task id.
+    GET /api/resume-builder/jobs/{task_id}: Returns the job's status and result.
 """
 
-import json
-import os
-from typing import Annotated
+import asyncio
+from collections.abc import Iterator
+from typing import Annotated, Any
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
+from app.core.config import settings
 from app.core.logging import get_logger
-from app.service.resume_builder_service import resume_builder_object
+from app.schemas.validator import (
+    ALLOWED_RESUME_CONTENT_TYPES,
+    MAX_RESUME_FILE_SIZE,
+    MAX_URL_LENGTH,
+    MAX_WRITE_UP_LENGTH,
+    check_input_length,
+)
+from app.service.resume_builder_service import ResumeBuilderService, get_resume_builder
+from app.utils.job_store import FileJobStore
+from app.utils.pdf import FileTooLargeError, PDFProcessor
+from app.utils.worker_pool import resume_pool
 
 router = APIRouter(
+    default_response_class=ORJSONResponse,
     prefix="/api/resume-builder",
     tags=["resume_tailor"],
     responses={404: {"description": "Not found"}}
 )
 logger = get_logger(__name__)
 
+# State and results of queued tailoring jobs, kept for RESUME_JOB_TTL_SECONDS.
+# They live on disk so a job can be polled through any uvicorn worker.
+resume_jobs = FileJobStore(
+    directory=settings.RESUME_JOB_DIR,
+    maxsize=settings.RESUME_JOB_MAX_SIZE,
+    ttl=settings.RESUME_JOB_TTL_SECONDS
+)
+running_resume_jobs: set[asyncio.Task] = set()
+
+
+def iter_json_object(fields: dict[str, Any]) -> Iterator[bytes]:
+    """
+    Serializes a JSON object field by field with orjson.
+
+    Yields the object as a sequence of byte chunks, one per field, so the
+    response can start streaming before the large resume payload is encoded
+    and no single buffer holds the whole document.
+
+    Args:
+        fields (dict[str, Any]): The top-level fields of the JSON object.
+
+    Yields:
+        bytes: Consecutive chunks of the encoded JSON object.
+    """
+    yield b"{"
+    for index, (key, value) in enumerate(fields.items()):
+        separator = b"," if index else b""
+        yield separator + orjson.dumps(key) + b":" + orjson.dumps(value)
+    yield b"}"
+
+async def save_resume_upload(
+    file: UploadFile,
+    job_posting_url: str,
+    github_url: str,
+    write_up: str,
+    upload_directory: str
+) -> str:
+    """
+    Validates a tailoring request and streams its resume to disk.
+
+    Args:
+        file (UploadFile): The resume PDF file.
+        job_posting_url (str): URL of the job posting.
+        github_url (str): URL of the GitHub profile.
+        write_up (str): User's custom write-up.
+        upload_directory (str): Directory the resume is saved to.
+
+    Returns:
+        str: Path of the saved resume.
+
+    Raises:
+        HTTPException:
+            - 400 Bad Request: If the file is not a PDF or the job posting URL is empty.
+            - 413 Request Entity Too Large: If the resume, a URL or the write-up is oversized.
+    """
+    if file.content_type not in ALLOWED_RESUME_CONTENT_TYPES:
+        logger.warning("Non-PDF file upload attempt: %s (%s)", file.filename, file.content_type)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only PDF files are supported"
+        )
+    check_input_length(job_posting_url, "job_posting_url", MAX_URL_LENGTH)
+    check_input_length(github_url, "github_url", MAX_URL_LENGTH, allow_empty=True)
+    check_input_length(write_up, "write_up", MAX_WRITE_UP_LENGTH, allow_empty=True)
+    try:
+        return await PDFProcessor(file).save_upload(
+            upload_directory, max_size=MAX_RESUME_FILE_SIZE
+        )
+    except FileTooLargeError as e:
+        logger.warning("Resume upload too large: %s", file.filename)
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Resume file exceeds maximum size of 10MB"
+        ) from e
+
+
 @router.post("/check")
 async def request(  # Consider renaming for clarity, e.g., tailor_resume_request
     file: Annotated[UploadFile, File(description="The user's current resume in PDF format.")],
     job_posting_url: Annotated[str, Form(description="URL of the target job posting.")],
     github_url: Annotated[str, Form(description="URL of the user's GitHub profile.")],
-    write_up: Annotated[str, Form(description="A brief write-up or additional points from the user.")]
+    write_up: Annotated[str, Form(description="A brief write-up or additional points from the user.")],
+    resume_builder: Annotated[ResumeBuilderService, Depends(get_resume_builder)]
 ):
     """
     Tailors a resume based on an uploaded PDF, job posting, GitHub profile, and user write-up.
@@ -43,17 +140,23 @@ async def request(  # Consider renaming for clarity, e.g., tailor_resume_request
     - `github_url`: URL of the user's GitHub profile for additional context.
     - `write_up`: User-provided text with key points or a summary.
 
-    The service processes these inputs to generate a tailored resume.
+    The resume is streamed to disk in 1 MB chunks with the 10MB size cap enforced
+    while copying, and the service processes the saved file and the other inputs
+    to generate a tailored resume.
 
     Args:
         file (UploadFile): The resume PDF file.
         job_posting_url (str): URL of the job posting.
         github_url (str): URL of the GitHub profile.
         write_up (str): User's custom write-up.
+        resume_builder (ResumeBuilderService): The shared resume builder, injected via
+                                               `get_resume_builder`.
 
     Returns:
-        JSONResponse: Contains the status of the operation, the tailored resume content (result),
-                      and the tailored resume in JSON format (`resume_json`).
+        StreamingResponse: A JSON document, streamed field by field, containing the status
+                      of the operation, the tailored resume content (result), and the
+                      tailored resume in JSON format (`resume_json`). Error responses
+                      are returned as a regular ORJSONResponse.
                       Example success structure:
                       {
                           "status": "success",
@@ -68,49 +171,223 @@ async def request(  # Consider renaming for clarity, e.g., tailor_resume_request
 
     Raises:
         HTTPException:
-            - 400 Bad Request: If the uploaded file is not a PDF.
-            - 404 Not Found: If the resume builder service reports that a necessary
-                             internal JSON file was not found (this might indicate an
-                             internal server issue rather than a client one).
-            - Potentially other exceptions from the underlying service if not caught.
+            - 400 Bad Request: If the uploaded file's content type is not `application/pdf`
+                               or the job posting URL is empty.
+            - 413 Request Entity Too Large: If the resume, a URL or the write-up is oversized.
+        Unexpected errors propagate to the global exception handlers, which
+        respond with 500 Internal Server Error.
     """
-    if not file.filename.lower().endswith(".pdf"):
-            logger.warning(f"Non-PDF file upload attempt: {file.filename}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Only PDF files are supported"
-            )
+    resume_path = await save_resume_upload(
+        file, job_posting_url, github_url, write_up, resume_builder.upload_directory
+    )
     try:
-        logger.info(f"Processing resume tailoring request for file: {file.filename}, job: {job_posting_url}")
-        response = resume_builder_object.generate_resume(file, job_posting_url, github_url,write_up)
+        logger.info("Processing resume tailoring request for file: %s, job: %s", file.filename, job_posting_url)
+        response = await resume_pool.run(
+            resume_builder.generate_resume, resume_path, job_posting_url, github_url, write_up
+        )
         # print(f"DEBUG RESPONSE: {response['status']}") # Consider removing debug print
 
         if response and "status" in response and "result" in response and "tailo_resume_json" in response:
-            logger.info(f"Resume tailoring successful for: {file.filename}")
-            return JSONResponse(content={
-                "status": response["status"],
-                "result": response["result"],
-                "resume_json":response["tailo_resume_json"]
-            })
+            logger.info("Resume tailoring successful for: %s", file.filename)
+            return StreamingResponse(
+                iter_json_object({
+                    "status": response["status"],
+                    "result": response["result"],
+                    "resume_json": response["tailo_resume_json"]
+                }),
+                media_type="application/json"
+            )
         else:
             # This path might indicate an issue with the service's response structure
-            logger.error(f"Resume builder service returned unexpected or incomplete response for {file.filename}. Response: {response}")
-            return JSONResponse(content={
+            logger.error("Resume builder service returned unexpected or incomplete response for %s. Response: %s", file.filename, response)
+            return ORJSONResponse(content={
                 "status": "Error",
                 "message": "Resume generation service returned an invalid response."
             }, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR) # Changed to 500 as it's a server/service side issue
             
     except FileNotFoundError as e : # This specific exception might be too narrow or internal
-        logger.error(f"Internal FileNotFoundError during resume tailoring for {file.filename}: {e}", exc_info=True)
-        return JSONResponse(content={
+        logger.error("Internal FileNotFoundError during resume tailoring for %s: %s", file.filename, e, exc_info=True)
+        return ORJSONResponse(content={
             "status": "error",
             "message": "An internal file was not found during resume generation."
         }, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR) # Changed to 500
-    except HTTPException: # Re-raise HTTPExceptions from validation etc.
-        raise
+
+
+@router.post("/batch")
+async def tailor_resume_batch(
+    file: Annotated[UploadFile, File(description="The user's current resume in PDF format.")],
+    job_posting_urls: Annotated[list[str], Form(description="URLs of the target job postings.")],
+    github_url: Annotated[str, Form(description="URL of the user's GitHub profile.")],
+    write_up: Annotated[str, Form(description="A brief write-up or additional points from the user.")],
+    resume_builder: Annotated[ResumeBuilderService, Depends(get_resume_builder)]
+):
+    """
+    Tailors one resume for several job postings in a single request.
+
+    Accepts the same form fields as `/check`, except that `job_posting_urls` is
+    repeated once per posting. The resume is embedded once for the whole batch
+    and the postings are processed concurrently.
+
+    Args:
+        file (UploadFile): The resume PDF file.
+        job_posting_urls (list[str]): URLs of the job postings.
+        github_url (str): URL of the GitHub profile.
+        write_up (str): User's custom write-up.
+        resume_builder (ResumeBuilderService): The shared resume builder, injected via
+                                               `get_resume_builder`.
+
+    Returns:
+        dict[str, Any]: `{"results": [...]}` with one entry per job posting, in request
+                        order, each holding `job_posting_url`, `status` and either
+                        `result` and `resume_json` or `message`.
+
+    Raises:
+        HTTPException:
+            - 400 Bad Request: If the file is not a PDF, a job posting URL is empty, or
+                               more than RESUME_BATCH_MAX_POSTINGS postings are sent.
+            - 413 Request Entity Too Large: If the resume, a URL or the write-up is oversized.
+    """
+    if len(job_posting_urls) > settings.RESUME_BATCH_MAX_POSTINGS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.RESUME_BATCH_MAX_POSTINGS} job postings are allowed per batch"
+        )
+    for job_posting_url in job_posting_urls[1:]:
+        check_input_length(job_posting_url, "job_posting_url", MAX_URL_LENGTH)
+    resume_path = await save_resume_upload(
+        file, job_posting_urls[0], github_url, write_up, resume_builder.upload_directory
+    )
+
+    logger.info("Processing batch of %s resume tailoring requests for file: %s", len(job_posting_urls), file.filename)
+    responses = await resume_pool.run(
+        resume_builder.generate_resumes,
+        resume_path,
+        job_posting_urls,
+        github_url,
+        write_up,
+        max_workers=settings.RESUME_BATCH_MAX_CONCURRENCY
+    )
+
+    results = []
+    for job_posting_url, response in zip(job_posting_urls, responses):
+        if response.get("status") == "success":
+            results.append({
+                "job_posting_url": job_posting_url,
+                "status": "success",
+                "result": response["result"],
+                "resume_json": response["tailo_resume_json"]
+            })
+        else:
+            results.append({
+                "job_posting_url": job_posting_url,
+                "status": "error",
+                "message": response.get("message", "Resume generation failed.")
+            })
+    return {"results": results}
+
+
+async def _run_resume_job(
+    job_id: str,
+    resume_builder: ResumeBuilderService,
+    resume_path: str,
+    job_posting_url: str,
+    github_url: str,
+    write_up: str
+) -> None:
+    """Run one queued tailoring request on the resume pool and record its outcome"""
+    await resume_jobs.set(job_id, {"status": "running"})
+    try:
+        response = await resume_pool.run(
+            resume_builder.generate_resume, resume_path, job_posting_url, github_url, write_up
+        )
     except Exception as e:
-        logger.error(f"Unexpected error during resume tailoring for {file.filename}: {e}", exc_info=True)
+        logger.error("Resume job %s failed: %s", job_id, e, exc_info=True)
+        await resume_jobs.set(job_id, {"status": "error", "message": "Resume generation failed."})
+        return
+
+    if response.get("status") == "success":
+        await resume_jobs.set(job_id, {
+            "status": "success",
+            "result": response["result"],
+            "resume_json": response["tailo_resume_json"]
+        })
+    else:
+        await resume_jobs.set(job_id, {
+            "status": "error",
+            "message": response.get("message", "Resume generation failed.")
+        })
+
+
+@router.post("/jobs", status_code=status.HTTP_202_ACCEPTED)
+async def submit_resume_job(
+    file: Annotated[UploadFile, File(description="The user's current resume in PDF format.")],
+    job_posting_url: Annotated[str, Form(description="URL of the target job posting.")],
+    github_url: Annotated[str, Form(description="URL of the user's GitHub profile.")],
+    write_up: Annotated[str, Form(description="A brief write-up or additional points from the user.")],
+    resume_builder: Annotated[ResumeBuilderService, Depends(get_resume_builder)]
+):
+    """
+    Queues a resume tailoring request and returns immediately.
+
+    Takes the same inputs as `/check`, but answers with 202 Accepted and a
+    `task_id` as soon as the resume is saved, instead of holding the connection
+    open for the whole multi-agent run. Poll `GET /jobs/{task_id}` for the outcome.
+
+    Args:
+        file (UploadFile): The resume PDF file.
+        job_posting_url (str): URL of the job posting.
+        github_url (str): URL of the GitHub profile.
+        write_up (str): User's custom write-up.
+        resume_builder (ResumeBuilderService): The shared resume builder, injected via
+                                               `get_resume_builder`.
+
+    Returns:
+        dict[str, str]: The `task_id` of the queued job and its `status` ("pending").
+
+    Raises:
+        HTTPException: The same 400 and 413 errors as `/check`.
+    """
+    resume_path = await save_resume_upload(
+        file, job_posting_url, github_url, write_up, resume_builder.upload_directory
+    )
+    await resume_jobs.prune()
+    job_id = resume_jobs.new_id()
+    await resume_jobs.set(job_id, {"status": "pending"})
+
+    task = asyncio.create_task(_run_resume_job(
+        job_id, resume_builder, resume_path, job_posting_url, github_url, write_up
+    ))
+    # The event loop only keeps weak references to tasks
+    running_resume_jobs.add(task)
+    task.add_done_callback(running_resume_jobs.discard)
+
+    logger.info("Queued resume job %s for file: %s", job_id, file.filename)
+    return {"task_id": job_id, "status": "pending"}
+
+
+@router.get("/jobs/{task_id}")
+async def get_resume_job(task_id: str):
+    """
+    Returns the state of a queued resume tailoring job.
+
+    Job state is shared through RESUME_JOB_DIR, so the job can be polled
+    through any worker, not only the one that accepted it.
+
+    Args:
+        task_id (str): The id returned by `POST /jobs`.
+
+    Returns:
+        dict[str, Any]: `status` ("pending", "running", "success" or "error"), plus
+                        `result` and `resume_json` on success or `message` on error.
+
+    Raises:
+        HTTPException:
+            - 404 Not Found: If the job is unknown or its result has expired.
+    """
+    job = await resume_jobs.get(task_id)
+    if job is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred during resume tailoring."
-        ) from e
\ No newline at end of file
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Unknown or expired task id"
+        )
+    return {"task_id": task_id, **job}
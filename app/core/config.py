@@ -1,8 +1,9 @@
 import json
-import os
+from functools import lru_cache
+from typing import Optional
 
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -24,22 +25,88 @@ class Settings(BaseSettings):
     #             return [origin.strip() for origin in v.split(",")]
     #     return v
     # LLM settings
-    GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY")
-    DEFAULT_LLM_PROVIDER: str = os.getenv("DEFAULT_LLM_PROVIDER", "groq")
+    GOOGLE_API_KEY: Optional[str] = None
+    DEFAULT_LLM_PROVIDER: str = "groq"
     #Search tool api
-    SERPER_API_KEY:str = os.getenv("SERPER_API_KEY")
+    SERPER_API_KEY: Optional[str] = None
     
 
     
     # RAG settings
     HR_QA_DATASET_PATH: str = "data/hr_qa/hr_qa_dataset.pdf"
+    EMBEDDING_DIM: int = 384
+    FAISS_INDEX_DIR: str = "data/faiss_hr"
+    FAISS_INT8_INDEX: bool = True
+    HR_QA_PREWARM: bool = True
+    LLM_PREWARM: bool = True
+    HR_QA_BATCH_MAX_SIZE: int = 8
+    # A lone cache miss waits this long for company before its crew run starts;
+    # the wait holds no thread, only adds latency to a multi-second run
+    HR_QA_BATCH_MAX_WAIT_MS: float = 250
+    # Corpora up to this many chunks keep float32 vectors and are searched brute
+    # force (~6 MB matrix at 384 dims); larger ones go through HNSW (SQ8)
+    MATRIX_RETRIEVER_MAX_CHUNKS: int = 4096
+    RETRIEVER_K: int = 3
+    RETRIEVER_FETCH_K: int = 10
+    RETRIEVER_MMR_LAMBDA: float = 0.5
+
+    # Semantic cache settings
+    # bge-small embeds related but different questions ("handle stress" vs
+    # "handle conflict") close together, so only near-verbatim rephrasings may hit
+    SEMANTIC_CACHE_THRESHOLD: float = 0.97
+    SEMANTIC_CACHE_TTL_SECONDS: int = 3600
+    SEMANTIC_CACHE_MAX_SIZE: int = 1000
+    RETRIEVER_CACHE_ENABLED: bool = True
+    RETRIEVER_CACHE_THRESHOLD: float = 0.95
+    RETRIEVER_CACHE_TTL_SECONDS: int = 3600
+
+    # Job posting analysis cache settings
+    JOB_INSIGHTS_CACHE_TTL_SECONDS: int = 3600
+    JOB_INSIGHTS_CACHE_MAX_SIZE: int = 1000
+
+    # Per-step crew output cache settings
+    CREW_CACHE_TTL_SECONDS: int = 3600
+    CREW_CACHE_MAX_SIZE: int = 1000
+    JOB_SCRAPE_CACHE_TTL_SECONDS: int = 6 * 3600
+    COMPANY_RESEARCH_CACHE_TTL_SECONDS: int = 24 * 3600
+
+    # Resume tailoring settings
+    # Quantized ONNX export of the resume embedding model (empty = FP32 PyTorch model)
+    RESUME_EMBEDDER_ONNX_FILE: str = "onnx/model_qint8_avx512_vnni.onnx"
+    # Queued tailoring jobs and how long their results stay available. The
+    # directory must be shared by all workers (and replicas) serving the API.
+    RESUME_JOB_DIR: str = "data/resume_jobs"
+    RESUME_JOB_MAX_SIZE: int = 1000
+    RESUME_JOB_TTL_SECONDS: int = 3600
+    # Job postings accepted per batch request, and crews run at once for one batch
+    RESUME_BATCH_MAX_POSTINGS: int = 10
+    RESUME_BATCH_MAX_CONCURRENCY: int = 4
     
+    # Concurrency
+    THREADPOOL_SIZE: int = 100
+    LLM_POOL_SIZE: int = 32
+    LLM_RATE_PER_SECOND: float = 50
+    SCRAPE_POOL_SIZE: int = 16
+    SCRAPE_RATE_PER_SECOND: float = 10
+    RESUME_POOL_SIZE: int = 64
+    RESUME_RATE_PER_SECOND: float = 10
+    # Worker processes for PDF text extraction (None = one per CPU core)
+    PDF_POOL_SIZE: Optional[int] = None
+
     # Logging
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = "INFO"
+    # Stream every agent thought and tool call to stdout (development only)
+    CREW_VERBOSE: bool = False
     
     
-    class Config:
-        env_file = ".env"
-        model_config = {"extra": "ignore"}
+    # Values are resolved once from the environment and .env by pydantic-settings
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing the environment only once"""
+    return Settings()
+
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
@@ -103,8 +103,8 @@ class CustomLogger:
         CustomLogger._initialized = True
         
         # Log startup message
-        self.root_logger.info(f"Logging initialized at level: {self.log_level}")
-        self.root_logger.info(f"Log files location: {self.log_path}")
+        self.root_logger.info("Logging initialized at level: %s", self.log_level)
+        self.root_logger.info("Log files location: %s", self.log_path)
     
     def _get_numeric_level(self, level_name: str) -> int:
         """Convert string log level to numeric value"""
@@ -1,12 +1,77 @@
 
 import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable
 
 from crewai import LLM
+from crewai.utilities.events import LLMStreamChunkEvent, crewai_event_bus
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+GEMINI_MODEL = "gemini/gemini-2.0-flash"
+
+# Chunk consumers keyed by the id of the streaming LLM handle they listen to
+_stream_sinks: dict[int, Callable[[str], None]] = {}
+_stream_sinks_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_gemini_llm() -> LLM:
+    """Build the Gemini handle once; every service shares it and its HTTP connections"""
+    return LLM(
+        model=GEMINI_MODEL,
+        api_key=settings.GOOGLE_API_KEY
+    )
+
+
+@crewai_event_bus.on(LLMStreamChunkEvent)
+def _forward_stream_chunk(source: Any, event: LLMStreamChunkEvent) -> None:
+    """Hand a streamed chunk to the consumer registered for the emitting LLM, if any"""
+    sink = _stream_sinks.get(id(source))
+    if sink is not None:
+        sink(event.chunk)
+
+
+@contextmanager
+def stream_llm_chunks(llm: LLM, on_chunk: Callable[[str], None]) -> Iterator[None]:
+    """
+    Forward the chunks streamed by one LLM handle to a callback.
+
+    CrewAI publishes stream chunks on a process-wide event bus; chunks are
+    routed by the emitting handle, so concurrent streams do not mix.
+
+    Args:
+        llm: A handle created with `stream=True`
+        on_chunk: Called with every text chunk the handle receives
+    """
+    with _stream_sinks_lock:
+        _stream_sinks[id(llm)] = on_chunk
+    try:
+        yield
+    finally:
+        with _stream_sinks_lock:
+            _stream_sinks.pop(id(llm), None)
+
+
+def warm_up_gemini() -> None:
+    """
+    Send a one-word prompt through the shared Gemini handle.
+
+    Pays TLS and connection setup at startup instead of on the first user
+    request. Failures are logged and ignored so an unreachable provider does
+    not prevent the app from starting.
+    """
+    try:
+        _get_gemini_llm().call("ping")
+        logger.info("Gemini client warmed up")
+    except Exception as e:
+        logger.warning("Gemini warm-up failed: %s", e)
+
 
 class GroqProvider:
     pass
@@ -14,11 +79,15 @@ class GroqProvider:
 class GoogleProvider:
     """Google AI provider implementation"""
     def gemini_llm(self):
-        llm = LLM(
-        model="gemini/gemini-2.0-flash",
-        api_key= settings.GOOGLE_API_KEY
+        return _get_gemini_llm()
+
+    def gemini_streaming_llm(self):
+        """A new streaming Gemini handle; each stream needs its own so chunks can be routed"""
+        return LLM(
+            model=GEMINI_MODEL,
+            api_key=settings.GOOGLE_API_KEY,
+            stream=True
         )
-        return llm
 
 
 class OpenAIProvider:
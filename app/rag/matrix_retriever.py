@@ -0,0 +1,110 @@
+"""
+Dense matrix retriever.
+
+For small corpora, ranking every chunk with a single matrix-vector product over a
+contiguous float32 embedding matrix is faster than going through FAISS and the
+LangChain vector store wrapper. The search is exact as long as the matrix holds
+the original normalized embeddings, so it is only built from indexes that store
+full-precision vectors: scalar-quantized (SQ8) codes decode to approximate,
+no longer unit-length vectors.
+"""
+
+from typing import Any, List
+
+import faiss
+import numpy as np
+from langchain.schema import Document
+from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import maximal_marginal_relevance
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.retrievers import BaseRetriever
+
+
+class MatrixRetriever(BaseRetriever):
+    """
+    Retriever ranking chunks by cosine similarity against an in-memory matrix.
+
+    Attributes:
+        embedder (Any): Embedding model exposing `embed_query`, producing
+                        L2-normalized vectors.
+        matrix (Any): C-contiguous float32 array of shape [N, dim] holding the
+                      normalized chunk embeddings.
+        documents (List[Document]): The chunks, in the same order as `matrix` rows.
+        k (int): Number of chunks to return.
+        search_type (str): "similarity" for plain top-k, or "mmr" to rerank the
+                           `fetch_k` most similar chunks by Maximal Marginal Relevance.
+        fetch_k (int): Number of candidates considered by MMR.
+        lambda_mult (float): MMR trade-off between relevance (1) and diversity (0).
+    """
+
+    embedder: Any
+    matrix: Any
+    documents: List[Document]
+    k: int = 5
+    search_type: str = "similarity"
+    fetch_k: int = 20
+    lambda_mult: float = 0.5
+
+    @classmethod
+    def from_vector_store(cls, vector_store: FAISS, k: int = 5, **kwargs: Any) -> "MatrixRetriever":
+        """
+        Build a retriever from the vectors and documents of a FAISS store.
+
+        The matrix is a float32 copy of the stored vectors (N x dim x 4 bytes on
+        top of the index itself), which is why only small corpora take this path.
+
+        Args:
+            vector_store (FAISS): The store to copy the embeddings and chunks from.
+            k (int, optional): Number of chunks to return. Defaults to 5.
+            **kwargs: Further retriever fields (`search_type`, `fetch_k`, `lambda_mult`).
+
+        Returns:
+            MatrixRetriever: A retriever over the same chunks.
+
+        Raises:
+            ValueError: If the index stores scalar-quantized vectors.
+        """
+        index = vector_store.index
+        if isinstance(index, (faiss.IndexHNSWSQ, faiss.IndexScalarQuantizer)):
+            raise ValueError("MatrixRetriever needs an index with full-precision vectors")
+        matrix = np.ascontiguousarray(index.reconstruct_n(0, index.ntotal), dtype=np.float32)
+        documents = [
+            vector_store.docstore.search(vector_store.index_to_docstore_id[i])
+            for i in range(index.ntotal)
+        ]
+        return cls(
+            embedder=vector_store.embedding_function,
+            matrix=matrix,
+            documents=documents,
+            k=k,
+            **kwargs
+        )
+
+    def search_by_vector(self, embedding: Any) -> List[Document]:
+        """
+        Return the `k` best chunks for an already computed query embedding.
+
+        Args:
+            embedding (Any): The normalized query embedding.
+
+        Returns:
+            List[Document]: The best matching chunks, in similarity or MMR selection order.
+        """
+        query = np.asarray(embedding, dtype=np.float32)
+        scores = self.matrix @ query
+        k = min(self.fetch_k if self.search_type == "mmr" else self.k, len(self.documents))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        if self.search_type == "mmr":
+            selected = maximal_marginal_relevance(
+                query, self.matrix[top], lambda_mult=self.lambda_mult, k=self.k
+            )
+            top = top[selected]
+        return [self.documents[i] for i in top]
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return self.search_by_vector(self.embedder.embed_query(query))
@@ -1,7 +1,16 @@
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional
+import hashlib
+import os
 import re
+import threading
 
+import faiss
+import numpy as np
+from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.document_loaders import PyMuPDFLoader  
 
 
@@ -9,11 +18,46 @@ from langchain_community.vectorstores import FAISS
 
 
 from langchain_huggingface import HuggingFaceEmbeddings
+import torch
 from app.core.logging import get_logger  
 from app.api.error_handlers import CustomExceptionError
 
 logger = get_logger(__name__)
 
+# Page-number lines and whitespace runs, matched in one pass. Header lines are
+# tried first so a run of blank lines around a page number collapses together.
+# (Section breaks need no pass of their own: they end up as a single space.)
+_HEADER_OR_WHITESPACE = re.compile(r'(?:^\s*\d+\s*$|\s)+', re.MULTILINE)
+
+# Splitter separators; the sentence-boundary entry is a lookbehind pattern
+_SEPARATORS = ["\n\n", "\n", "(?<=\. )", " ", ""]
+
+# Vector stores loaded from disk, shared by every PDFRAGSystem in the process
+_loaded_stores: Dict[str, FAISS] = {}
+_loaded_stores_lock = threading.Lock()
+
+
+def _clean_text(text: str) -> str:
+    """Clean PDF text preserving structure"""
+    # Remove headers/footers and normalize whitespace in a single scan
+    return _HEADER_OR_WHITESPACE.sub(' ', text).strip()
+
+
+@lru_cache(maxsize=None)
+def _get_text_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    """Build one splitter per configuration and process (worker processes rebuild their own)"""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=_SEPARATORS
+    )
+
+
+def _clean_and_split(page_content: str, chunk_size: int, chunk_overlap: int) -> List[str]:
+    """Clean one page and split it into chunks; module-level so worker processes can pickle it"""
+    return _get_text_splitter(chunk_size, chunk_overlap).split_text(_clean_text(page_content))
+
+
 class PDFRAGSystem:
     
     def __init__(
@@ -22,68 +66,177 @@ class PDFRAGSystem:
         chunk_overlap: int = 240,
         model_name: str = "BAAI/bge-small-en-v1.5",  
         device: str = "cpu",    
+        embed_batch_size: int = 64,
+        quantize: bool = True,
+        hnsw_m: int = 32,
+        hnsw_ef_construction: int = 200,
+        hnsw_ef_search: int = 64,
+        index_dir: Optional[str] = None,
+        parallel_page_threshold: int = 64,
+        int8_index: bool = False,
+        int8_min_chunks: int = 0,
     ):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.hnsw_ef_search = hnsw_ef_search
+        self.model_name = model_name
+        self.index_dir = index_dir
+        self.parallel_page_threshold = parallel_page_threshold
+        self.int8_index = int8_index
+        self.int8_min_chunks = int8_min_chunks
 
         self.embedder = HuggingFaceEmbeddings(
             model_name=model_name,
             model_kwargs={'device': device},
-            encode_kwargs={'normalize_embeddings': True}
-        )
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.chunk_size,
-            chunk_overlap=self.chunk_overlap,
-            separators=["\n\n", "\n", "(?<=\. )", " ", ""] 
+            encode_kwargs={'batch_size': embed_batch_size, 'normalize_embeddings': True}
         )
+        if quantize and device == "cpu":
+            self._quantize_embedder()
+        self.text_splitter = _get_text_splitter(self.chunk_size, self.chunk_overlap)
+
+    def _quantize_embedder(self) -> None:
+        """Swap the encoder's Linear layers for dynamic int8 ones (oneDNN int8 GEMM on CPU)"""
+        try:
+            torch.quantization.quantize_dynamic(
+                self.embedder._client, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+            logger.info("Quantized embedding model to int8")
+        except Exception as e:
+            logger.warning("Embedding quantization failed, using FP32 model: %s", e)
 
     def _clean_text(self, text: str) -> str:
         """Clean PDF text preserving structure"""
-        # Remove headers/footers
-        text = re.sub(r'^\s*\d+\s*$', '', text, flags=re.MULTILINE)
-        # Preserve section breaks
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        # Normalize whitespace
-        return re.sub(r'\s+', ' ', text).strip()
+        return _clean_text(text)
 
     def _process_page(self, page_content: str, page_number: int) -> List[str]:
-        cleaned_content = self._clean_text(page_content)
-        return self.text_splitter.split_text(cleaned_content)
+        return _clean_and_split(page_content, self.chunk_size, self.chunk_overlap)
+
+    def _split_pages(self, page_contents: List[str]) -> List[List[str]]:
+        """Clean and split every page, fanning out to a process pool for large PDFs"""
+        if len(page_contents) < self.parallel_page_threshold:
+            return [
+                self._process_page(content, idx + 1)
+                for idx, content in enumerate(page_contents)
+            ]
+
+        n = len(page_contents)
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(
+                _clean_and_split,
+                page_contents,
+                [self.chunk_size] * n,
+                [self.chunk_overlap] * n,
+                chunksize=4,
+            ))
+
+    def _build_hnsw_store(self, texts: List[str], vectors: List[List[float]], metadatas: List[dict]) -> FAISS:
+        """
+        Index the chunk vectors in an HNSW graph instead of an exhaustive flat index.
+
+        With `int8_index`, vectors are stored as 8-bit scalar-quantized codes (4x less
+        memory and compare bandwidth); the quantizer only needs per-dimension ranges,
+        so it trains on any number of chunks, unlike IVF-PQ. Corpora of at most
+        `int8_min_chunks` chunks keep full-precision vectors, which is what an
+        exact brute-force search over `index.reconstruct_n` needs.
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if self.int8_index and len(texts) > self.int8_min_chunks:
+            index = faiss.IndexHNSWSQ(matrix.shape[1], faiss.ScalarQuantizer.QT_8bit, self.hnsw_m)
+            index.train(matrix)
+        else:
+            index = faiss.IndexHNSWFlat(matrix.shape[1], self.hnsw_m)
+        index.hnsw.efConstruction = self.hnsw_ef_construction
+        index.add(matrix)
+        index.hnsw.efSearch = self.hnsw_ef_search
+
+        ids = [str(i) for i in range(len(texts))]
+        docstore = InMemoryDocstore({
+            doc_id: Document(page_content=text, metadata=metadata)
+            for doc_id, text, metadata in zip(ids, texts, metadatas)
+        })
+        return FAISS(
+            embedding_function=self.embedder,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id=dict(enumerate(ids)),
+        )
+
+    def _index_path(self, pdf_path: str) -> str:
+        """
+        Directory holding the index built from this exact PDF content and configuration.
+
+        Keyed by the SHA-256 of the PDF bytes plus the embedding model and chunking
+        settings, so an edited PDF or a changed model never reuses a stale index.
+        """
+        digest = hashlib.sha256()
+        with open(pdf_path, "rb") as pdf_file:
+            for block in iter(lambda: pdf_file.read(1024 * 1024), b""):
+                digest.update(block)
+        model_id = re.sub(r"[^A-Za-z0-9.-]+", "-", self.model_name)
+        return os.path.join(
+            self.index_dir,
+            f"{digest.hexdigest()[:32]}_{model_id}_{self.chunk_size}_{self.chunk_overlap}"
+            f"{f'_sq8-{self.int8_min_chunks}' if self.int8_index else ''}",
+        )
+
+    def _load_persisted_store(self, index_path: str) -> Optional[FAISS]:
+        """Return the index saved at `index_path`, or None if it was never built"""
+        if not os.path.exists(os.path.join(index_path, "index.faiss")):
+            return None
+
+        with _loaded_stores_lock:
+            store = _loaded_stores.get(index_path)
+            if store is None:
+                store = FAISS.load_local(
+                    index_path, self.embedder, allow_dangerous_deserialization=True
+                )
+                store.index.hnsw.efSearch = self.hnsw_ef_search
+                _loaded_stores[index_path] = store
+        logger.info("Loaded persisted FAISS index from %s", index_path)
+        return store
 
     def load_and_process(self, pdf_path: str) -> FAISS:
         try:
-            logger.info(f"Initializing RAG processing for {pdf_path}")
+            index_path = self._index_path(pdf_path) if self.index_dir else None
+            if index_path:
+                store = self._load_persisted_store(index_path)
+                if store is not None:
+                    return store
+
+            logger.info("Initializing RAG processing for %s", pdf_path)
             
             # Load PDF with metadata
             loader = PyMuPDFLoader(pdf_path)
             pages = loader.load()
             
-            logger.info(f"Loaded {len(pages)} pages from PDF")
+            logger.info("Loaded %s pages from PDF", len(pages))
             
-            # Page-based processing
-            processed_chunks = []
-            for idx, page in enumerate(pages):
-                chunks = self._process_page(page.page_content, idx + 1)
-                for chunk in chunks:
-                    processed_chunks.append({
-                        "text": chunk,
-                        "metadata": {
-                            "page": idx + 1,
-                            "source": pdf_path,
-                            "char_length": len(chunk)
-                        }
-                    })
+            # Page-based processing: texts and their metadata as parallel lists
+            texts: List[str] = []
+            metadatas: List[dict] = []
+            page_chunks = self._split_pages([page.page_content for page in pages])
+            for idx, chunks in enumerate(page_chunks):
+                texts.extend(chunks)
+                metadatas.extend(
+                    {"page": idx + 1, "source": pdf_path, "char_length": len(chunk)}
+                    for chunk in chunks
+                )
             
-            logger.info(f"Generated {len(processed_chunks)} semantic chunks")
+            logger.info("Generated %s semantic chunks", len(texts))
             
-            # Create Chroma vector store
-            return FAISS.from_texts(
-                texts=[c["text"] for c in processed_chunks],
-                embedding=self.embedder,
-                metadatas=[c["metadata"] for c in processed_chunks],
-            )
+            # Encode every chunk up front in batched forward passes
+            vectors = self.embedder.embed_documents(texts)
+            
+            # Create FAISS vector store backed by an HNSW index
+            store = self._build_hnsw_store(texts, vectors, metadatas)
+            if index_path:
+                store.save_local(index_path)
+                logger.info("Saved FAISS index to %s", index_path)
+            return store
             
         except Exception as e:
-            logger.error(f"RAG processing failed: {str(e)}")
+            logger.error("RAG processing failed: %s", e)
             raise CustomExceptionError("RAG system error") from e
 
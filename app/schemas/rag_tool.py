@@ -1,14 +1,39 @@
+import asyncio
+import hashlib
+import threading
 from typing import Any
 
+from cachetools import TTLCache
 from crewai.tools import BaseTool
 from langchain.schema import Document
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class RetrieverTool(BaseTool):
-    """CrewAI tool wrapping a LangChain VectorStore retriever."""
+    """
+    CrewAI tool wrapping a LangChain VectorStore retriever.
+
+    When a `semantic_cache` and `embedder` are supplied, results are cached:
+    an exact-match lookup on the SHA-256 of the query runs first, then a
+    cosine-similarity lookup on the query embedding, and only on a miss is
+    the retriever invoked.
+
+    When a `batcher` is supplied, query embeddings go through it, so queries
+    issued by concurrent crews share one forward pass of the embedding model.
+    Retrievers exposing `search_by_vector` reuse that embedding for the search.
+    """
 
     retriever: Any
+    embedder: Any = None
+    batcher: Any = None
+    semantic_cache: Any = None
+    exact_cache: Any = Field(default_factory=lambda: TTLCache(maxsize=1000, ttl=3600))
+    # Crews call the tool from several threads; TTLCache isn't thread-safe
+    _exact_cache_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
 
     name: str = "HR Retriever"
@@ -20,11 +45,54 @@ class RetrieverTool(BaseTool):
 
     args_schema = ArgsSchema
 
+    @staticmethod
+    def _join(docs: list[Document]) -> str:
+        logger.debug("Retrieved %s HR chunks", len(docs))
+        return "\n\n".join([d.page_content for d in docs])
+
+    def _embed(self, query: str) -> list[float]:
+        if self.batcher is not None:
+            return self.batcher.submit(query).result()
+        return self.embedder.embed_query(query)
+
+    def _search(self, query: str, embedding: list[float]) -> str:
+        if hasattr(self.retriever, "search_by_vector"):
+            # Reuse the query embedding instead of embedding again
+            docs = self.retriever.search_by_vector(embedding)
+        else:
+            docs = self.retriever.invoke(query)
+        return self._join(docs)
+
+    def _cached_run(self, query: str) -> str:
+        key = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        with self._exact_cache_lock:
+            cached = self.exact_cache.get(key)
+        if cached is not None:
+            return cached
+
+        embedding = self._embed(query)
+        cached = self.semantic_cache.get(embedding)
+        if cached is None:
+            cached = self._search(query, embedding)
+            self.semantic_cache.put(embedding, cached)
+        with self._exact_cache_lock:
+            self.exact_cache[key] = cached
+        return cached
+
     def _run(self, query: str) -> str:
+        if self.semantic_cache is not None and self.embedder is not None:
+            return self._cached_run(query)
+        if self.batcher is not None and hasattr(self.retriever, "search_by_vector"):
+            return self._search(query, self._embed(query))
         # Call the LangChain retriever
         docs: list[Document] = self.retriever.invoke(query)
-        return "\n\n".join([d.page_content for d in docs])
+        return self._join(docs)
 
     async def _arun(self, query: str) -> str:
+        if self.semantic_cache is not None and self.embedder is not None:
+            return await asyncio.to_thread(self._cached_run, query)
+        if self.batcher is not None and hasattr(self.retriever, "search_by_vector"):
+            embedding = await self.batcher.embed(query)
+            return self._search(query, embedding)
         docs = await self.retriever.ainvoke(query)
-        return "\n\n".join([d.page_content for d in docs])
+        return self._join(docs)
@@ -0,0 +1,79 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+import httpx
+from bs4 import BeautifulSoup
+from crewai.tools import BaseTool
+from crewai_tools import ScrapeWebsiteTool
+from pydantic import BaseModel, Field
+
+from app.utils.http_client import get_http_client
+
+
+def _fetch_text(
+    client: httpx.Client,
+    url: str,
+    headers: Optional[dict] = None,
+    cookies: Optional[dict] = None,
+) -> str:
+    """Fetch a page and return its visible text with whitespace collapsed"""
+    page = client.get(url, headers=headers, cookies=cookies or {}, timeout=15)
+    parsed = BeautifulSoup(page.content, "html.parser")
+    text = parsed.get_text(" ")
+    text = re.sub("[ \t]+", " ", text)
+    return re.sub("\\s+\n\\s+", "\n", text)
+
+
+class PooledScrapeWebsiteTool(ScrapeWebsiteTool):
+    """ScrapeWebsiteTool that fetches pages through a shared, keep-alive HTTP client."""
+
+    http_client: Any = None
+
+    def _get_client(self) -> httpx.Client:
+        return self.http_client or get_http_client()
+
+    def _run(self, **kwargs: Any) -> Any:
+        website_url = kwargs.get("website_url", self.website_url)
+        return _fetch_text(self._get_client(), website_url, self.headers, self.cookies)
+
+
+class BatchScrapeWebsiteTool(BaseTool):
+    """
+    Scrapes several pages concurrently through a shared, keep-alive HTTP client.
+
+    Up to `max_concurrency` pages are fetched at once, so a research step that
+    needs n pages waits roughly for the slowest one instead of all n in turn.
+    Pages that fail to load are reported inline instead of failing the batch.
+    """
+
+    http_client: Any = None
+    max_concurrency: int = 5
+
+    name: str = "Scrape multiple websites"
+    description: str = (
+        "Reads the content of several websites at once. Prefer this tool over "
+        "reading websites one by one whenever more than one URL needs to be read."
+    )
+
+    class ArgsSchema(BaseModel):
+        urls: list[str] = Field(..., description="URLs of the websites to read")
+
+    args_schema = ArgsSchema
+
+    def _get_client(self) -> httpx.Client:
+        return self.http_client or get_http_client()
+
+    def _scrape(self, url: str) -> str:
+        try:
+            return _fetch_text(self._get_client(), url)
+        except httpx.HTTPError as e:
+            return f"Failed to read page: {e}"
+
+    def _run(self, urls: list[str]) -> str:
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return ""
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(urls))) as executor:
+            texts = executor.map(self._scrape, urls)
+            return "\n\n".join(f"## {url}\n{text}" for url, text in zip(urls, texts))
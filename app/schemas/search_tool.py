@@ -0,0 +1,40 @@
+from typing import Any
+
+import httpx
+from crewai_tools import SerperDevTool
+
+from app.core.config import settings
+from app.utils.http_client import get_http_client
+
+
+class PooledSerperDevTool(SerperDevTool):
+    """SerperDevTool that calls the Serper API through a shared, keep-alive HTTP client."""
+
+    http_client: Any = None
+
+    def _get_client(self) -> httpx.Client:
+        return self.http_client or get_http_client()
+
+    def _make_api_request(self, search_query: str, search_type: str) -> dict:
+        payload: dict[str, Any] = {"q": search_query, "num": self.n_results}
+        if self.country:
+            payload["gl"] = self.country
+        if self.location:
+            payload["location"] = self.location
+        if self.locale:
+            payload["hl"] = self.locale
+
+        response = self._get_client().post(
+            f"{self.base_url}/{search_type}",
+            headers={
+                "X-API-KEY": settings.SERPER_API_KEY or "",
+                "content-type": "application/json",
+            },
+            json=payload,
+            timeout=15,
+        )
+        response.raise_for_status()
+        results = response.json()
+        if not results:
+            raise ValueError("Empty response from Serper API")
+        return results
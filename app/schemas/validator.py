@@ -8,6 +8,13 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 file_param = File(...)
+ALLOWED_RESUME_CONTENT_TYPES = frozenset({"application/pdf"})
+MAX_RESUME_FILE_SIZE = 10 * 1024 * 1024
+
+# Upper bounds for free-text inputs, checked before any validation or service call
+MAX_JOB_DESCRIPTION_LENGTH = 50_000
+MAX_URL_LENGTH = 2048
+MAX_WRITE_UP_LENGTH = 10_000
 
 class ATSCheckResponse(BaseModel):
     """Response model for ATS check endpoint"""
@@ -55,23 +62,53 @@ async def validate_resume_file(file: UploadFile = file_param) -> UploadFile:
         )
     
     # Check file size (10MB limit)
-    max_file_size = 10 * 1024 * 1024
-
-    if file.size > max_file_size:
-        logger.error(f"Resume file exceeds size limit: {file.size} bytes")
+    if file.size > MAX_RESUME_FILE_SIZE:
+        logger.error("Resume file exceeds size limit: %s bytes", file.size)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Resume file exceeds maximum size of 10MB"
         )
     
     # Validate file type
-    allowed_types = ["application/pdf"]
-    if file.content_type not in allowed_types:
-        logger.error(f"Invalid file type: {file.content_type}")
+    if file.content_type not in ALLOWED_RESUME_CONTENT_TYPES:
+        logger.error("Invalid file type: %s", file.content_type)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only PDF files are accepted"
         )
         
     # Return validated file
-    return file
\ No newline at end of file
+    return file
+
+
+def check_input_length(
+    value: str,
+    field_name: str,
+    max_length: int,
+    allow_empty: bool = False
+) -> None:
+    """
+    Reject empty or oversized text inputs with a constant-time length check.
+    
+    Args:
+        value: The raw input string.
+        field_name: Name of the field, used in the error message.
+        max_length: Maximum allowed number of characters.
+        allow_empty: Whether an empty or blank value is acceptable.
+        
+    Raises:
+        HTTPException: 400 if the value is empty, 413 if it exceeds max_length
+    """
+    if not allow_empty and (not value or value.isspace()):
+        logger.error("Empty input for %s", field_name)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{field_name} must not be empty"
+        )
+    
+    if value and len(value) > max_length:
+        logger.error("Input for %s exceeds %s characters: %s", field_name, max_length, len(value))
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"{field_name} exceeds maximum length of {max_length} characters"
+        )
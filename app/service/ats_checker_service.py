@@ -5,15 +5,21 @@ Provides functionality to analyze a resume against a job description
 using a crew of AI agents.
 """
 
-import io
-from typing import Any
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import IO, Any, Optional
 
+import orjson
+from cachetools import LRUCache, TTLCache
 from crewai import Agent, Crew, Task
 
 from app.api.error_handlers import CustomExceptionError
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.llm.provider import GoogleProvider
-from app.utils.parse_pdf import extract_text_from_pdf
+from app.utils.parse_pdf import extract_text_in_process
 from app.utils.yaml_config import load_yaml_configs
 
 logger = get_logger(__name__)
@@ -24,6 +30,32 @@ yaml_file_path = {
     "tasks": "app/agents_config/ats_checker_config/tasks.yaml"
 }
 
+# Structured job description analyses keyed by the SHA-256 of the JD text.
+# Users typically check several resumes against the same posting, so the
+# JD analysis step is shared across requests.
+jd_analysis_cache: LRUCache = LRUCache(maxsize=1024)
+jd_analysis_cache_lock = threading.Lock()
+
+# Extracted resume text keyed by the SHA-256 of the uploaded PDF bytes
+resume_text_cache: LRUCache = LRUCache(maxsize=256)
+resume_text_cache_lock = threading.Lock()
+
+# Full ATS reports keyed by (resume SHA-256, job description SHA-256), so an
+# identical resume/JD pair skips PDF parsing and every crew kickoff
+ats_result_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)
+ats_result_cache_lock = threading.Lock()
+
+# Runs the job description analysis alongside resume parsing; the two have no
+# data dependency, so a cold request waits for the slower one instead of both
+jd_analysis_executor = ThreadPoolExecutor(
+    max_workers=settings.LLM_POOL_SIZE, thread_name_prefix="ats-jd"
+)
+
+def _hash_text(text: str) -> str:
+    """Return the SHA-256 hex digest of a text"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 class ATSCheckerService:
     """
     A service for analyzing resumes against job descriptions using a crew of AI agents.
@@ -34,11 +66,24 @@ class ATSCheckerService:
     loads agent and task configurations from YAML files, and provides an `analyze`
     method to process resume and job description inputs.
 
+    Resume parsing and job description analysis run first, concurrently, as two
+    single-task crews; the job description analysis is also cached by content hash
+    in `jd_analysis_cache`. The remaining tasks receive both outputs as the
+    `resume_analysis` and `job_description_analysis` inputs. Complete reports are cached per
+    resume/job description pair in `ats_result_cache`.
+
     Attributes:
         llm_provider (Any): An instance of an LLM provider (e.g., Google Gemini).
         configs (dict): Loaded configurations for agents and tasks from YAML files.
-        agents (list[Agent]): A list of initialized CrewAI Agent objects.
-        tasks (list[Task]): A list of initialized CrewAI Task objects.
+        agents (list[Agent]): The CrewAI agents of the main ATS crew.
+        tasks (list[Task]): The CrewAI tasks of the main ATS crew.
+        parse_agent (Agent): The resume parser agent.
+        parse_task (Task): The resume parsing task.
+        jd_agent (Agent): The job description analyzer agent.
+        jd_task (Task): The job description analysis task.
+        crew (Crew): The main match/score/feedback crew, built once.
+        parse_crew (Crew): The single-task resume parsing crew, built once.
+        jd_crew (Crew): The single-task job description analysis crew, built once.
     """
     def __init__(self):
         """
@@ -51,6 +96,7 @@ class ATSCheckerService:
         self.llm_provider = self._initialize_llm_provider()
         self.configs = load_yaml_configs(yaml_file_path)
         self.agents, self.tasks = self._initialize_agents_and_tasks()
+        self.crew, self.parse_crew, self.jd_crew = self._initialize_crews()
 
     def _initialize_llm_provider(self) -> Any:
         """
@@ -71,17 +117,66 @@ class ATSCheckerService:
             logger.error("Failed to initialize LLM provider", exc_info=True)
             raise CustomExceptionError("Failed to initialize LLM provider") from e
 
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _build_agents_and_tasks(llm: Any, configs_json: bytes) -> tuple[Any, ...]:
+        """
+        Builds the CrewAI agents and tasks for one LLM and configuration.
+
+        Cached per LLM handle and serialized configuration, so every service
+        instance built from the same YAML files shares one set of validated
+        `Agent` and `Task` objects. Requests never modify them: they kick off
+        copies of the crews (see `_initialize_crews`).
+
+        Args:
+            llm (Any): The LLM handle given to every agent.
+            configs_json (bytes): The agent and task configurations, serialized with
+                                  sorted keys so equal configurations share a cache entry.
+
+        Returns:
+            tuple[Any, ...]: The main crew's agents and tasks, followed by the resume
+                             parser agent and task and the job description analyzer
+                             agent and task.
+        """
+        configs = orjson.loads(configs_json)
+        agents_config = configs["agents"]
+        tasks_config = configs["tasks"]
+
+        agents = {
+            "resume_parser": Agent(llm=llm, **agents_config["resume_parser"]),
+            "job_description_analyzer": Agent(llm=llm, **agents_config["job_description_analyzer"]),
+            "keyword_matcher": Agent(llm=llm, **agents_config["keyword_matcher"]),
+            "scoring_agent": Agent(llm=llm, **agents_config["scoring_agent"]),
+            "feedback_agent": Agent(llm=llm, **agents_config["feedback_agent"])
+        }
+
+        parse_agent = agents.pop("resume_parser")
+        parse_task = Task(**tasks_config["parse_task"], agent=parse_agent)
+        jd_agent = agents.pop("job_description_analyzer")
+        jd_task = Task(**tasks_config["jd_analysis_task"], agent=jd_agent)
+
+        tasks = [
+            Task(**tasks_config["match_task"], agent=agents["keyword_matcher"]),
+            Task(**tasks_config["score_task"], agent=agents["scoring_agent"]),
+            Task(**tasks_config["feedback_task"], agent=agents["feedback_agent"])
+        ]
+
+        return list(agents.values()), tasks, parse_agent, parse_task, jd_agent, jd_task
+
     def _initialize_agents_and_tasks(self) -> tuple[list[Agent], list[Task]]:
         """
         Initializes and returns the CrewAI agents and tasks from configuration.
 
-        Loads agent and task definitions from YAML files specified in `yaml_file_path`,
-        using the `self.configs` attribute (loaded in `__init__`).
-        It instantiates `Agent` and `Task` objects accordingly.
+        The objects are built by `_build_agents_and_tasks` from `self.configs`
+        (loaded in `__init__`) and `self.llm_provider`, and shared between instances
+        with the same LLM and configuration. The resume parser and job description
+        analyzer agents and their tasks are kept apart (as `self.parse_agent`/
+        `self.parse_task` and `self.jd_agent`/`self.jd_task`) so they can run
+        concurrently ahead of the main crew.
 
         Returns:
-            tuple[list[Agent], list[Task]]: A tuple containing a list of initialized
-                                           Agent objects and a list of initialized Task objects.
+            tuple[list[Agent], list[Task]]: A tuple containing the Agent objects and the
+                                           Task objects of the main ATS crew.
 
         Raises:
             CustomExceptionError: If there's a missing configuration key or any other
@@ -89,48 +184,133 @@ class ATSCheckerService:
         """
         try:
             logger.debug("Initializing ATS checker agents and tasks")
-            agents_config = self.configs["agents"]
-            tasks_config = self.configs["tasks"]
-
-            agents = {
-                "resume_parser": Agent(llm=self.llm_provider, **agents_config["resume_parser"]),
-                "job_description_analyzer": Agent(llm=self.llm_provider, **agents_config["job_description_analyzer"]),
-                "keyword_matcher": Agent(llm=self.llm_provider, **agents_config["keyword_matcher"]),
-                "scoring_agent": Agent(llm=self.llm_provider, **agents_config["scoring_agent"]),
-                "feedback_agent": Agent(llm=self.llm_provider, **agents_config["feedback_agent"])
-            }
-
-            tasks = [
-                Task(**tasks_config["parse_task"], agent=agents["resume_parser"]),
-                Task(**tasks_config["jd_analysis_task"], agent=agents["job_description_analyzer"]),
-                Task(**tasks_config["match_task"], agent=agents["keyword_matcher"]),
-                Task(**tasks_config["score_task"], agent=agents["scoring_agent"]),
-                Task(**tasks_config["feedback_task"], agent=agents["feedback_agent"])
-            ]
-
-            return list(agents.values()), tasks
+            configs_json = orjson.dumps(self.configs, option=orjson.OPT_SORT_KEYS)
+            (
+                agents, tasks, self.parse_agent, self.parse_task, self.jd_agent, self.jd_task
+            ) = self._build_agents_and_tasks(self.llm_provider, configs_json)
+            return agents, tasks
         except KeyError as e:
-            logger.error(f"Missing configuration key: {e}", exc_info=True)
+            logger.error("Missing configuration key: %s", e, exc_info=True)
             raise CustomExceptionError("Missing configuration key") from e
         except Exception as e:
             logger.error("Failed to initialize agents or tasks", exc_info=True)
             raise CustomExceptionError("Missing configuration key") from e
 
-    def analyze(self, file_bytes: bytes, job_description: str) -> dict[str, Any]:
+    def _initialize_crews(self) -> tuple[Crew, Crew, Crew]:
+        """
+        Builds the main, resume parsing and job description analysis crews once.
+
+        A kickoff interpolates the request's inputs into its tasks and stores their
+        outputs on them, so requests kick off `crew.copy()`, which copies the agents
+        and tasks too; these crews are templates and are never run themselves.
+
+        Returns:
+            tuple[Crew, Crew, Crew]: The main crew, the resume parsing crew and the
+                                     job description analysis crew.
+        """
+        crew = Crew(
+            llm=self.llm_provider,
+            agents=self.agents,
+            tasks=self.tasks,
+            verbose=settings.CREW_VERBOSE
+        )
+        parse_crew = Crew(
+            llm=self.llm_provider,
+            agents=[self.parse_agent],
+            tasks=[self.parse_task],
+            verbose=settings.CREW_VERBOSE
+        )
+        jd_crew = Crew(
+            llm=self.llm_provider,
+            agents=[self.jd_agent],
+            tasks=[self.jd_task],
+            verbose=settings.CREW_VERBOSE
+        )
+        return crew, parse_crew, jd_crew
+
+    def _analyze_job_description(self, job_description: str) -> str:
+        """
+        Returns the structured analysis of a job description, using the cache when possible.
+
+        Args:
+            job_description (str): The full text of the job description.
+
+        Returns:
+            str: The raw JSON output of the job description analysis task.
+        """
+        cache_key = _hash_text(job_description)
+        with jd_analysis_cache_lock:
+            cached_analysis = jd_analysis_cache.get(cache_key)
+        if cached_analysis is not None:
+            logger.debug("Using cached job description analysis")
+            return cached_analysis
+
+        analysis = self.jd_crew.copy().kickoff(inputs={"job_description": job_description}).raw
+        with jd_analysis_cache_lock:
+            jd_analysis_cache[cache_key] = analysis
+        return analysis
+
+    def _parse_resume(self, resume_text: str) -> str:
+        """
+        Returns the structured JSON parse of a resume.
+
+        Args:
+            resume_text (str): The extracted resume text.
+
+        Returns:
+            str: The raw JSON output of the resume parsing task.
+        """
+        return self.parse_crew.copy().kickoff(inputs={"resume_text": resume_text}).raw
+
+    def _extract_resume_text(self, resume_file: IO[bytes], file_hash: Optional[str]) -> str:
+        """
+        Extracts resume text, reusing a previous extraction of the same PDF when possible.
+
+        Args:
+            resume_file (IO[bytes]): A readable binary stream of the resume PDF.
+            file_hash (Optional[str]): SHA-256 hex digest of the PDF bytes. When None,
+                                       the text is extracted without caching.
+
+        Returns:
+            str: The extracted resume text.
+        """
+        if file_hash is None:
+            return extract_text_in_process(resume_file)
+
+        with resume_text_cache_lock:
+            cached_text = resume_text_cache.get(file_hash)
+        if cached_text is not None:
+            logger.debug("Using cached resume text")
+            return cached_text
+
+        resume_text = extract_text_in_process(resume_file)
+        with resume_text_cache_lock:
+            resume_text_cache[file_hash] = resume_text
+        return resume_text
+
+    def analyze(
+        self,
+        resume_file: IO[bytes],
+        job_description: str,
+        file_hash: Optional[str] = None
+    ) -> str:
         """
         Runs an ATS (Applicant Tracking System) analysis on a given resume and job description.
 
-        This method extracts text from the provided resume file (PDF bytes), then uses a
-        CrewAI setup (agents and tasks) to perform the analysis against the job description.
+        This method extracts text from the provided resume file (PDF stream), parses it
+        while the (possibly cached) job description analysis runs concurrently, then uses
+        a CrewAI setup (agents and tasks) to perform the analysis against the job description.
 
         Args:
-            file_bytes (bytes): The content of the resume file, expected in PDF format.
+            resume_file (IO[bytes]): A readable binary stream of the resume, expected in PDF format.
             job_description (str): The full text of the job description.
+            file_hash (Optional[str]): SHA-256 hex digest of the resume bytes, used to
+                                       cache the extracted text and the full report.
+                                       Defaults to None.
 
         Returns:
-            dict[str, Any]: A dictionary containing the raw structured results from the
-                            ATS analysis crew. The exact structure depends on the final
-                            task output of the CrewAI setup.
+            str: The raw output of the final (feedback) task of the ATS analysis crew,
+                 a Markdown report.
 
         Raises:
             CustomExceptionError: If PDF text extraction fails, or if the CrewAI analysis
@@ -138,25 +318,36 @@ class ATSCheckerService:
         """
         try:
             logger.info("Starting ATS compatibility analysis")
-            resume_text = extract_text_from_pdf(io.BytesIO(file_bytes))
-            logger.debug(f"Extracted {len(resume_text)} characters from resume")
+            result_key = None
+            if file_hash is not None:
+                result_key = (file_hash, _hash_text(job_description))
+                with ats_result_cache_lock:
+                    cached_report = ats_result_cache.get(result_key)
+                if cached_report is not None:
+                    logger.info("Using cached ATS analysis")
+                    return cached_report
+
+            resume_text = self._extract_resume_text(resume_file, file_hash)
+            logger.debug("Extracted %s characters from resume", len(resume_text))
+
+            # Fan out: analyze the JD on another thread while parsing the resume here
+            jd_future = jd_analysis_executor.submit(self._analyze_job_description, job_description)
+            resume_analysis = self._parse_resume(resume_text)
 
             input_data = {
                 "resume_text": resume_text,
-                "job_description": job_description
+                "job_description": job_description,
+                "resume_analysis": resume_analysis,
+                "job_description_analysis": jd_future.result()
             }
 
-            ats_crew = Crew(
-                llm=self.llm_provider,
-                agents=self.agents,
-                tasks=self.tasks,
-                verbose=True
-            )
-
-            result = ats_crew.kickoff(inputs=input_data)
+            result = self.crew.copy().kickoff(inputs=input_data)
             logger.info("ATS analysis completed successfully")
+            if result_key is not None:
+                with ats_result_cache_lock:
+                    ats_result_cache[result_key] = result.raw
             return result.raw
 
         except Exception as e:
-            logger.error(f"ATS analysis failed: {str(e)}", exc_info=True)
+            logger.error("ATS analysis failed: %s", e, exc_info=True)
             raise CustomExceptionError("ATS analysis failed:") from e
\ No newline at end of file
@@ -7,20 +7,33 @@ Augmented Generation) system and a crew of AI agents to answer HR-related questi
 It loads HR policy documents, processes user queries, and generates answers based on
 the retrieved information and agent-based reasoning.
 
-A singleton instance (`hr_qa_service`) is provided for easy use across the application.
+A lazily created singleton (`get_hr_qa_service()`) is provided for easy use across the application.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import orjson
 from crewai import Agent, Crew, Process, Task
 
 from app.api.error_handlers import CustomExceptionError
+from app.core.config import settings
 from app.core.logging import get_logger
-from app.llm.provider import GoogleProvider
+from app.llm.provider import GoogleProvider, stream_llm_chunks
+from app.rag.matrix_retriever import MatrixRetriever
 from app.rag.rag_system import PDFRAGSystem
 from app.schemas.rag_tool import RetrieverTool
+from app.service.semantic_cache import SemanticCache
+from app.utils.embedding_batcher import EmbeddingBatcher
+from app.utils.micro_batcher import MicroBatcher
 from app.utils.yaml_config import load_yaml_configs
 
 logger = get_logger(__name__)
 
+# Marker CrewAI agents put before their final answer, after any reasoning
+_FINAL_ANSWER_MARKER = "Final Answer:"
+
 class HRQuestionAnswerService:
     """
     A service class for handling HR-related questions using a multi-agent system.
@@ -31,10 +44,15 @@ class HRQuestionAnswerService:
     and configuring a crew of AI agents (Research, Formulation, QA).
 
     The primary method, `get_answer`, takes a user query and returns a
-    generated answer.
+    generated answer; `stream_answer` passes the answer on as it is generated.
 
     Key Attributes:
         rag_system (PDFRAGSystem): Instance for loading and processing PDFs.
+        query_batcher (EmbeddingBatcher): Micro-batches query embeddings for the RAG embedder.
+        crew (Crew): The single-query crew, built once.
+        batch_crew (Crew): The multi-query crew, built once.
+        answer_cache (SemanticCache): Answers to recent questions, matched by embedding similarity.
+        answer_batcher (MicroBatcher): Groups concurrent cache misses into one batched crew run.
         llm (Any): The language model provider (e.g., Google Gemini).
         hr_tool (RetrieverTool): Tool for agents to query the HR document vector store.
         agents (dict[str, Agent]): Dictionary of initialized CrewAI agents.
@@ -62,7 +80,21 @@ class HRQuestionAnswerService:
             "agents": "app/agents_config/hr_qa_agent/agents.yaml",
             "tasks": "app/agents_config/hr_qa_agent/tasks.yaml"
         }
-        self.rag_system = PDFRAGSystem()
+        self.rag_system = PDFRAGSystem(
+            index_dir=settings.FAISS_INDEX_DIR,
+            int8_index=settings.FAISS_INT8_INDEX,
+            # Corpora served by MatrixRetriever need their exact vectors
+            int8_min_chunks=settings.MATRIX_RETRIEVER_MAX_CHUNKS
+        )
+        # Embeds concurrent queries (API questions and agent tool calls) in shared forward passes
+        self.query_batcher = EmbeddingBatcher(self.rag_system.embedder)
+        # Answers to previously seen (or paraphrased) questions
+        self.answer_cache = SemanticCache(
+            dim=settings.EMBEDDING_DIM,
+            threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+            ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS,
+            max_size=settings.SEMANTIC_CACHE_MAX_SIZE
+        )
         self._initialize_retriever(pdf_path)
         
         # Load configurations
@@ -72,6 +104,18 @@ class HRQuestionAnswerService:
         self._initialize_llm()
         self._initialize_agents()
         self._initialize_tasks()
+        self._initialize_crews()
+
+        # Concurrent cache misses share one crew run (and one set of LLM calls)
+        self.answer_batcher = MicroBatcher(
+            self._answer_batch,
+            max_batch_size=settings.HR_QA_BATCH_MAX_SIZE,
+            max_wait_ms=settings.HR_QA_BATCH_MAX_WAIT_MS,
+            name="hr-answer-batcher",
+            executor=ThreadPoolExecutor(
+                max_workers=settings.LLM_POOL_SIZE, thread_name_prefix="hr-answer"
+            )
+        )
     
     def _load_configurations(self) -> None:
         """
@@ -88,7 +132,7 @@ class HRQuestionAnswerService:
             self.agents_config = self.configs["agents"]
             self.tasks_config = self.configs["tasks"]
         except Exception as e:
-            logger.error(f"Failed to load configurations: {e}")
+            logger.error("Failed to load configurations: %s", e)
             raise CustomExceptionError("Configuration loading failed:") from e
     
     def _initialize_llm(self) -> None:
@@ -101,7 +145,7 @@ class HRQuestionAnswerService:
         try:
             self.llm = GoogleProvider().gemini_llm()
         except Exception as e:
-            logger.error(f"LLM initialization failed: {e}")
+            logger.error("LLM initialization failed: %s", e)
             raise CustomExceptionError("LLM initialization failed: ") from e
     
     def _initialize_retriever(self, pdf_path: str) -> None:
@@ -110,6 +154,8 @@ class HRQuestionAnswerService:
 
         Uses `self.rag_system` to load and process the PDF, creates a vector store,
         and sets up `self.retriever` (FAISS retriever) and `self.hr_tool` (RetrieverTool for agents).
+        When `RETRIEVER_CACHE_ENABLED` is set, the tool caches retrieval results for
+        near-duplicate queries (cosine similarity >= `RETRIEVER_CACHE_THRESHOLD`).
         
         Args:
             pdf_path (str): Path to the HR PDF document.
@@ -122,14 +168,40 @@ class HRQuestionAnswerService:
             # but self.retriever and self.hr_tool are instance attributes.
             vector_store = self.rag_system.load_and_process(pdf_path)
             logger.info("vector store created")
-            retriever = vector_store.as_retriever(
-                search_type="similarity",
-                search_kwargs={"k": 5}
-            )
+            # Top chunks reranked by MMR: fewer, less redundant chunks in every agent prompt
+            search_kwargs = {
+                "k": settings.RETRIEVER_K,
+                "fetch_k": settings.RETRIEVER_FETCH_K,
+                "lambda_mult": settings.RETRIEVER_MMR_LAMBDA
+            }
+            if vector_store.index.ntotal <= settings.MATRIX_RETRIEVER_MAX_CHUNKS:
+                # Small corpus (stored without SQ8): one exact matrix-vector
+                # product beats the FAISS round trip
+                retriever = MatrixRetriever.from_vector_store(
+                    vector_store, search_type="mmr", **search_kwargs
+                )
+            else:
+                retriever = vector_store.as_retriever(
+                    search_type="mmr",
+                    search_kwargs=search_kwargs
+                )
             logger.info("retrieved the doc")
-            self.hr_tool = RetrieverTool(retriever=retriever)
+            retrieval_cache = None
+            if settings.RETRIEVER_CACHE_ENABLED:
+                retrieval_cache = SemanticCache(
+                    dim=settings.EMBEDDING_DIM,
+                    threshold=settings.RETRIEVER_CACHE_THRESHOLD,
+                    ttl_seconds=settings.RETRIEVER_CACHE_TTL_SECONDS,
+                    max_size=settings.SEMANTIC_CACHE_MAX_SIZE
+                )
+            self.hr_tool = RetrieverTool(
+                retriever=retriever,
+                embedder=self.rag_system.embedder,
+                batcher=self.query_batcher,
+                semantic_cache=retrieval_cache
+            )
         except Exception as e:
-            logger.error(f"Retriever initialization failed: {e}")
+            logger.error("Retriever initialization failed: %s", e)
             raise CustomExceptionError("Retriever initialization failed:") from e
     
     def _initialize_agents(self) -> None:
@@ -160,7 +232,7 @@ class HRQuestionAnswerService:
                 )
             }
         except Exception as e:
-            logger.error(f"Agent initialization failed: {e}")
+            logger.error("Agent initialization failed: %s", e)
             raise CustomExceptionError("Agent initialization failed: ") from e
     
     def _initialize_tasks(self) -> None:
@@ -168,7 +240,8 @@ class HRQuestionAnswerService:
         Initializes CrewAI tasks based on loaded configurations and agents.
 
         Uses `self.tasks_config` and `self.agents` to create and assign tasks
-        like `self.research_task`, `self.formulation_task`, and `self.qa_task`.
+        like `self.research_task`, `self.formulation_task`, and `self.qa_task`,
+        plus their multi-question counterparts in `self.batch_tasks`.
         Sets up task contexts for sequential execution.
 
         Raises:
@@ -191,19 +264,122 @@ class HRQuestionAnswerService:
                 agent=self.agents["qa"],
                 context=[self.formulation_task]
             )
+
+            batch_research_task = Task(
+                **self.tasks_config["batch_research_task"],
+                agent=self.agents["research"]
+            )
+            batch_formulation_task = Task(
+                **self.tasks_config["batch_formulation_task"],
+                agent=self.agents["formulation"],
+                context=[batch_research_task]
+            )
+            batch_qa_task = Task(
+                **self.tasks_config["batch_qa_task"],
+                agent=self.agents["qa"],
+                context=[batch_formulation_task]
+            )
+            self.batch_tasks = [batch_research_task, batch_formulation_task, batch_qa_task]
         except Exception as e:
-            logger.error(f"Task initialization failed: {e}")
+            logger.error("Task initialization failed: %s", e)
             raise CustomExceptionError("Task initialization failed") from e
 
-    def get_answer(self, query: str) -> str:
+    def _initialize_crews(self) -> None:
+        """
+        Builds the single-query and batch crews once as `self.crew` and `self.batch_crew`.
+
+        A kickoff interpolates the request's inputs into its tasks and stores their
+        outputs on them, so requests kick off `crew.copy()`, which copies the agents
+        and tasks too; these crews are templates and are never run themselves.
+
+        Raises:
+            CustomExceptionError: If crew initialization fails.
+        """
+        try:
+            self.crew = Crew(
+                llm=self.llm,
+                agents=list(self.agents.values()),
+                tasks=[self.research_task, self.formulation_task, self.qa_task],
+                verbose=settings.CREW_VERBOSE,
+                process=Process.sequential
+            )
+            self.batch_crew = Crew(
+                llm=self.llm,
+                agents=list(self.agents.values()),
+                tasks=self.batch_tasks,
+                verbose=settings.CREW_VERBOSE,
+                process=Process.sequential
+            )
+        except Exception as e:
+            logger.error("Crew initialization failed: %s", e)
+            raise CustomExceptionError("Crew initialization failed") from e
+
+    def _run_crew(self, query: str) -> str:
+        """Run the research, formulation and QA crew for a single query"""
+        return self.crew.copy().kickoff(inputs={"query": query}).raw
+
+    @staticmethod
+    def _parse_batch_answers(raw: str, expected: int) -> Optional[list[str]]:
+        """Parse the batched QA output into one answer per question, or None if malformed"""
+        cleaned = raw.strip().removeprefix("```json").removeprefix("```").removesuffix("```")
+        try:
+            answers = orjson.loads(cleaned)
+        except orjson.JSONDecodeError:
+            return None
+        if (
+            not isinstance(answers, list)
+            or len(answers) != expected
+            or not all(isinstance(answer, str) for answer in answers)
+        ):
+            return None
+        return answers
+
+    def _answer_batch(self, queries: list[str]) -> list[str]:
+        """
+        Answers several queries with one crew run.
+
+        A single query runs the regular crew. Multiple queries are listed as numbered
+        questions for the batch tasks, whose final output is a JSON array of answers;
+        if that output cannot be matched up with the questions, the queries fall back
+        to their own crew runs, one after another.
+
+        Args:
+            queries (list[str]): The HR-related questions, in submission order.
+
+        Returns:
+            list[str]: One answer per query, in the same order.
+        """
+        if len(queries) == 1:
+            return [self._run_crew(queries[0])]
+
+        logger.info("Answering %s HR queries in one batched crew run", len(queries))
+        questions = "\n".join(f"{number}. {query}" for number, query in enumerate(queries, 1))
+        result = self.batch_crew.copy().kickoff(inputs={"questions": questions})
+
+        answers = self._parse_batch_answers(result.raw, len(queries))
+        if answers is not None:
+            return answers
+
+        # Sequentially: this already runs on an answer batcher thread, and a pool
+        # per batch would slip past the LLM pool's concurrency and rate limits
+        logger.warning("Batched HR answer could not be parsed, answering queries one by one")
+        return [self._run_crew(query) for query in queries]
+
+    async def get_answer(self, query: str, embedding: Optional[list[float]] = None) -> str:
         """
         Orchestrates the CrewAI agents and tasks to answer a given HR-related query.
 
-        A Crew is formed with the initialized agents and tasks. The query is passed
-        as input to the crew, which then executes its tasks sequentially.
+        Questions semantically close to a recently answered one are served from
+        `self.answer_cache`. Otherwise the query joins `self.answer_batcher`, which
+        answers concurrent queries in one crew run (a lone query runs the regular
+        sequential research, formulation and QA crew), and a non-empty answer is cached.
+        The batch runs on the batcher's own threads; this coroutine only awaits its
+        result, so no thread is held while the batch window fills.
 
         Args:
             query (str): The HR-related question from the user.
+            embedding (Optional[list[float]]): The query embedding from the RAG embedder,
+                                               if already computed. Defaults to None.
 
         Returns:
             str: The final answer generated by the QA agent in the crew.
@@ -213,23 +389,112 @@ class HRQuestionAnswerService:
                                   or if the result format is unexpected.
         """
         try:
-            logger.info(f"Processing HR query: {query}")
-            
-            crew = Crew(
-                llm=self.llm,
-                agents=list(self.agents.values()),
-                tasks=[self.research_task, self.formulation_task, self.qa_task],
-                verbose=True,
-                process=Process.sequential
-            )
-            
-            result = crew.kickoff(inputs={"query": query})
+            logger.info("Processing HR query: %s", query)
+            if embedding is None:
+                embedding = await self.query_batcher.embed(query)
+            cached_answer = self.answer_cache.get(embedding)
+            if cached_answer is not None:
+                logger.info("Serving HR answer from semantic cache")
+                return cached_answer
+
+            answer = await self.answer_batcher.run(query)
             logger.info("Successfully generated HR answer")
-            return result.raw
-            
+            if answer:
+                self.answer_cache.put(embedding, answer)
+            return answer
+
+        except Exception as e:
+            logger.error("Failed to generate HR answer: %s", e, exc_info=True)
+            raise CustomExceptionError("HR QA service error:") from e
+
+    def stream_answer(
+        self,
+        query: str,
+        on_chunk: Callable[[str], None],
+        embedding: Optional[list[float]] = None
+    ) -> str:
+        """
+        Answers a query with the regular crew, streaming the final answer as it is generated.
+
+        The crew is copied and its QA agent given a streaming Gemini handle. The agent's
+        reasoning preamble is held back: only text after its `Final Answer:` marker is
+        passed to `on_chunk`. Batching is skipped, since a batched run cannot stream
+        one question's answer. A non-empty answer is cached like in `get_answer`.
+
+        Args:
+            query (str): The HR-related question from the user.
+            on_chunk (Callable[[str], None]): Called with each streamed piece of the answer.
+            embedding (Optional[list[float]]): The query embedding from the RAG embedder,
+                                               if already computed. Defaults to None.
+
+        Returns:
+            str: The complete answer generated by the QA agent.
+
+        Raises:
+            CustomExceptionError: If any error occurs during the CrewAI kickoff process.
+        """
+        try:
+            logger.info("Streaming HR query: %s", query)
+            llm = GoogleProvider().gemini_streaming_llm()
+            crew = self.crew.copy()
+            crew.tasks[-1].agent.llm = llm
+
+            buffer: list[str] = []
+            answer_started = False
+
+            def forward(chunk: str) -> None:
+                nonlocal answer_started
+                if answer_started:
+                    on_chunk(chunk)
+                    return
+                buffer.append(chunk)
+                text = "".join(buffer)
+                if _FINAL_ANSWER_MARKER in text:
+                    answer_started = True
+                    head = text.split(_FINAL_ANSWER_MARKER, 1)[1].lstrip()
+                    if head:
+                        on_chunk(head)
+
+            with stream_llm_chunks(llm, forward):
+                answer = crew.kickoff(inputs={"query": query}).raw
+
+            if answer:
+                if embedding is None:
+                    embedding = self.query_batcher.submit(query).result()
+                self.answer_cache.put(embedding, answer)
+            return answer
+
         except Exception as e:
-            logger.error(f"Failed to generate HR answer: {e}", exc_info=True)
+            logger.error("Failed to stream HR answer: %s", e, exc_info=True)
             raise CustomExceptionError("HR QA service error:") from e
 
-# Singleton instance for the service
-hr_qa_service = HRQuestionAnswerService()
\ No newline at end of file
+# Singleton instance for the service, built on first use
+_hr_qa_service: Optional[HRQuestionAnswerService] = None
+_hr_qa_service_lock = threading.Lock()
+
+
+def get_hr_qa_service() -> HRQuestionAnswerService:
+    """
+    Get the process-wide HR QA service, creating it on first use.
+
+    Building the service loads the HR PDF index, the embedding model and the
+    LLM client, so it is deferred until a worker actually needs it instead of
+    running at import time.
+
+    Returns:
+        HRQuestionAnswerService: Shared HR QA service
+    """
+    global _hr_qa_service
+    if _hr_qa_service is None:
+        with _hr_qa_service_lock:
+            if _hr_qa_service is None:
+                _hr_qa_service = HRQuestionAnswerService()
+    return _hr_qa_service
+
+
+def close_hr_qa_service() -> None:
+    """Stop the shared service's batchers, if the service was created"""
+    with _hr_qa_service_lock:
+        if _hr_qa_service is not None:
+            _hr_qa_service.answer_batcher.close()
+            _hr_qa_service.query_batcher.close()
@@ -6,15 +6,25 @@ job postings from a given URL. It uses a crew of AI agents to scrape job details
 research the company, and compile comprehensive insights about the job opportunity.
 """
 
-from typing import Any
+import asyncio
+import hashlib
+import re
+import threading
+from types import MappingProxyType
+from typing import Any, Optional
 
+import httpx
+import orjson
 from crewai import Agent, Crew, Task
-from crewai_tools import ScrapeWebsiteTool, SerperDevTool
 
 from app.api.error_handlers import CustomExceptionError
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.llm.provider import GoogleProvider
+from app.schemas.scrape_tool import BatchScrapeWebsiteTool, PooledScrapeWebsiteTool
+from app.schemas.search_tool import PooledSerperDevTool
+from app.utils.crew_cache import CrewResultCache
+from app.utils.url import guess_company_from_url, normalize_url
 from app.utils.yaml_config import load_yaml_configs
 
 logger = get_logger(__name__)
@@ -25,6 +35,18 @@ yaml_file_path = {
     "tasks": "app/agents_config/jp_analyser/tasks.yaml"
 }
 
+# Placeholder returned when the posting does not name the company
+UNKNOWN_COMPANY = "Unknown Company"
+
+# Opening and closing markdown code fences, removed in one pass
+_MARKDOWN_FENCE_PATTERN = re.compile(r"```(?:markdown)?")
+
+# First "<label>: <name>" line naming the employer, found in a single scan
+_COMPANY_NAME_PATTERN = re.compile(
+    r"(?:Company Name|Company|Organization|Employer):[ \t]*([^\r\n]+)",
+    re.IGNORECASE
+)
+
 class JobPostingAnalyzer:
     """
     A class to analyze job postings by:
@@ -37,33 +59,70 @@ class JobPostingAnalyzer:
         config (dict): Loaded YAML configurations for agents and tasks.
         agents_config (dict): Specific configurations for agents, derived from `config`.
         tasks_config (dict): Specific configurations for tasks, derived from `config`.
-        tools (dict[str, Any]): A dictionary of initialized tools (e.g., web scraper, search tool)
-                                 for agents to use.
-        agents (dict[str, Agent]): A dictionary of initialized CrewAI Agent objects.
+        http_client (Optional[httpx.Client]): HTTP client used by the web scraper. When None,
+                                              the process-wide shared client is used.
+        tools (Mapping[str, Any]): A read-only mapping of initialized tools (e.g., web scraper,
+                                   search tool) for agents to use.
+        agents (Mapping[str, Agent]): A read-only mapping of initialized CrewAI Agent objects.
+        scrape_cache (CrewResultCache): Scraped job details, keyed by normalized URL.
+        research_cache (CrewResultCache): Company research, keyed by normalized company name.
+        crew_cache (CrewResultCache): Compiled insights, keyed by their inputs.
     """
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.Client] = None):
         """
         Initializes the JobPostingAnalyzer.
 
         This constructor sets up the LLM provider (Google Gemini), loads agent and
         task configurations from specified YAML files, and initializes the necessary
         tools (web scraper, search tool) and CrewAI agents.
+
+        Args:
+            http_client (Optional[httpx.Client], optional): HTTP client reused by the web
+                                                           scraper for keep-alive connections.
+                                                           Defaults to the shared client.
         """
+        self.http_client = http_client
         self.llm = GoogleProvider().gemini_llm()
         self.config = load_yaml_configs(yaml_file_path)
         self.agents_config = self.config["agents"]
         self.tasks_config = self.config ["tasks"]
-        self.tools = self._initialize_tools()
-        self.agents = self._initialize_agents()
+        # Read-only views: the analyzer is shared by concurrent requests
+        self.tools = MappingProxyType(self._initialize_tools())
+        self.agents = MappingProxyType(self._initialize_agents())
+        # Step outputs per inputs; a change to the agent/task configuration changes
+        # the version and so invalidates earlier outputs. Postings change more often
+        # than company profiles, so each step keeps its own lifetime.
+        config_version = hashlib.sha256(
+            orjson.dumps(self.config, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()[:16]
+        self.scrape_cache = CrewResultCache(
+            maxsize=settings.CREW_CACHE_MAX_SIZE,
+            ttl=settings.JOB_SCRAPE_CACHE_TTL_SECONDS,
+            version=config_version
+        )
+        self.research_cache = CrewResultCache(
+            maxsize=settings.CREW_CACHE_MAX_SIZE,
+            ttl=settings.COMPANY_RESEARCH_CACHE_TTL_SECONDS,
+            version=config_version
+        )
+        self.crew_cache = CrewResultCache(
+            maxsize=settings.CREW_CACHE_MAX_SIZE,
+            ttl=settings.CREW_CACHE_TTL_SECONDS,
+            version=config_version
+        )
         
     def _initialize_tools(self) -> dict[str, Any]:
         """
         Initializes and returns the tools required by the agents.
 
         Currently initializes:
-        - `web_scraper`: ScrapeWebsiteTool for fetching web content.
-        - `search_tool`: SerperDevTool for performing web searches.
+        - `web_scraper`: PooledScrapeWebsiteTool for fetching web content over a
+          pooled, keep-alive HTTP client.
+        - `search_tool`: PooledSerperDevTool for performing web searches over the
+          same pooled client.
+        - `batch_scraper`: BatchScrapeWebsiteTool for reading several result pages
+          concurrently.
         
         These tools are stored in and returned as a dictionary, which is assigned to `self.tools`.
 
@@ -71,8 +130,9 @@ class JobPostingAnalyzer:
             dict[str, Any]: A dictionary mapping tool names to their initialized instances.
         """
         return {
-            "web_scraper": ScrapeWebsiteTool(),
-            "search_tool": SerperDevTool(api_key=settings.SERPER_API_KEY)
+            "web_scraper": PooledScrapeWebsiteTool(http_client=self.http_client),
+            "search_tool": PooledSerperDevTool(http_client=self.http_client),
+            "batch_scraper": BatchScrapeWebsiteTool(http_client=self.http_client)
         }
     
     
@@ -99,7 +159,7 @@ class JobPostingAnalyzer:
             ),
             "company_researcher": Agent(
                 **self.agents_config["company_researcher_agent"],
-                tools=[self.tools["search_tool"]],
+                tools=[self.tools["search_tool"], self.tools["batch_scraper"]],
                 llm=self.llm
             ),
             "insights_compiler": Agent(
@@ -118,66 +178,74 @@ class JobPostingAnalyzer:
         Returns:
             str: Extracted company name or default if not found
         """
-        extraction_methods = [
-            ("Company Name:", 1),
-            ("Company:", 1),
-            ("Organization:", 1),
-            ("Employer:", 1)
-        ]
-        
-        for prefix, split_part in extraction_methods:
-            if prefix in job_details:
-                return job_details.split(prefix)[split_part].split("\n")[0].strip()
-        
+        match = _COMPANY_NAME_PATTERN.search(job_details)
+        if match and (company_name := match.group(1).strip()):
+            return company_name
+
         logger.warning("Company name not found in job details, using default")
-        return "Unknown Company"
+        return UNKNOWN_COMPANY
     
-    def generate_insights(self, job_url: str) -> str:
+    def _create_crew(self, agent_name: str, task_name: str) -> Crew:
         """
-        Generates comprehensive insights about a job posting from its URL.
+        Builds a single-agent, single-task Crew for one analysis step.
 
-        This method orchestrates the analysis process:
-        1. Scrapes job details from the provided `job_url` using `_scrape_job_details`.
-        2. Extracts the company name from the scraped details using `_extract_company_name`.
-        3. Researches the company using `_research_company`.
-        4. Compiles the final insights report using `_compile_insights`.
-        
         Args:
-            job_url (str): The URL of the job posting to analyze.
-            
+            agent_name (str): Key of the agent in `self.agents`.
+            task_name (str): Key of the task configuration in `self.tasks_config`.
+
+        The agent is copied because an Agent keeps its executor and the task
+        it is running on itself, so concurrent steps must not share one.
+
         Returns:
-            str: A formatted insights report combining job details and company research.
-            
-        Raises:
-            CustomExceptionError: If any step in the analysis process fails.
+            Crew: A Crew ready to be kicked off for the given step.
+        """
+        agent = self.agents[agent_name].copy()
+        task = Task(
+            **self.tasks_config[task_name],
+            agent=agent
+        )
+        return Crew(
+            agents=[agent],
+            tasks=[task],
+            verbose=settings.CREW_VERBOSE
+        )
+
+    @staticmethod
+    def _company_key(company_name: str) -> str:
+        """Normalize a company name for cache lookups"""
+        return " ".join(company_name.lower().split())
+
+    @staticmethod
+    def _research_inputs(company_name: str, search_results: str) -> dict[str, str]:
+        """Inputs of the research task; search results are optional"""
+        return {"company_name": company_name, "search_results": search_results or "None"}
+
+    def _search_posting(self, job_url: str) -> str:
+        """
+        Run a plain web search for the posting URL, without going through an agent.
+
+        Used when the URL does not name the employer: the results usually do, and
+        handing them to the research agent saves it a search round trip. Failures
+        only lose that head start, so they are logged and give an empty result.
         """
         try:
-            # Step 1: Scrape job details
-            job_details = self._scrape_job_details(job_url)
-            
-            # Step 2: Extract company name
-            company_name = self._extract_company_name(job_details)
-            logger.info(f"Extracted company name: {company_name}")
-            
-            # Step 3: Research company
-            company_research = self._research_company(company_name)
-            
-            # Step 4: Compile final insights
-            final_insights = self._compile_insights(job_details, company_research)
-            
-            return final_insights
-            
+            results = self.tools["search_tool"].run(search_query=job_url)
         except Exception as e:
-            logger.error(f"Failed to generate job insights: {str(e)}")
-            raise CustomExceptionError("Job analysis failed:") from e
-    
-    def _scrape_job_details(self, job_url: str) -> str:
+            logger.warning("Search for job posting URL failed: %s", e)
+            return ""
+        return results if isinstance(results, str) else orjson.dumps(results).decode()
+
+    @staticmethod
+    def _clean_insights(raw_insights: str) -> str:
+        """Strip markdown code fences from the compiled insights report"""
+        return _MARKDOWN_FENCE_PATTERN.sub("", raw_insights).strip()
+
+    async def extract_job(self, job_url: str) -> str:
         """
         Executes the job scraping task for the given URL.
 
-        Creates a specific task for the 'job_scraper' agent using configurations
-        from `self.tasks_config["scrape_job_task"]`. It then runs a temporary Crew
-        with this agent and task to scrape the job details.
+        Runs a single-step crew with the 'job_scraper' agent and the
+        `scrape_job_task` configuration. Results are cached per normalized URL.
 
         Args:
             job_url (str): The URL of the job posting to scrape.
@@ -185,58 +253,48 @@ class JobPostingAnalyzer:
         Returns:
             str: The raw text content scraped from the job posting URL.
         """
-        scrape_task = Task(
-            **self.tasks_config["scrape_job_task"],
-            agent=self.agents["job_scraper"]
-        )
-        
-        scrape_crew = Crew(
-            agents=[self.agents["job_scraper"]],
-            tasks=[scrape_task],
-            verbose=True
+        async def run() -> str:
+            scrape_crew = self._create_crew("job_scraper", "scrape_job_task")
+            return (await scrape_crew.kickoff_async(inputs={"job_url": job_url})).raw
+
+        return await self.scrape_cache.get_or_run_async(
+            "scrape_job", {"job_url": normalize_url(job_url)}, run
         )
-        
-        result = scrape_crew.kickoff(inputs={"job_url": job_url})
-        return result.raw
-    
-    def _research_company(self, company_name: str) -> str:
+
+    async def research_company(self, company_name: str, search_results: str = "") -> str:
         """
         Executes the company research task for the given company name.
 
-        Creates a specific task for the 'company_researcher' agent using
-        configurations from `self.tasks_config["research_company_task"]`.
-        A temporary Crew is run with this agent and task to gather company information.
+        Runs a single-step crew with the 'company_researcher' agent and the
+        `research_company_task` configuration. Results are cached per normalized
+        company name.
 
         Args:
             company_name (str): The name of the company to research.
+            search_results (str, optional): Search results already gathered for the
+                                            posting, offered to the agent. Defaults to "".
 
         Returns:
             str: The raw text content of the company research findings.
         """
-        research_task = Task(
-            **self.tasks_config["research_company_task"],
-            agent=self.agents["company_researcher"]
-        )
-        
-        research_crew = Crew(
-            agents=[self.agents["company_researcher"]],
-            tasks=[research_task],
-            verbose=True
+        async def run() -> str:
+            research_crew = self._create_crew("company_researcher", "research_company_task")
+            result = await research_crew.kickoff_async(
+                inputs=self._research_inputs(company_name, search_results)
+            )
+            return result.raw
+
+        return await self.research_cache.get_or_run_async(
+            "research_company", {"company_name": self._company_key(company_name)}, run
         )
-        
-        result = research_crew.kickoff(inputs={"company_name": company_name})
-        return result.raw
-    
-    def _compile_insights(self, job_details: str, company_research: str) -> str:
+
+    async def compile_insights(self, job_details: str, company_research: str) -> str:
         """
         Compiles the final insights report from job details and company research.
 
-        Creates a specific task for the 'insights_compiler' agent using
-        configurations from `self.tasks_config["compile_insights_task"]`.
-        A temporary Crew runs with this agent and task, taking the scraped
-        job details and company research as input to produce a final report.
-        
-        The output is cleaned of markdown formatting.
+        Runs a single-step crew with the 'insights_compiler' agent and the
+        `compile_insights_task` configuration, and strips markdown code fences
+        from its output. Results are cached per inputs.
 
         Args:
             job_details (str): The scraped job details text.
@@ -245,22 +303,108 @@ class JobPostingAnalyzer:
         Returns:
             str: The compiled and cleaned insights report.
         """
-        compile_task = Task(
-            **self.tasks_config["compile_insights_task"],
-            agent=self.agents["insights_compiler"]
-        )
-        
-        compile_crew = Crew(
-            agents=[self.agents["insights_compiler"]],
-            tasks=[compile_task],
-            verbose=True
-        )
-        
-        result = compile_crew.kickoff(inputs={
+        inputs = {
             "job_details": job_details,
             "company_research": company_research
-        })
-        
-        # Clean up markdown formatting if present
-        insights = result.raw.replace("```markdown", "").replace("```", "").strip()
-        return insights
\ No newline at end of file
+        }
+
+        async def run() -> str:
+            compile_crew = self._create_crew("insights_compiler", "compile_insights_task")
+            return self._clean_insights((await compile_crew.kickoff_async(inputs=inputs)).raw)
+
+        return await self.crew_cache.get_or_run_async("compile_insights", inputs, run)
+
+    @staticmethod
+    def _same_company(first: str, second: str) -> bool:
+        """Loosely compare two company names, ignoring case, spacing and punctuation"""
+        first, second = (re.sub(r"[^a-z0-9]", "", name.lower()) for name in (first, second))
+        return bool(first and second) and (first in second or second in first)
+
+    async def generate_insights_async(self, job_url: str) -> str:
+        """
+        Generates comprehensive insights about a job posting from its URL.
+
+        The posting is scraped, the company named in it is researched, and both
+        are compiled into a report. Each step runs through `Crew.kickoff_async`,
+        which in CrewAI runs the blocking `kickoff` on a worker thread, so the
+        event loop stays free but every running step still occupies a thread
+        of the default executor. When the URL
+        names the employer (see `guess_company_from_url`), company research starts
+        speculatively alongside the scrape. Its result is used if the company
+        extracted from the scraped posting matches (or cannot be extracted);
+        otherwise the company is researched again under the extracted name.
+        When the URL gives no name, a plain web search for the URL runs alongside
+        the scrape instead and its results are handed to the research step.
+
+        Args:
+            job_url (str): The URL of the job posting to analyze.
+
+        Returns:
+            str: A formatted insights report combining job details and company research.
+
+        Raises:
+            CustomExceptionError: If any step in the analysis process fails.
+        """
+        speculative_research: Optional[asyncio.Task] = None
+        posting_search: Optional[asyncio.Future] = None
+        try:
+            guessed_name = guess_company_from_url(job_url)
+            if guessed_name is not None:
+                logger.info("Researching company guessed from URL: %s", guessed_name)
+                speculative_research = asyncio.ensure_future(self.research_company(guessed_name))
+            else:
+                # No name to research yet, but search results for the URL are
+                # ready by the time the scrape has found the company
+                posting_search = asyncio.ensure_future(
+                    asyncio.to_thread(self._search_posting, job_url)
+                )
+
+            job_details = await self.extract_job(job_url)
+
+            company_name = self._extract_company_name(job_details)
+            logger.info("Extracted company name: %s", company_name)
+
+            if speculative_research is not None and (
+                company_name == UNKNOWN_COMPANY or self._same_company(company_name, guessed_name)
+            ):
+                company_research = await speculative_research
+            else:
+                if speculative_research is not None:
+                    logger.info("Guessed company %s does not match, researching again", guessed_name)
+                    # The worker thread finishes on its own; its result is discarded
+                    speculative_research.cancel()
+                search_results = await posting_search if posting_search is not None else ""
+                company_research = await self.research_company(company_name, search_results)
+
+            return await self.compile_insights(job_details, company_research)
+
+        except Exception as e:
+            for pending in (speculative_research, posting_search):
+                if pending is not None:
+                    pending.cancel()
+            logger.error("Failed to generate job insights: %s", e)
+            raise CustomExceptionError("Job analysis failed:") from e
+
+
+# Singleton instance for the service, built on first use
+_job_posting_analyzer: Optional[JobPostingAnalyzer] = None
+_job_posting_analyzer_lock = threading.Lock()
+
+
+def get_job_posting_analyzer() -> JobPostingAnalyzer:
+    """
+    Get the process-wide job posting analyzer, creating it on first use.
+
+    Building the analyzer loads the YAML configurations and sets up the tools
+    and agents, so it happens once per process instead of per request, and not
+    at import time.
+
+    Returns:
+        JobPostingAnalyzer: Shared job posting analyzer
+    """
+    global _job_posting_analyzer
+    if _job_posting_analyzer is None:
+        with _job_posting_analyzer_lock:
+            if _job_posting_analyzer is None:
+                _job_posting_analyzer = JobPostingAnalyzer()
+    return _job_posting_analyzer
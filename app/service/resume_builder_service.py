@@ -7,16 +7,24 @@ such as an existing resume, job posting URL, GitHub profile, and a personal writ
 then processes these through various agents (researcher, profiler, resume strategist,
 interview preparer) to produce a customized resume and related advice.
 
-A singleton instance (`resume_builder_object`) is provided for use across the application.
+A lazily created singleton (`get_resume_builder()`) is provided for use across the application.
 """
 
-import json
+import contextlib
+import hashlib
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
 from typing import Any, Dict, Optional  # noqa: UP035
 
+import orjson
 import yaml
+from cachetools import LRUCache
 from crewai import Agent, Crew, Task
-from crewai_tools import PDFSearchTool, ScrapeWebsiteTool, SerperDevTool
+from crewai_tools import PDFSearchTool
 from pydantic import ValidationError
 
 from app.api.error_handlers import CustomExceptionError
@@ -24,9 +32,10 @@ from app.core.config import settings
 from app.core.logging import get_logger
 from app.llm.provider import GoogleProvider
 from app.schemas.resume_schema import ResumeData
-from app.utils.file_handler import FileHandler
-from app.utils.json_validator import validate_tailor_resume_json
-from app.utils.pdf import PDFProcessor
+from app.schemas.scrape_tool import BatchScrapeWebsiteTool, PooledScrapeWebsiteTool
+from app.schemas.search_tool import PooledSerperDevTool
+from app.utils.crew_cache import CrewResultCache
+from app.utils.url import normalize_url
 from app.utils.yaml_config import load_yaml_configs
 
 yaml_file_path = {
@@ -34,6 +43,36 @@ yaml_file_path = {
     "tasks": "app/agents_config/resume_builder/tasks.yaml"
 }
 
+RESUME_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Uploaded resumes, removed once their request is done
+UPLOAD_DIRECTORY = "data/uploads"
+
+# Opening and closing markdown code fences, removed in one pass
+_MARKDOWN_FENCE_PATTERN = re.compile(r"```(?:markdown)?")
+
+
+@lru_cache(maxsize=1)
+def _resume_embedder_config() -> dict[str, Any]:
+    """
+    Embedder configuration for the resume `PDFSearchTool`.
+
+    When `RESUME_EMBEDDER_ONNX_FILE` is set and the ONNX runtime is installed,
+    sentence-transformers loads that int8 export of the model through
+    onnxruntime instead of the FP32 PyTorch weights.
+    """
+    config: dict[str, Any] = {"model": RESUME_EMBEDDING_MODEL}
+    onnx_file = settings.RESUME_EMBEDDER_ONNX_FILE
+    if not onnx_file:
+        return config
+    if find_spec("optimum") is None or find_spec("onnxruntime") is None:
+        get_logger(__name__).warning(
+            "optimum/onnxruntime not installed, using FP32 resume embedding model"
+        )
+        return config
+    config["model_kwargs"] = {"backend": "onnx", "model_kwargs": {"file_name": onnx_file}}
+    return config
+
 class ResumeBuilderService:
     """
     Service class for generating personalized resumes and interview preparation
@@ -48,12 +87,15 @@ class ResumeBuilderService:
     Key Attributes:
         logger (Logger): Service-specific logger instance.
         llm (Any): The language model provider instance (e.g., Google Gemini).
-        search_tool (SerperDevTool): Tool for web searching.
-        scrape_tool (ScrapeWebsiteTool): Tool for scraping website content.
+        search_tool (PooledSerperDevTool): Tool for web searching.
+        scrape_tool (PooledScrapeWebsiteTool): Tool for scraping website content.
+        batch_scrape_tool (BatchScrapeWebsiteTool): Tool for scraping several pages concurrently.
         upload_directory (str): Directory path for storing uploaded files.
         configs (dict): Loaded YAML configurations for agents and tasks.
         agents (dict[str, Agent]): Dictionary of initialized CrewAI agents.
         tasks (dict[str, Task]): Dictionary of initialized CrewAI tasks.
+        crew (Crew): The tailoring crew, built once and copied for each request.
+        result_cache (CrewResultCache): Successful tailoring results, keyed by inputs.
     """
     def __init__(self, llm_provider: Any):
         """
@@ -69,112 +111,177 @@ class ResumeBuilderService:
         # Logger setup
         self.logger = get_logger(__name__)
         
-        # Tools and LLM setup
+        # LLM setup
         self.llm = llm_provider
-        self.search_tool = SerperDevTool(api_key=settings.SERPER_API_KEY)
-        self.scrape_tool = ScrapeWebsiteTool()
 
         # Upload directory configuration
-        self.upload_directory = "data/uploads"
+        self.upload_directory = UPLOAD_DIRECTORY
         os.makedirs(self.upload_directory, exist_ok=True)
         self.configs = load_yaml_configs(yaml_file_path)
 
-        
-        # Initialize agents and tools
-        self.agents = self._initialize_agents()
-        self.tasks = self._initialize_tasks()
+        # Tools, agents, tasks and crew, shared by instances with the same LLM and configuration
+        configs_json = orjson.dumps(self.configs, option=orjson.OPT_SORT_KEYS)
+        (
+            self.search_tool, self.scrape_tool, self.batch_scrape_tool,
+            self.agents, self.tasks, self.crew
+        ) = self._build_crew(self.llm, configs_json)
+        # Position of the strategist's output in the crew's task outputs
+        self._resume_strategy_index = list(self.tasks).index("resume_strategy")
+
+        # Agents that search the user's resume, and the resume tools by content hash
+        self._pdf_tool_roles = {
+            self.agents[name].role
+            for name in ("profiler", "resume_strategist", "interview_preparer")
+        }
+        self._pdf_tool_cache: LRUCache = LRUCache(maxsize=32)
+        self._pdf_tool_cache_lock = threading.Lock()
+
+        # Tailoring results keyed by resume content and request inputs
+        self.result_cache = CrewResultCache(
+            maxsize=settings.CREW_CACHE_MAX_SIZE,
+            ttl=settings.CREW_CACHE_TTL_SECONDS
+        )
     
     
-    def _initialize_agents(self) -> dict[str, Agent]:
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _build_crew(llm: Any, configs_json: bytes) -> tuple[Any, ...]:
+        """
+        Builds the tools, agents, tasks and crew for one LLM and configuration.
+
+        Cached per LLM handle and serialized configuration, so every service
+        instance built from the same YAML files shares one set of validated
+        `Agent` and `Task` objects. Requests never modify them: `_run_crew`
+        works on a copy of the crew.
+
+        Args:
+            llm (Any): The language model provider instance.
+            configs_json (bytes): The agent and task configurations, serialized with
+                                  sorted keys so equal configurations share a cache entry.
+
+        Returns:
+            tuple[Any, ...]: The search, scrape and batch scrape tools, the agents and
+                             tasks dictionaries, and the crew.
+        """
+        configs = orjson.loads(configs_json)
+        # All three tools share the process-wide keep-alive HTTP client
+        search_tool = PooledSerperDevTool()
+        scrape_tool = PooledScrapeWebsiteTool()
+        batch_scrape_tool = BatchScrapeWebsiteTool()
+
+        agents = ResumeBuilderService._initialize_agents(
+            configs["agents"], llm, search_tool, scrape_tool, batch_scrape_tool
+        )
+        tasks = ResumeBuilderService._initialize_tasks(configs["tasks"], agents)
+        crew = Crew(
+            llm=llm,
+            agents=list(agents.values()),
+            tasks=list(tasks.values()),
+            verbose=settings.CREW_VERBOSE
+        )
+        return search_tool, scrape_tool, batch_scrape_tool, agents, tasks, crew
+
+    @staticmethod
+    def _initialize_agents(
+        agents_config: dict[str, Any],
+        llm: Any,
+        search_tool: PooledSerperDevTool,
+        scrape_tool: PooledScrapeWebsiteTool,
+        batch_scrape_tool: BatchScrapeWebsiteTool
+    ) -> dict[str, Agent]:
         """
         Initializes and returns the CrewAI agents for the resume building process.
 
-        Uses configurations loaded into `self.configs["agents"]` and the initialized
-        `self.llm`. Agents include a researcher, profiler, resume strategist, and
+        Agents include a researcher, profiler, resume strategist, and
         interview preparer, each equipped with appropriate tools.
 
+        Args:
+            agents_config (dict[str, Any]): The agent configurations from the YAML file.
+            llm (Any): The language model provider instance.
+            search_tool (PooledSerperDevTool): Tool for web searching.
+            scrape_tool (PooledScrapeWebsiteTool): Tool for scraping website content.
+            batch_scrape_tool (BatchScrapeWebsiteTool): Tool for scraping several pages concurrently.
+
         Returns:
             dict[str, Agent]: A dictionary mapping agent names to their `Agent` instances.
 
         Raises:
             CustomExceptionError: If a required agent configuration key is missing.
         """
-        agents_config = self.configs["agents"]
-        
         try:
             agents = {
                 "researcher": Agent(
                     **agents_config["researcher_agent"],
-                    llm=self.llm,
-                    tools=[self.scrape_tool, self.search_tool],                    
+                    llm=llm,
+                    tools=[scrape_tool, batch_scrape_tool, search_tool],
                 ),
                 "profiler": Agent(
                     **agents_config["profiler_agent"],
-                    llm=self.llm,
-                    tools=[self.scrape_tool, self.search_tool]
+                    llm=llm,
+                    tools=[scrape_tool, search_tool]
                 ),
                 "resume_strategist": Agent(
                     **agents_config["resume_strategist_agent"],
-                    llm=self.llm,
+                    llm=llm,
                     instructions = "Always format your responses as valid JSON objects. Never include plain text.",
                     
-                    tools=[self.scrape_tool, self.search_tool]
+                    tools=[scrape_tool, search_tool]
                 ),
                 "interview_preparer": Agent(
                     **agents_config["interview_preparer_agent"],
-                    llm=self.llm,
-                    tools=[self.scrape_tool, self.search_tool]
+                    llm=llm,
+                    tools=[scrape_tool, search_tool]
                 )
             }
             return agents
         except KeyError as e:
-            self.logger.error(f"Agent configuration missing: {e}")
+            get_logger(__name__).error("Agent configuration missing: %s", e)
             raise CustomExceptionError("Missing agent configuration: ") from e
     
-    def _initialize_tasks(self) -> dict[str, Task]:
+    @staticmethod
+    def _initialize_tasks(tasks_config: dict[str, Any], agents: dict[str, Agent]) -> dict[str, Task]:
         """
         Initializes and returns the CrewAI tasks for the resume building process.
 
-        Uses configurations from `self.configs["tasks"]` and the initialized agents
-        from `self.agents`. Defines tasks for research, profiling, resume strategy
-        (outputting JSON to `data/json/tailor_resume.json`), and interview preparation.
+        Defines tasks for research, profiling, resume strategy
+        (producing `ResumeData` JSON), and interview preparation.
         Sets up dependencies (contexts) between tasks.
 
+        Args:
+            tasks_config (dict[str, Any]): The task configurations from the YAML file.
+            agents (dict[str, Agent]): The agents built by `_initialize_agents`.
+
         Returns:
             dict[str, Task]: A dictionary mapping task names to their `Task` instances.
 
         Raises:
             CustomExceptionError: If a required task configuration key is missing.
         """
-        tasks_config = self.configs["tasks"]
-        reusume_tailor_path = "data/json/tailor_resume.json" # Define path for resume strategy output
-        
         try:
             # Create tasks referencing initialized agents
             research_task = Task(
                 **tasks_config["research_task"],
-                agent=self.agents["researcher"],
+                agent=agents["researcher"],
                 async_execution=True
             )
             
             profile_task = Task(
                 **tasks_config["profile_task"],
-                agent=self.agents["profiler"],
+                agent=agents["profiler"],
                 async_execution=True
             )
             
             resume_strategy_task = Task(
                 **tasks_config["resume_strategy_task"],
                 output_json=ResumeData,
-                output_file=reusume_tailor_path,
                 context=[research_task, profile_task],
-                agent=self.agents["resume_strategist"]
+                agent=agents["resume_strategist"]
             )
             
             interview_preparation_task = Task(
                 **tasks_config["interview_preparation_task"],
                 context=[research_task, profile_task, resume_strategy_task],
-                agent=self.agents["interview_preparer"]
+                agent=agents["interview_preparer"]
             )
             
             return {
@@ -184,12 +291,92 @@ class ResumeBuilderService:
                 "interview_prep": interview_preparation_task
             }
         except KeyError as e:
-            self.logger.error(f"Task configuration missing: {e}")
+            get_logger(__name__).error("Task configuration missing: %s", e)
             raise CustomExceptionError("Missing task configuration: ") from e
     
+    def _get_pdf_search_tool(self, resume_digest: str, resume_path: str) -> PDFSearchTool:
+        """
+        Returns the `PDFSearchTool` for a resume, building and embedding it on first use.
+
+        Tools are cached by the SHA-256 of the resume content, so a resume submitted
+        again (for another job posting, say) reuses its embedded chunks.
+
+        Args:
+            resume_digest (str): SHA-256 of the resume PDF content.
+            resume_path (str): Path of the saved resume PDF, read on a cache miss.
+
+        Returns:
+            PDFSearchTool: A search tool over the resume.
+        """
+        with self._pdf_tool_cache_lock:
+            pdf_search_tool = self._pdf_tool_cache.get(resume_digest)
+        if pdf_search_tool is not None:
+            return pdf_search_tool
+
+        pdf_search_tool = PDFSearchTool(
+            pdf=resume_path,
+            config={
+                "llm": {
+                    "provider": "google",
+                    "config": {
+                        "model": "gemini-2.0-flash",
+                        "temperature": 0.7
+                    }
+                },
+                "embedder": {
+                    "provider": "huggingface",
+                    "config": _resume_embedder_config()
+                }
+            }
+        )
+        with self._pdf_tool_cache_lock:
+            self._pdf_tool_cache[resume_digest] = pdf_search_tool
+        return pdf_search_tool
+
+    def _run_crew(
+        self,
+        resume_path: str,
+        resume_digest: str,
+        inputs: dict[str, str]
+    ) -> dict[str, Any]:
+        """
+        Runs the resume tailoring crew and collects its markdown and JSON outputs.
+
+        Args:
+            resume_path (str): Path of the saved resume PDF.
+            resume_digest (str): SHA-256 of the resume PDF content.
+            inputs (dict[str, str]): The crew inputs (job posting URL, GitHub URL, write-up).
+
+        Returns:
+            dict[str, Any]: `{"status": "success", "result": <markdown_output>, "tailo_resume_json": <json_data>}`
+        """
+        pdf_search_tool = self._get_pdf_search_tool(resume_digest, resume_path)
+
+        # Per-request copy of the crew, so the resume tool is not added to the shared agents
+        job_application_crew = self.crew.copy()
+        for agent in job_application_crew.agents:
+            if agent.role in self._pdf_tool_roles:
+                agent.tools = [*agent.tools, pdf_search_tool]
+
+        # Execute crew workflow
+        result = job_application_crew.kickoff(inputs=inputs)
+        # The strategist's output is already parsed into `ResumeData` JSON in memory
+        strategy_output = result.tasks_output[self._resume_strategy_index]
+        json_data = strategy_output.json_dict
+        if json_data is None:
+            json_data = orjson.loads(strategy_output.raw)
+
+        markdown_result = _MARKDOWN_FENCE_PATTERN.sub("", result.raw).strip()
+
+        return {
+            "status": "success",
+            "result": markdown_result,
+            "tailo_resume_json": json_data
+        }
+
     def generate_resume(
         self,
-        resume_file: Any, # Should be UploadFile from FastAPI
+        resume_path: str,
         job_posting_url: str,
         github_url: Optional[str] = None,
         personal_writeup: Optional[str] = None
@@ -198,20 +385,27 @@ class ResumeBuilderService:
         Generates a tailored resume and interview preparation materials.
 
         This method orchestrates the entire resume building process:
-        1. Saves the uploaded resume PDF to a local directory.
-        2. Initializes a `PDFSearchTool` with the saved resume.
-        3. Adds the `PDFSearchTool` to the relevant agents (profiler, strategist, preparer).
-        4. Creates and runs a CrewAI `Crew` with all configured agents and tasks.
+        1. Takes the resume PDF already streamed to `self.upload_directory` by the route.
+        2. Gets the `PDFSearchTool` for the resume, built once per resume content.
+        3. Copies `self.crew` and adds the `PDFSearchTool` to the copied profiler,
+           strategist and preparer agents.
+        4. Runs the copied crew.
         5. Inputs include the job posting URL, GitHub URL, and personal write-up.
-        6. After the crew execution, it validates the JSON output from the resume strategy task.
+        6. After the crew execution, it takes the resume strategy task's `ResumeData` JSON
+           from the crew output.
         7. Cleans up markdown formatting from the final raw output.
-        8. Loads the validated JSON data.
+        8. Falls back to parsing the strategy task's raw output if it was not converted.
         9. Returns a dictionary containing the status, the markdown result, and the resume JSON data.
         10. Handles `ValidationError` for input issues and other exceptions for general errors.
-        11. Cleans up temporary uploaded files in a `finally` block.
+        11. Removes this request's uploaded resume in a `finally` block; the cached
+            `PDFSearchTool` keeps its embedded chunks, not the file.
+
+        Steps 2-9 run in `_run_crew`; successful results are cached in
+        `self.result_cache` by resume content, normalized job posting URL,
+        GitHub URL and write-up, so a repeated request skips the crew.
 
         Args:
-            resume_file (Any): The uploaded resume file object (typically FastAPI's `UploadFile`).
+            resume_path (str): Path of the saved resume PDF.
             job_posting_url (str): URL of the target job posting.
             github_url (Optional[str]): URL of the user's GitHub profile. Defaults to None.
             personal_writeup (Optional[str]): A personal write-up or summary from the user. Defaults to None.
@@ -222,100 +416,144 @@ class ResumeBuilderService:
                 On error: `{"status": "error", "message": <error_message>, "details": <error_details>}`
         """
         try:
-            # Process PDF file
-            reusume_tailor_path = "data/json/tailor_resume.json"
-            pdf_processor = PDFProcessor(resume_file)
-            print(self.upload_directory)
-            processed_file_path = pdf_processor.save_file(self.upload_directory)
-            
-            # Add PDF reading tool to agents
-            pdf_search_tool = PDFSearchTool(
-                pdf=processed_file_path,
-                config={
-                    "llm": {
-                        "provider": "google",
-                        "config": {
-                            "model": "gemini-2.0-flash",
-                            "temperature": 0.7
-                        }
-                    },
-                    "embedder": {
-                        "provider": "huggingface",
-                        "config": {
-                            "model": "sentence-transformers/all-MiniLM-L6-v2"
-                        }
-                    }
-                }
+            resume_digest = self._hash_resume(resume_path)
+            return self._generate(
+                resume_path, resume_digest, job_posting_url, github_url, personal_writeup
             )
-            
-            # Update agent tools with PDF search
-            for agent in [
-                self.agents["profiler"], 
-                self.agents["resume_strategist"], 
-                self.agents["interview_preparer"]
-            ]:
-                agent.tools.append(pdf_search_tool)
-            
-            # Create Crew
-            job_application_crew = Crew(
-                llm=self.llm,
-                agents=list(self.agents.values()),
-                tasks=list(self.tasks.values()),
-                verbose=True
-            )
-            
+        except OSError as e:
+            self.logger.error("Resume generation error: %s", e)
+            return {
+                "status": "error",
+                "message": "Failed to generate resume",
+                "details": str(e)
+            }
+        finally:
+            # Only this request's file: scanning the whole directory here delayed every
+            # response, and stale leftovers are swept at startup instead
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(resume_path)
+
+    def generate_resumes(
+        self,
+        resume_path: str,
+        job_posting_urls: list[str],
+        github_url: Optional[str] = None,
+        personal_writeup: Optional[str] = None,
+        max_workers: int = 4
+    ) -> list[dict[str, Any]]:
+        """
+        Tailors one resume for several job postings in a single call.
+
+        The resume is hashed and its `PDFSearchTool` built once for the whole batch,
+        then one crew run per job posting is executed on a small thread pool. Each
+        run works on its own `self.crew.copy()`, as in `generate_resume`.
+
+        Args:
+            resume_path (str): Path of the saved resume PDF.
+            job_posting_urls (list[str]): URLs of the target job postings.
+            github_url (Optional[str]): URL of the user's GitHub profile. Defaults to None.
+            personal_writeup (Optional[str]): A personal write-up or summary from the user. Defaults to None.
+            max_workers (int, optional): Maximum number of crews run at once. Defaults to 4.
+
+        Returns:
+            list[dict[str, Any]]: One `generate_resume` style result per job posting,
+                                  in the order of `job_posting_urls`.
+        """
+        try:
+            resume_digest = self._hash_resume(resume_path)
+            # Embed the resume before fanning out, so the runs don't race to build it
+            self._get_pdf_search_tool(resume_digest, resume_path)
+
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(job_posting_urls))),
+                thread_name_prefix="resume-batch"
+            ) as executor:
+                return list(executor.map(
+                    lambda url: self._generate(
+                        resume_path, resume_digest, url, github_url, personal_writeup
+                    ),
+                    job_posting_urls
+                ))
+        except OSError as e:
+            self.logger.error("Resume generation error: %s", e)
+            error = {
+                "status": "error",
+                "message": "Failed to generate resume",
+                "details": str(e)
+            }
+            return [error for _ in job_posting_urls]
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(resume_path)
+
+    @staticmethod
+    def _hash_resume(resume_path: str) -> str:
+        """Return the SHA-256 of a saved resume's content"""
+        with open(resume_path, "rb") as resume_file:
+            return hashlib.sha256(resume_file.read()).hexdigest()
+
+    def _generate(
+        self,
+        resume_path: str,
+        resume_digest: str,
+        job_posting_url: str,
+        github_url: Optional[str],
+        personal_writeup: Optional[str]
+    ) -> dict[str, Any]:
+        """Run or reuse one tailoring result, turning failures into an error result"""
+        try:
             # Prepare inputs
             inputs = {
                 "job_posting_url": job_posting_url,
                 "github_url": github_url or "",
                 "personal_writeup": personal_writeup or ""
             }
-            
-                    
-            # Execute crew workflow
-            result = job_application_crew.kickoff(inputs=inputs)
-            if os.path.isfile(reusume_tailor_path):
-                try:
-                    validate_tailor_resume_json(reusume_tailor_path)
-                except Exception as e:
-                    print(f"{reusume_tailor_path}--{e}")
-            markdown_result_raw = result.raw
-
-
-            markdown_result = markdown_result_raw.replace("```markdown", "").replace("```", "").strip()
+            cache_inputs = {
+                **inputs,
+                "job_posting_url": normalize_url(job_posting_url),
+                "resume_sha256": resume_digest
+            }
 
-            with open("data/json/tailor_resume.json") as json_file:
-                        json_data = json.load(json_file)
+            return self.result_cache.get_or_run(
+                "generate_resume",
+                cache_inputs,
+                lambda: self._run_crew(resume_path, resume_digest, inputs)
+            )
 
-            return {
-                "status": "success",
-                "result": markdown_result,
-                "tailo_resume_json": json_data
-            }
-                
-            
-        
         except ValidationError as ve:
-            self.logger.error(f"Input validation error: {ve}")
+            self.logger.error("Input validation error: %s", ve)
             return {
                 "status": "error",
                 "message": "Invalid input data",
                 "details": str(ve)
             }
         except Exception as e:
-            self.logger.error(f"Resume generation error: {e}")
+            self.logger.error("Resume generation error: %s", e)
             return {
                 "status": "error",
                 "message": "Failed to generate resume",
                 "details": str(e)
             }
-        finally:
-            # Clean up temporary files if needed
-            FileHandler.cleanup_temp_files(self.upload_directory)
 
 
+# Singleton instance for the service, built on first use
+_resume_builder: Optional[ResumeBuilderService] = None
+_resume_builder_lock = threading.Lock()
 
 
-llm_provider = GoogleProvider().gemini_llm()
-resume_builder_object =  ResumeBuilderService(llm_provider)
+def get_resume_builder() -> ResumeBuilderService:
+    """
+    Get the process-wide resume builder, creating it on first use.
+
+    Building the service sets up the LLM handle, tools, agents and crew, so it
+    is deferred until a request needs it instead of running at import time.
 
+    Returns:
+        ResumeBuilderService: Shared resume builder
+    """
+    global _resume_builder
+    if _resume_builder is None:
+        with _resume_builder_lock:
+            if _resume_builder is None:
+                _resume_builder = ResumeBuilderService(GoogleProvider().gemini_llm())
+    return _resume_builder
@@ -0,0 +1,172 @@
+"""
+Semantic Cache.
+
+This module provides the `SemanticCache` class, an in-memory cache keyed by
+normalized query embeddings. Lookups run an inner-product search against a FAISS
+`IndexFlatIP` of previously answered queries and return the stored answer when
+the cosine similarity clears a threshold, so paraphrased questions can skip the
+full RAG + LLM pipeline. Entries expire after a TTL and the least recently used
+entry is evicted once the cache is full.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import faiss
+import numpy as np
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """
+    Stores a cached answer together with its bookkeeping data.
+    """
+    answer: Any
+    created_at: float
+    hits: int = 0
+
+
+class SemanticCache:
+    """
+    A thread-safe TTL + LRU cache that matches queries by embedding similarity.
+
+    Embeddings are expected to be L2-normalized so that the inner product
+    returned by FAISS equals the cosine similarity.
+
+    Attributes:
+        dim (int): Dimensionality of the query embeddings.
+        threshold (float): Minimum cosine similarity for a lookup to count as a hit.
+        duplicate_threshold (float): Similarity above which a new entry replaces
+                                     an existing one instead of being added; never
+                                     below `threshold`, so entries that don't answer
+                                     each other's lookups aren't collapsed.
+        ttl_seconds (float): Lifetime of an entry in seconds.
+        max_size (int): Maximum number of entries kept before LRU eviction.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        threshold: float = 0.85,
+        duplicate_threshold: float = 0.95,
+        ttl_seconds: float = 300,
+        max_size: int = 1000,
+    ):
+        """
+        Initializes an empty semantic cache.
+
+        Args:
+            dim (int): Dimensionality of the query embeddings.
+            threshold (float, optional): Cosine similarity required for a hit. Defaults to 0.85.
+            duplicate_threshold (float, optional): Cosine similarity above which entries
+                                                   are collapsed. Defaults to 0.95.
+            ttl_seconds (float, optional): Entry lifetime in seconds. Defaults to 300.
+            max_size (int, optional): Maximum number of entries. Defaults to 1000.
+        """
+        self.dim = dim
+        self.threshold = threshold
+        self.duplicate_threshold = max(duplicate_threshold, threshold)
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+
+        self._index = faiss.IndexIDMap(faiss.IndexFlatIP(dim))
+        self._entries: OrderedDict[int, CacheEntry] = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _as_matrix(self, embedding: Any) -> np.ndarray:
+        """Convert an embedding into a contiguous (1, dim) float32 matrix"""
+        return np.ascontiguousarray(
+            np.asarray(embedding, dtype=np.float32).reshape(1, self.dim)
+        )
+
+    def _remove(self, entry_id: int) -> None:
+        """Drop an entry from both the index and the entry table"""
+        self._index.remove_ids(np.array([entry_id], dtype=np.int64))
+        self._entries.pop(entry_id, None)
+
+    def _evict_expired(self, now: float) -> None:
+        """Remove every entry older than the configured TTL"""
+        expired = [
+            entry_id for entry_id, entry in self._entries.items()
+            if now - entry.created_at > self.ttl_seconds
+        ]
+        for entry_id in expired:
+            self._remove(entry_id)
+
+    def _search(self, matrix: np.ndarray) -> tuple[Optional[int], float]:
+        """Return the closest entry id and its similarity, or (None, -1.0)"""
+        if not self._entries:
+            return None, -1.0
+        scores, ids = self._index.search(matrix, 1)
+        if ids[0][0] == -1:
+            return None, -1.0
+        return int(ids[0][0]), float(scores[0][0])
+
+    def get(self, embedding: Any) -> Optional[Any]:
+        """
+        Look up a cached answer for a query embedding.
+
+        Args:
+            embedding (Any): The normalized query embedding.
+
+        Returns:
+            Optional[Any]: The cached answer on a hit, otherwise None.
+        """
+        matrix = self._as_matrix(embedding)
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            entry_id, score = self._search(matrix)
+            if entry_id is None or score < self.threshold:
+                return None
+
+            entry = self._entries[entry_id]
+            entry.hits += 1
+            self._entries.move_to_end(entry_id)
+            logger.debug("Semantic cache hit (similarity=%.3f, hits=%s)", score, entry.hits)
+            return entry.answer
+
+    def put(self, embedding: Any, answer: Any) -> None:
+        """
+        Store an answer for a query embedding.
+
+        Near-duplicate queries replace the existing entry rather than growing the
+        cache, and the least recently used entry is evicted when the cache is full.
+
+        Args:
+            embedding (Any): The normalized query embedding.
+            answer (Any): The answer to cache.
+        """
+        matrix = self._as_matrix(embedding)
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired(now)
+
+            entry_id, score = self._search(matrix)
+            if entry_id is not None and score >= self.duplicate_threshold:
+                self._remove(entry_id)
+
+            while len(self._entries) >= self.max_size:
+                oldest_id = next(iter(self._entries))
+                self._remove(oldest_id)
+
+            new_id = self._next_id
+            self._next_id += 1
+            self._index.add_with_ids(matrix, np.array([new_id], dtype=np.int64))
+            self._entries[new_id] = CacheEntry(answer=answer, created_at=now)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache"""
+        with self._lock:
+            self._index.reset()
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,106 @@
+"""
+Crew output cache.
+
+`CrewResultCache` memoizes the output of a crew step by the step name and its
+inputs, so repeated requests for the same posting, company or resume skip the
+agent pipeline and its LLM calls.
+"""
+
+import hashlib
+import threading
+from collections.abc import Awaitable
+from typing import Any, Callable, TypeVar
+
+import orjson
+from cachetools import TTLCache
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class CrewResultCache:
+    """
+    A thread-safe TTL cache of crew step outputs.
+
+    Keys are the SHA-256 of the cache version, the step name and its inputs
+    serialized with sorted keys, so the order in which inputs are passed does
+    not matter. Callers normalize inputs that have several spellings (URLs,
+    names) before lookup, and derive the version from whatever else shapes the
+    output (such as the agent and task configuration). Empty outputs are not
+    cached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, version: str = ""):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached outputs
+            ttl: Lifetime of a cached output in seconds
+            version: Tag mixed into every key; a new tag invalidates older outputs
+        """
+        self.version = version
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def key(self, step: str, inputs: dict[str, Any]) -> str:
+        """Hash the version, a step name and its inputs into a cache key"""
+        payload = orjson.dumps([self.version, step, inputs], option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
+    def _get(self, key: str, step: str) -> Any:
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            logger.info("Serving %s output from cache", step)
+        return cached
+
+    def _put(self, key: str, result: Any) -> None:
+        if result:
+            with self._lock:
+                self._cache[key] = result
+
+    def get_or_run(self, step: str, inputs: dict[str, Any], run: Callable[[], T]) -> T:
+        """
+        Return the cached output of a step, running it on a miss.
+
+        Args:
+            step: Name of the crew step
+            inputs: The inputs identifying the step's output
+            run: Runs the step and returns its output
+
+        Returns:
+            The cached or freshly computed output
+        """
+        key = self.key(step, inputs)
+        cached = self._get(key, step)
+        if cached is not None:
+            return cached
+        result = run()
+        self._put(key, result)
+        return result
+
+    async def get_or_run_async(
+        self, step: str, inputs: dict[str, Any], run: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Async variant of `get_or_run` for steps run as coroutines.
+
+        Args:
+            step: Name of the crew step
+            inputs: The inputs identifying the step's output
+            run: Coroutine function running the step and returning its output
+
+        Returns:
+            The cached or freshly computed output
+        """
+        key = self.key(step, inputs)
+        cached = self._get(key, step)
+        if cached is not None:
+            return cached
+        result = await run()
+        self._put(key, result)
+        return result
@@ -0,0 +1,50 @@
+"""
+Micro-batching for query embeddings.
+
+`EmbeddingBatcher` collects texts submitted by concurrent requests within a short
+window and embeds them in a single forward pass, which is considerably cheaper
+per text than embedding each query on its own.
+"""
+
+from typing import Any
+
+from app.utils.micro_batcher import MicroBatcher
+
+
+class EmbeddingBatcher(MicroBatcher[str, list[float]]):
+    """
+    Groups concurrent embedding requests into batches for one embedding model.
+
+    A daemon worker thread drains the request queue, waiting at most
+    `max_wait_ms` after the first item for up to `max_batch_size` items, and
+    resolves each caller's future with its embedding.
+    """
+
+    def __init__(self, embedder: Any, max_batch_size: int = 32, max_wait_ms: float = 8):
+        """
+        Initialize the batcher.
+
+        Args:
+            embedder: Embedding model exposing `embed_documents(list[str])`
+            max_batch_size: Maximum number of texts per forward pass
+            max_wait_ms: Maximum time to wait for a batch to fill, in milliseconds
+        """
+        super().__init__(
+            embedder.embed_documents,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name="embedding-batcher",
+        )
+        self.embedder = embedder
+
+    async def embed(self, text: str) -> list[float]:
+        """
+        Embed a text as part of the next batch.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            list[float]: The text's embedding
+        """
+        return await self.run(text)
@@ -1,10 +1,46 @@
+import hashlib
 import os
+import tempfile
+import time
+from typing import IO, Any
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 class FileHandler:
     """
     Utility class for file handling operations
     """
+    @staticmethod
+    async def spool_upload(
+        upload_file: Any,
+        chunk_size: int = 1024 * 1024,
+        max_memory_size: int = 8 * 1024 * 1024
+    ) -> tuple[IO[bytes], int, str]:
+        """
+        Copy an uploaded file into a spooled temporary file chunk by chunk
+
+        The SHA-256 digest of the content is computed on the fly so callers can
+        key caches on it without a second pass over the data.
+
+        :param upload_file: Uploaded file object (FastAPI UploadFile)
+        :param chunk_size: Number of bytes read per chunk
+        :param max_memory_size: Size above which the buffer rolls over to disk
+        :return: Tuple of the rewound buffer, the number of bytes written and
+                 the hex SHA-256 digest of the content
+        """
+        buffer = tempfile.SpooledTemporaryFile(max_size=max_memory_size)
+        digest = hashlib.sha256()
+        total_size = 0
+        while chunk := await upload_file.read(chunk_size):
+            buffer.write(chunk)
+            digest.update(chunk)
+            total_size += len(chunk)
+        buffer.seek(0)
+        return buffer, total_size, digest.hexdigest()
+
     @staticmethod
     def cleanup_temp_files(directory: str, max_age_hours: int = 24) -> None:
         """
@@ -13,22 +49,32 @@ class FileHandler:
         :param directory: Directory to clean
         :param max_age_hours: Maximum age of files to keep
         """
-        import time
-        
+        cutoff = time.time() - max_age_hours * 3600
+        deleted = 0
+        failed = []
         try:
-            for filename in os.listdir(directory):
-                file_path = os.path.join(directory, filename)
-                
-                # Skip if not a file
-                if not os.path.isfile(file_path):
-                    continue
-                
-                # Check file age
-                file_age = time.time() - os.path.getctime(file_path)
-                if file_age > (max_age_hours * 3600):
-                    try:
-                        os.unlink(file_path)
-                    except Exception as e:
-                        print(f"Error deleting {filename}: {e}")
-        except Exception as e:
-            print(f"Error in cleanup_temp_files: {e}")
\ No newline at end of file
+            # scandir entries carry the file type, so only the age check needs a stat call
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Skip if not a file
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    
+                    # Check file age
+                    if entry.stat(follow_symlinks=False).st_ctime < cutoff:
+                        try:
+                            os.unlink(entry.path)
+                            deleted += 1
+                        except OSError:
+                            failed.append(entry.name)
+        except OSError as e:
+            logger.warning("Error in cleanup_temp_files: %s", e)
+
+        # One summary line instead of a write per file
+        if failed:
+            logger.warning(
+                "Deleted %s stale files from %s, failed to delete %s: %s",
+                deleted, directory, len(failed), ", ".join(failed)
+            )
+        elif deleted:
+            logger.info("Deleted %s stale files from %s", deleted, directory)
\ No newline at end of file
@@ -0,0 +1,50 @@
+import threading
+from typing import Optional
+
+import httpx
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get the process-wide HTTP client, creating it on first use.
+
+    CrewAI runs tools synchronously inside crew worker threads, so the shared
+    client is a thread-safe `httpx.Client` whose connection pool keeps
+    connections alive across scrapes instead of reconnecting on every call.
+
+    Returns:
+        httpx.Client: Shared HTTP client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=50,
+                        keepalive_expiry=60,
+                    ),
+                    timeout=30,
+                    follow_redirects=True,
+                    # Concurrent Serper API calls multiplex over one connection
+                    http2=True,
+                )
+    return _client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client and release its pooled connections"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            logger.info("Closing shared HTTP client")
+            _client.close()
+            _client = None
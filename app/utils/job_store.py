@@ -0,0 +1,118 @@
+"""
+Background job state store.
+
+`FileJobStore` keeps the state of queued jobs as one JSON file per job id in
+a directory, so every uvicorn worker process (and every container mounting
+the same volume) sees the same jobs. A job is submitted to one worker, but
+its status may be polled through any of them.
+"""
+
+import os
+import re
+import time
+import uuid
+from typing import Any, Optional
+
+import anyio
+import orjson
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Job ids are uuid4 hex strings; anything else can't name a stored job
+_JOB_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+
+class FileJobStore:
+    """
+    A TTL store of job states shared by processes through the filesystem.
+
+    Each write replaces the job's file atomically, so readers never see a
+    partial state. A job expires `ttl` seconds after its last update, and
+    `prune` drops expired jobs and, past `maxsize`, the least recently updated.
+    """
+
+    def __init__(self, directory: str, maxsize: int, ttl: float):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding one `<job id>.json` file per job
+            maxsize: Maximum number of jobs kept after pruning
+            ttl: Lifetime of a job's state in seconds since its last update
+        """
+        self.directory = directory
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    @staticmethod
+    def new_id() -> str:
+        """Generate an id for a new job"""
+        return uuid.uuid4().hex
+
+    def _path(self, job_id: str) -> Optional[str]:
+        if not _JOB_ID_PATTERN.fullmatch(job_id):
+            return None
+        return os.path.join(self.directory, f"{job_id}.json")
+
+    def _write(self, job_id: str, state: dict[str, Any]) -> None:
+        path = self._path(job_id)
+        if path is None:
+            raise ValueError(f"Invalid job id: {job_id!r}")
+        os.makedirs(self.directory, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(orjson.dumps(state))
+        os.replace(temp_path, path)
+
+    def _read(self, job_id: str) -> Optional[dict[str, Any]]:
+        path = self._path(job_id)
+        if path is None:
+            return None
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, "rb") as file:
+                return orjson.loads(file.read())
+        except FileNotFoundError:
+            return None
+
+    def _prune(self) -> None:
+        try:
+            entries = [
+                entry for entry in os.scandir(self.directory)
+                if entry.name.endswith(".json")
+            ]
+        except FileNotFoundError:
+            return
+
+        now = time.time()
+        jobs = []
+        for entry in entries:
+            try:
+                jobs.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                continue
+        jobs.sort(reverse=True)
+        for index, (modified, path) in enumerate(jobs):
+            if index >= self.maxsize or now - modified > self.ttl:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    async def set(self, job_id: str, state: dict[str, Any]) -> None:
+        """Store a job's state, replacing any previous one"""
+        await anyio.to_thread.run_sync(self._write, job_id, state)
+
+    async def get(self, job_id: str) -> Optional[dict[str, Any]]:
+        """Return a job's state, or None if it is unknown or has expired"""
+        return await anyio.to_thread.run_sync(self._read, job_id)
+
+    async def prune(self) -> None:
+        """Remove expired jobs and the oldest ones beyond `maxsize`"""
+        try:
+            await anyio.to_thread.run_sync(self._prune)
+        except OSError as e:
+            logger.warning("Failed to prune job store %s: %s", self.directory, e)
@@ -1,7 +1,14 @@
-import json
 import os
 import re
 
+import orjson
+
+# Markdown code block around the JSON: ```json at the start and ``` at the end
+_JSON_FENCE_PATTERN = re.compile(r"^```json(.*?)```$", re.DOTALL)
+_JSON_FENCE_PREFIX = "```json"
+_JSON_FENCE_BYTES_PATTERN = re.compile(rb"^```json(.*?)```$", re.DOTALL)
+_JSON_FENCE_BYTES_PREFIX = b"```json"
+
 
 class JSONValidator:
     def __init__(self, file_path):
@@ -13,18 +20,25 @@ class JSONValidator:
         """
         self.file_path = file_path
         
-    def read_file(self):
+    def read_file(self, binary=False):
         """
         Read the content of the JSON file.
         
+        Args:
+            binary (bool): Return the raw bytes instead of decoded text. orjson
+                           parses bytes directly, so this skips a UTF-8 decode pass
+        
         Returns:
-            str: Content of the file, or None if file doesn't exist
+            str | bytes: Content of the file, or None if file doesn't exist
         """
         if not os.path.exists(self.file_path):
             print(f"File {self.file_path} doesn't exist!")
             return None
             
         try:
+            if binary:
+                with open(self.file_path, "rb") as file:
+                    return file.read()
             with open(self.file_path, encoding="utf-8") as file:
                 return file.read()
         except Exception as e:
@@ -36,18 +50,25 @@ class JSONValidator:
         Clean the JSON string by removing markdown code block syntax.
         
         Args:
-            json_str (str): Raw JSON string that might contain markdown syntax
+            json_str (str | bytes): Raw JSON that might contain markdown syntax
             
         Returns:
-            str: Cleaned JSON string
+            str | bytes: Cleaned JSON, of the same type as the input
         """
         if json_str is None:
             return None
             
+        if isinstance(json_str, bytes):
+            prefix, pattern = _JSON_FENCE_BYTES_PREFIX, _JSON_FENCE_BYTES_PATTERN
+        else:
+            prefix, pattern = _JSON_FENCE_PREFIX, _JSON_FENCE_PATTERN
+
+        # Plain JSON can't match the fence pattern, so skip the regex for it
+        if not json_str.startswith(prefix):
+            return json_str
+
         # Remove markdown code block syntax if present
-        # Pattern matches ```json at the start and ``` at the end
-        pattern = r"^```json(.*?)```$"
-        match = re.search(pattern, json_str, re.DOTALL)
+        match = pattern.search(json_str)
         
         if match:
             # Extract just the JSON data
@@ -64,7 +85,7 @@ class JSONValidator:
             None: If JSON is invalid or file doesn't exist
         """
         # Read the file
-        content = self.read_file()
+        content = self.read_file(binary=True)
         if content is None:
             return None
         
@@ -73,9 +94,9 @@ class JSONValidator:
         
         # Try to parse the JSON
         try:
-            json_data = json.loads(cleaned_content)
+            json_data = orjson.loads(cleaned_content)
             return json_data
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"Invalid JSON: {e}")
             return None
     
@@ -88,7 +109,7 @@ class JSONValidator:
             None: If validation failed
         """
         # Read the file
-        content = self.read_file()
+        content = self.read_file(binary=True)
         if content is None:
             return None
         
@@ -99,24 +120,24 @@ class JSONValidator:
         if cleaned_content != content:
             try:
                 # Try to parse to ensure it's valid JSON
-                json_data = json.loads(cleaned_content)
+                json_data = orjson.loads(cleaned_content)
                 
                 # Write back to file with proper formatting
-                with open(self.file_path, "w", encoding="utf-8") as file:
-                    json.dump(json_data, file, indent=2)
+                with open(self.file_path, "wb") as file:
+                    file.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
                 
                 print(f"Cleaned and saved JSON to {self.file_path}")
                 return json_data
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 print(f"Failed to clean JSON: {e}")
                 return None
         else:
             # No cleaning needed, just validate
             try:
-                json_data = json.loads(content)
+                json_data = orjson.loads(content)
                 print("JSON is already properly formatted.")
                 return json_data
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 print(f"Invalid JSON and cleaning didn't help: {e}")
                 return None
 
@@ -0,0 +1,197 @@
+"""
+Generic micro-batching.
+
+`MicroBatcher` collects items submitted by concurrent callers within a short
+window and hands them to a batch handler in one call, resolving each caller's
+future with its own result.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Executor, Future, InvalidStateError
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Groups concurrent submissions into batches for one handler.
+
+    A daemon worker thread drains the request queue, waiting at most
+    `max_wait_ms` after the first item for up to `max_batch_size` items. The
+    handler receives the batch as a list and must return one result per item,
+    in order. Without an executor batches are handled one at a time on the
+    worker thread; with one, each batch is handed to the executor so slow
+    handlers can overlap.
+
+    Callers may cancel their future (e.g. when an awaiting request is dropped)
+    until its batch is drained; cancelled items are left out of the batch, and
+    a failing batch never stops the worker.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[T]], list[R]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 8,
+        name: str = "micro-batcher",
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            handler: Callable processing a list of items and returning their results
+            max_batch_size: Maximum number of items per batch
+            max_wait_ms: Maximum time to wait for a batch to fill, in milliseconds
+            name: Name of the worker thread, used for logging
+            executor: Optional executor running the handler for each batch
+        """
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000
+        self.name = name
+        self.executor = executor
+        self._queue: queue.Queue[Optional[tuple[T, Future]]] = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    def _ensure_worker(self) -> None:
+        """Start the background worker thread on first use"""
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._run, name=self.name, daemon=True
+                    )
+                    self._worker.start()
+
+    def _drain(self) -> Optional[list[tuple[T, Future]]]:
+        """Block for the first item, then collect more until the batch is full or the window closes"""
+        first = self._queue.get()
+        if first is None:
+            return None
+
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait_seconds
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    @staticmethod
+    def _resolve(future: Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Set a future's outcome, unless it was already resolved or cancelled"""
+        if future.done():
+            return
+        try:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            # Resolved or cancelled by another thread in between
+            pass
+
+    def _dispatch(self, batch: list[tuple[T, Future]]) -> None:
+        """Run the handler on one batch and resolve its futures"""
+        # Mark the futures running; cancelled ones are dropped from the batch
+        batch = [
+            (item, future) for item, future in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        if not batch:
+            return
+
+        items = [item for item, _ in batch]
+        try:
+            results = self.handler(items)
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"{self.name} handler returned {len(results)} results for {len(batch)} items"
+                )
+        except Exception as e:
+            logger.error("%s batch failed: %s", self.name, e, exc_info=True)
+            for _, future in batch:
+                self._resolve(future, error=e)
+            return
+
+        logger.debug("%s processed batch of %s items", self.name, len(batch))
+        for (_, future), result in zip(batch, results):
+            self._resolve(future, result)
+
+    def _dispatch_safely(self, batch: list[tuple[T, Future]]) -> None:
+        """Dispatch a batch, failing its futures instead of raising"""
+        try:
+            self._dispatch(batch)
+        except Exception as e:
+            logger.error("%s dispatch failed: %s", self.name, e, exc_info=True)
+            for _, future in batch:
+                self._resolve(future, error=e)
+
+    def _run(self) -> None:
+        """Worker loop forming batches and handing them to the handler"""
+        while (batch := self._drain()) is not None:
+            if self.executor is None:
+                self._dispatch_safely(batch)
+                continue
+            try:
+                self.executor.submit(self._dispatch_safely, batch)
+            except Exception as e:
+                # E.g. the executor was shut down; fail this batch, keep the worker
+                logger.error("%s could not schedule a batch: %s", self.name, e, exc_info=True)
+                for _, future in batch:
+                    self._resolve(future, error=e)
+
+    def submit(self, item: T) -> Future:
+        """
+        Queue an item for the next batch.
+
+        Args:
+            item: The item to process
+
+        Returns:
+            Future: Resolves to the item's result
+        """
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future
+
+    async def run(self, item: T) -> Any:
+        """
+        Process an item as part of the next batch.
+
+        Args:
+            item: The item to process
+
+        Returns:
+            The item's result
+        """
+        return await asyncio.wrap_future(self.submit(item))
+
+    def close(self) -> None:
+        """Stop the worker thread after the queued batches are processed"""
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
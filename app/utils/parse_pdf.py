@@ -1,23 +1,83 @@
-from io import BytesIO
-from typing import Union
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Optional, Union
 
-from pypdf import PdfReader
+import pymupdf
 
+from app.core.config import settings
+from app.core.logging import get_logger
 
-def extract_text_from_pdf(pdf_file: Union[str, BytesIO]) -> str:
+logger = get_logger(__name__)
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def extract_text_from_pdf(pdf_file: Union[str, bytes, IO[bytes]]) -> str:
+    """
+    Extracts and returns text from all pages of a PDF using PyMuPDF.
+
+    Args:
+        pdf_file (str, bytes or IO[bytes]): File path, raw PDF bytes, or binary
+                                            file-like object (e.g. UploadFile.file)
+
+    Returns:
+        str: Combined text from all pages
+    """
+    if isinstance(pdf_file, str):
+        return _extract_text(pymupdf.open(pdf_file))
+    if isinstance(pdf_file, (bytes, bytearray, memoryview)):
+        return _extract_text_from_bytes(pdf_file)
+    return _extract_text_from_bytes(pdf_file.read())
+
+
+def _extract_text(document: pymupdf.Document) -> str:
+    """Join the text of every page of an opened document, then close it"""
+    with document:
+        return "".join(page.get_text("text") for page in document).strip()
+
+
+def _extract_text_from_bytes(pdf_bytes: bytes) -> str:
+    """Worker-process entry point: extract text from raw PDF bytes"""
+    return _extract_text(pymupdf.open(stream=pdf_bytes, filetype="pdf"))
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the process pool used for PDF text extraction, creating it on first use"""
+    global _pdf_pool
+    if _pdf_pool is None:
+        with _pdf_pool_lock:
+            if _pdf_pool is None:
+                # Spawned workers do not inherit the parent's threads, locks or model weights
+                _pdf_pool = ProcessPoolExecutor(
+                    max_workers=settings.PDF_POOL_SIZE,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _pdf_pool
+
+
+def extract_text_in_process(pdf_file: IO[bytes]) -> str:
     """
-    Extracts and returns text from all pages of a PDF using PyPDF2.
+    Extracts text from a PDF stream in a worker process.
+
+    PyMuPDF does not release the GIL while extracting, so running it in a separate
+    process lets concurrent uploads use every CPU core.
 
     Args:
-        pdf_file (str or BytesIO): File path or file-like object (e.g. UploadFile.file)
+        pdf_file (IO[bytes]): Binary file-like object positioned at the start of the PDF
 
     Returns:
         str: Combined text from all pages
     """
-    reader = PdfReader(pdf_file)
-    text = ""
+    return _get_pdf_pool().submit(_extract_text_from_bytes, pdf_file.read()).result()
+
 
-    for page in reader.pages:
-        text += page.extract_text() or ""
-    
-    return text.strip()
+def shutdown_pdf_pool() -> None:
+    """Shut down the PDF extraction process pool, if it was started"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is not None:
+            logger.info("Shutting down PDF extraction pool")
+            _pdf_pool.shutdown(wait=True)
+            _pdf_pool = None
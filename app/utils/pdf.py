@@ -1,6 +1,24 @@
+import contextlib
 import os
 from typing import Any, Optional
 
+import anyio
+
+# Bytes copied per read/write call when saving uploads
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _remove_partial(file_path: str) -> None:
+    """Delete a partially written upload, if it was created at all"""
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(file_path)
+
+
+class FileTooLargeError(ValueError):
+    """
+    Raised when an upload exceeds the allowed size while it is being saved
+    """
+
 
 class PDFProcessor:
     """
@@ -32,24 +50,43 @@ class PDFProcessor:
         import uuid
         return f"{uuid.uuid4()}_{safe_filename}"
     
-    def save_file(self, upload_directory: str) -> str:
+    async def save_upload(
+        self,
+        upload_directory: str,
+        max_size: int,
+        chunk_size: int = COPY_CHUNK_SIZE
+    ) -> str:
         """
-        Save uploaded file to specified directory
-        
+        Stream the uploaded file to disk chunk by chunk without blocking the event loop
+
+        The size limit is enforced while copying, so oversized uploads are
+        rejected as soon as the limit is crossed. A partial file left by a failed
+        save is removed. The directory is (re)created on every save, so uploads
+        keep working if it is deleted while the process runs.
+
         :param upload_directory: Directory to save file
+        :param max_size: Maximum number of bytes accepted
+        :param chunk_size: Number of bytes read and written per chunk
         :return: Full path of saved file
+        :raises FileTooLargeError: If the upload exceeds max_size
         """
-        # Ensure upload directory exists
-        os.makedirs(upload_directory, exist_ok=True)
-        
-        # Construct full file path
+        await anyio.Path(upload_directory).mkdir(parents=True, exist_ok=True)
         file_path = os.path.join(upload_directory, self.filename)
-        
-        # Save file
+
+        total_size = 0
         try:
-            with open(file_path, "wb") as buffer:
-                buffer.write(self.file.file.read())
+            async with await anyio.open_file(file_path, "wb") as buffer:
+                while chunk := await self.file.read(chunk_size):
+                    total_size += len(chunk)
+                    if total_size > max_size:
+                        raise FileTooLargeError(
+                            f"File exceeds maximum size of {max_size} bytes"
+                        )
+                    await buffer.write(chunk)
             return file_path
+        except FileTooLargeError:
+            _remove_partial(file_path)
+            raise
         except OSError as e:
+            _remove_partial(file_path)
             raise OSError("Failed to save file") from e
-
@@ -0,0 +1,97 @@
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+TRACKING_PARAM_PREFIXES = ("utm_",)
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "trk", "trackingid", "refid"})
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL so that equivalent links map to the same cache key.
+
+    Lowercases the scheme and host, strips tracking query parameters
+    (utm_*, fbclid, gclid, ...), sorts the remaining parameters and drops
+    the fragment and any trailing slash on the path.
+
+    Args:
+        url (str): The URL to normalize
+
+    Returns:
+        str: Normalized URL
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+        and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        urlencode(query),
+        "",
+    ))
+
+
+# Hosted applicant tracking systems putting the company slug first in the path
+PATH_TENANT_HOSTS = frozenset({
+    "boards.greenhouse.io",
+    "job-boards.greenhouse.io",
+    "jobs.lever.co",
+    "jobs.ashbyhq.com",
+    "apply.workable.com",
+    "jobs.smartrecruiters.com",
+})
+# Hosted applicant tracking systems using the company slug as subdomain
+SUBDOMAIN_TENANT_DOMAINS = ("myworkdayjobs.com", "bamboohr.com", "recruitee.com", "breezy.hr")
+# Job boards whose posting URLs do not name the employer
+JOB_BOARD_DOMAINS = frozenset({
+    "linkedin.com", "indeed.com", "glassdoor.com", "monster.com",
+    "ziprecruiter.com", "naukri.com", "wellfound.com", "angel.co",
+})
+SECOND_LEVEL_LABELS = frozenset({"co", "com", "org", "net", "ac"})
+
+
+def _slug_to_name(slug: str) -> Optional[str]:
+    name = slug.replace("-", " ").replace("_", " ").strip()
+    return name or None
+
+
+def guess_company_from_url(url: str) -> Optional[str]:
+    """
+    Guess the employer of a job posting from its URL alone.
+
+    Understands LinkedIn company pages, the common hosted applicant tracking
+    systems (Greenhouse, Lever, Ashby, Workday, ...) and postings on a
+    company's own domain. Postings on job boards that do not name the
+    employer in the URL give None.
+
+    Args:
+        url (str): The job posting URL
+
+    Returns:
+        Optional[str]: The guessed company name, or None if the URL gives no hint
+    """
+    parts = urlsplit(url.strip())
+    host = parts.hostname or ""
+    labels = host.removeprefix("www.").split(".")
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if len(labels) < 2:
+        return None
+
+    domain = ".".join(labels[-2:])
+    if domain == "linkedin.com" and len(segments) >= 2 and segments[0] == "company":
+        return _slug_to_name(segments[1])
+    if domain in JOB_BOARD_DOMAINS:
+        return None
+    if host in PATH_TENANT_HOSTS:
+        return _slug_to_name(segments[0]) if segments else None
+    if host.endswith(SUBDOMAIN_TENANT_DOMAINS):
+        return _slug_to_name(labels[0]) if len(labels) > 2 else None
+
+    # The company's own site, e.g. careers.acme.com or acme.co.uk/jobs
+    if len(labels) >= 3 and labels[-2] in SECOND_LEVEL_LABELS:
+        return _slug_to_name(labels[-3])
+    return _slug_to_name(labels[-2])
@@ -0,0 +1,176 @@
+"""
+Bounded worker pools for outbound LLM and scraping calls.
+
+Each `WorkerPool` caps how many calls to one upstream can be in flight at once
+and how many may start per second, so bursts of requests queue up locally
+instead of flooding the provider and triggering 429s.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from collections.abc import Awaitable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class RateLimiter:
+    """
+    Token bucket limiting how many calls may start per second.
+
+    The bucket state is guarded by a thread lock so the limiter is not bound
+    to a particular event loop.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Number of calls allowed per second
+            burst: Maximum number of tokens that can accumulate (defaults to rate)
+        """
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """Take a token if available, otherwise return the seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    async def acquire(self) -> None:
+        """Wait until a token is available"""
+        while (delay := self._try_acquire()) > 0:
+            await asyncio.sleep(delay)
+
+
+class WorkerPool:
+    """
+    A bounded, rate-limited pool for calls to one upstream service.
+
+    Blocking callables run on a dedicated thread pool of `size` workers.
+    Coroutines are limited to `size` concurrent executions by a semaphore.
+    Both paths share the same per-second rate limit.
+
+    The pools are module-level, but the app's lifespan owns their resources:
+    `start` creates the thread pool and a semaphore for the serving event loop,
+    and `shutdown` releases them. Both are also created on first use, so a pool
+    keeps working across several lifespans (or event loops) in one process.
+    """
+
+    def __init__(self, name: str, size: int, rate: float):
+        """
+        Initialize the worker pool.
+
+        Args:
+            name: Name of the upstream, used for thread names and logging
+            size: Maximum number of concurrent calls
+            rate: Maximum number of calls started per second
+        """
+        self.name = name
+        self.size = size
+        self.rate_limiter = RateLimiter(rate)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool, creating it on first use after a shutdown"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.size, thread_name_prefix=f"{self.name}-pool"
+                    )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore of the running event loop, creating it for a new loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._semaphore is None or self._semaphore_loop is not loop:
+                self._semaphore = asyncio.Semaphore(self.size)
+                self._semaphore_loop = loop
+            return self._semaphore
+
+    def start(self) -> None:
+        """Create the thread pool and bind the semaphore to the running event loop"""
+        self._get_executor()
+        self._get_semaphore()
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking callable on the pool once the rate limit allows it.
+
+        Args:
+            func: The blocking callable to execute
+            *args: Positional arguments for the callable
+            **kwargs: Keyword arguments for the callable
+
+        Returns:
+            The callable's return value
+        """
+        await self.rate_limiter.acquire()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+    async def run_async(
+        self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Await a coroutine function under the pool's concurrency and rate limits.
+
+        Args:
+            func: The coroutine function to execute
+            *args: Positional arguments for the coroutine function
+            **kwargs: Keyword arguments for the coroutine function
+
+        Returns:
+            The coroutine's result
+        """
+        async with self._get_semaphore():
+            await self.rate_limiter.acquire()
+            return await func(*args, **kwargs)
+
+    def shutdown(self) -> None:
+        """Release the thread pool after its running calls finish; later use starts a new one"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._semaphore = self._semaphore_loop = None
+        if executor is not None:
+            logger.info("Shutting down %s worker pool", self.name)
+            executor.shutdown(wait=True)
+
+
+# Pools per upstream, shared by all routes
+llm_pool = WorkerPool("llm", settings.LLM_POOL_SIZE, settings.LLM_RATE_PER_SECOND)
+scrape_pool = WorkerPool(
+    "scrape", settings.SCRAPE_POOL_SIZE, settings.SCRAPE_RATE_PER_SECOND
+)
+# Resume tailoring runs a long multi-agent pipeline per request, so it gets its
+# own workers instead of competing with the short ATS / HR QA calls
+resume_pool = WorkerPool(
+    "resume", settings.RESUME_POOL_SIZE, settings.RESUME_RATE_PER_SECOND
+)
@@ -1,3 +1,5 @@
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -8,9 +10,28 @@ from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# libyaml's C parser when PyYAML was built with it, the pure-Python one otherwise
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=100)
+def _parse_yaml_file(file_path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file once per version; callers receive copies of the result.
+
+    The modification time and size are part of the cache key, so an edited
+    file is parsed again while unchanged files cost only a `stat` call.
+    """
+    with open(file_path, encoding="utf-8") as file:
+        return yaml.load(file, Loader=_SafeLoader)
+
+
 def load_yaml_configs(config_file_path) -> dict[str, Any]:
     """
     Load and parse YAML configuration files for agents and tasks.
+
+    Each file is parsed again only when its modification time or size changes;
+    every call returns a deep copy so callers can modify their configuration freely.
     
     Returns:
         Dict[str, Any]: Dictionary containing loaded configurations
@@ -25,14 +46,15 @@ def load_yaml_configs(config_file_path) -> dict[str, Any]:
         for config_type, file_path in config_file_path.items():
             path = Path(file_path)
             if not path.exists():
-                logger.error(f"Configuration file not found: {file_path}")
+                logger.error("Configuration file not found: %s", file_path)
                 raise FileNotFoundError(f"Missing configuration file: {file_path}")
                 
-            with open(path, encoding="utf-8") as file:
-                configs[config_type] = yaml.safe_load(file)
-                logger.debug(f"Successfully loaded {config_type} configuration")
+            stat = path.stat()
+            parsed = _parse_yaml_file(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+            configs[config_type] = copy.deepcopy(parsed)
+            logger.debug("Successfully loaded %s configuration", config_type)
                 
         return configs
     except (yaml.YAMLError, FileNotFoundError) as e:
-        logger.error(f"Failed to load configurations: {str(e)}", exc_info=True)
+        logger.error("Failed to load configurations: %s", e, exc_info=True)
         raise CustomExceptionError("Failed to load configurationse") from e
\ No newline at end of file
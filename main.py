@@ -1,9 +1,14 @@
+import asyncio
+from contextlib import AsyncExitStack, asynccontextmanager
+
 import uvicorn
+from anyio import to_thread
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
+from app.api.error_handlers import register_exception_handlers
 from app.api.routes import (
     ats_checker_routes,
     hr_qa_routes,
@@ -14,15 +19,71 @@ from app.api.routes import (
 # import logging
 from app.core.config import settings
 from app.core.logging import setup_logging
+from app.llm.provider import warm_up_gemini
+from app.service.hr_qa_service import close_hr_qa_service, get_hr_qa_service
+from app.service.resume_builder_service import UPLOAD_DIRECTORY
+from app.utils.file_handler import FileHandler
+from app.utils.http_client import close_http_client
+from app.utils.parse_pdf import shutdown_pdf_pool
+from app.utils.worker_pool import llm_pool, resume_pool, scrape_pool
 
 # Setup logging
 logger = setup_logging(app_name="jobfit-ai",log_level=settings.LOG_LEVEL)
 
+
+async def prewarm_hr_qa_service() -> None:
+    """Build the HR QA service off the event loop and run one embedding warm-up query"""
+    service = await to_thread.run_sync(get_hr_qa_service)
+    await service.query_batcher.embed("warmup")
+    logger.info("HR QA service built and embedding model warmed up")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan handler.
+
+    Resizes the default anyio thread limiter so that blocking work offloaded
+    to the threadpool can run concurrently. The upstream worker pools are
+    started for this run's event loop. Shared resources (the worker pools, the
+    pooled HTTP client) are registered on an `AsyncExitStack` and released in
+    reverse order when the application stops. Unless
+    `HR_QA_PREWARM` is disabled, the HR QA service is built on a worker thread
+    and its embedding model runs one warm-up query, and unless `LLM_PREWARM` is
+    disabled the shared Gemini client sends a one-word prompt. Both run
+    concurrently before the app accepts traffic, so the first request does not
+    pay for lazy initialization or connection setup. Uploads older than a day,
+    left behind by an earlier process, are swept at the same time.
+    """
+    async with AsyncExitStack() as stack:
+        for pool in (llm_pool, scrape_pool, resume_pool):
+            pool.start()
+            stack.callback(pool.shutdown)
+        stack.callback(close_http_client)
+        stack.callback(shutdown_pdf_pool)
+        stack.callback(close_hr_qa_service)
+
+        to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+        logger.info("Threadpool size set to %s", settings.THREADPOOL_SIZE)
+
+        warmups = []
+        if settings.HR_QA_PREWARM:
+            warmups.append(prewarm_hr_qa_service())
+        if settings.LLM_PREWARM:
+            warmups.append(to_thread.run_sync(warm_up_gemini))
+        # Uploads left behind by a previous process that stopped mid-request
+        warmups.append(to_thread.run_sync(FileHandler.cleanup_temp_files, UPLOAD_DIRECTORY))
+        await asyncio.gather(*warmups)
+        yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title="AI Job Application Assistant",
     description="API for job application assistance tools",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -35,6 +96,9 @@ app.add_middleware(
 )
 
 
+# Register global exception handlers
+register_exception_handlers(app)
+
 # Include routers
 app.include_router(resume_tailor.router)
 app.include_router(jp_analyser_routes.router)
@@ -59,7 +123,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
     This handler is triggered when request validation fails. It logs the detailed
     validation errors and the request body for debugging purposes, and then
-    returns a JSONResponse with a 422 Unprocessable Entity status code,
+    returns an ORJSONResponse with a 422 Unprocessable Entity status code,
     containing the structured validation error details.
 
     Args:
@@ -68,15 +132,17 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
                                      the validation failures.
 
     Returns:
-        JSONResponse: A response object with status code 422 and content detailing
+        ORJSONResponse: A response object with status code 422 and content detailing
                       the validation errors.
     """
-    logger.error(f"Validation error: {exc.errors()} | Body: {await request.body()}")
-    return JSONResponse(
+    logger.error("Validation error: %s | Body: %s", exc.errors(), await request.body())
+    return ORJSONResponse(
         status_code=422,
         content={"detail": exc.errors()},
     )
 if __name__ == "__main__":
     logger.info("Starting AI Job Application Assistant API")
-    # logger.info(f"CORS Origins type: {type(settings.CORS_ORIGINS)}")
+    # logger.info("CORS Origins type: %s", type(settings.CORS_ORIGINS))
+    # Development entry point; uvicorn picks uvloop and httptools automatically
+    # when they are installed, and the Dockerfile requests them explicitly
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -0,0 +1,255 @@
+"""
+Shared test configuration.
+
+By default the tests marked `integration` run against stubbed services that
+return canned Markdown, so a plain `pytest` run exercises routing, validation
+and serialization without calling the LLM provider or scraping job boards.
+Pass `--integration` to send those tests to the real services instead.
+
+All tests share one `httpx.AsyncClient`, and the app's lifespan runs once
+around it for the whole session (per xdist worker). With `--integration` the
+app is served by a real uvicorn server on a local port, and the client keeps
+its connections alive across requests. `replicated_aclient` additionally
+serves the app from several uvicorn worker processes, as in production.
+
+The app and its services are imported by fixtures rather than at module
+level, so collecting the tests (`pytest --collect-only`) doesn't build them.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import httpx
+import pytest
+import pytest_asyncio
+import uvicorn
+from fastapi import FastAPI
+
+from app.core.config import settings
+
+MOCK_MARKDOWN = "## Mocked response\n\n- **Stubbed** upstream output"
+
+# Crew runs against the live services can take minutes
+INTEGRATION_TIMEOUT_SECONDS = 600
+
+# Worker processes of the replicated server, and how long their startup may take
+REPLICA_WORKERS = 4
+REPLICA_STARTUP_TIMEOUT_SECONDS = 300
+
+
+class MockJobPostingAnalyzer:
+    """Stands in for `JobPostingAnalyzer` without scraping or LLM calls"""
+
+    async def generate_insights_async(self, job_url: str) -> str:
+        return MOCK_MARKDOWN
+
+
+class MockQueryBatcher:
+    """Stands in for the HR QA service's `EmbeddingBatcher`"""
+
+    async def embed(self, text: str) -> list[float]:
+        return [0.0]
+
+
+class MockHRQuestionAnswerService:
+    """Stands in for `HRQuestionAnswerService` without retrieval or LLM calls"""
+
+    def __init__(self):
+        self.query_batcher = MockQueryBatcher()
+
+    async def get_answer(self, query: str, embedding=None) -> str:
+        return MOCK_MARKDOWN
+
+
+class MockATSCheckerService:
+    """Stands in for `ATSCheckerService` without running the ATS crew"""
+
+    def analyze(self, resume_file, job_description: str, file_hash=None) -> str:
+        return MOCK_MARKDOWN
+
+
+class MockResumeBuilderService:
+    """Stands in for `ResumeBuilderService` without running the resume crew"""
+
+    upload_directory = os.path.join(tempfile.gettempdir(), "jobfit-test-uploads")
+
+    def generate_resume(self, resume_path, job_posting_url, github_url=None, personal_writeup=None):
+        return {
+            "status": "success",
+            "result": MOCK_MARKDOWN,
+            "tailo_resume_json": {"job_posting_url": job_posting_url},
+        }
+
+    def generate_resumes(
+        self, resume_path, job_posting_urls, github_url=None, personal_writeup=None, max_workers=4
+    ):
+        return [
+            self.generate_resume(resume_path, url, github_url, personal_writeup)
+            for url in job_posting_urls
+        ]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--integration",
+        action="store_true",
+        default=False,
+        help="run integration tests against the real LLM provider and websites",
+    )
+    parser.addoption(
+        "--load",
+        action="store_true",
+        default=False,
+        help="run load tests",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--load"):
+        return
+    skip_load = pytest.mark.skip(reason="load test, run with --load")
+    for item in items:
+        if "load" in item.keywords:
+            item.add_marker(skip_load)
+
+
+@pytest.fixture(scope="session")
+def fastapi_app() -> FastAPI:
+    """The application, imported on first use instead of at collection time"""
+    from main import app
+    return app
+
+
+@contextmanager
+def serve_app(fastapi_app: FastAPI) -> Iterator[str]:
+    """Serve the app with uvicorn on a free local port in a background thread"""
+    server = uvicorn.Server(
+        uvicorn.Config(fastapi_app, host="127.0.0.1", port=0, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, name="test-uvicorn", daemon=True)
+    thread.start()
+    # `started` is set once the lifespan startup has finished and the socket is bound
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("uvicorn failed to start")
+        time.sleep(0.05)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient(request, fastapi_app):
+    """An AsyncClient calling the app, inside one run of its lifespan"""
+    if request.config.getoption("--integration"):
+        with serve_app(fastapi_app) as base_url:
+            async with httpx.AsyncClient(
+                base_url=base_url,
+                limits=httpx.Limits(max_keepalive_connections=100),
+                timeout=INTEGRATION_TIMEOUT_SECONDS
+            ) as client:
+                yield client
+        return
+
+    with pytest.MonkeyPatch.context() as patcher:
+        # The stubbed services have nothing to warm up
+        patcher.setattr(settings, "HR_QA_PREWARM", False)
+        patcher.setattr(settings, "LLM_PREWARM", False)
+        async with fastapi_app.router.lifespan_context(fastapi_app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=fastapi_app), base_url="http://test"
+            ) as client:
+                yield client
+
+
+def _free_port() -> int:
+    """Ask the OS for a currently unused local TCP port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def serve_app_replicated(rootdir: str, workers: int) -> Iterator[str]:
+    """Serve `main:app` from a multi-worker uvicorn subprocess until it answers /health"""
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ],
+        cwd=rootdir,
+    )
+    try:
+        deadline = time.monotonic() + REPLICA_STARTUP_TIMEOUT_SECONDS
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {process.returncode}")
+            if time.monotonic() > deadline:
+                raise RuntimeError("uvicorn workers did not become ready in time")
+            try:
+                if httpx.get(f"{base_url}/health").status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            time.sleep(0.5)
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def replicated_aclient(request):
+    """An AsyncClient calling the app served by REPLICA_WORKERS uvicorn processes"""
+    if not request.config.getoption("--integration"):
+        # The stubs can't reach into the worker processes
+        pytest.skip("replicated server runs the real services, run with --integration")
+
+    with serve_app_replicated(str(request.config.rootpath), REPLICA_WORKERS) as base_url:
+        async with httpx.AsyncClient(
+            base_url=base_url,
+            limits=httpx.Limits(max_keepalive_connections=100),
+            timeout=INTEGRATION_TIMEOUT_SECONDS
+        ) as client:
+            yield client
+
+
+@pytest.fixture(autouse=True)
+def mock_upstreams(request, monkeypatch, fastapi_app, tmp_path):
+    """Swap the services behind the routes for stubs unless --integration is given"""
+    if request.config.getoption("--integration"):
+        yield
+        return
+
+    from app.api.routes import ats_checker_routes, jp_analyser_routes, resume_tailor
+    from app.api.routes.hr_qa_routes import get_hr_service
+    from app.service.jp_analyser import get_job_posting_analyzer
+    from app.service.resume_builder_service import get_resume_builder
+
+    fastapi_app.dependency_overrides[get_job_posting_analyzer] = MockJobPostingAnalyzer
+    fastapi_app.dependency_overrides[get_hr_service] = MockHRQuestionAnswerService
+    fastapi_app.dependency_overrides[get_resume_builder] = MockResumeBuilderService
+    monkeypatch.setattr(ats_checker_routes, "ats_service", MockATSCheckerService())
+    # Keep queued resume jobs out of the working tree
+    monkeypatch.setattr(resume_tailor.resume_jobs, "directory", str(tmp_path / "resume_jobs"))
+    yield
+    fastapi_app.dependency_overrides.clear()
+    # Don't let stubbed reports answer later requests for the same URL
+    jp_analyser_routes.insights_cache.clear()
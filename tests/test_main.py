@@ -2,86 +2,319 @@
 Integration Tests for FastAPI Application Endpoints.
 
 This module contains integration tests for the main API endpoints of the
-jobfit-ai-backend application. It uses FastAPI's TestClient to simulate
-HTTP requests and verify responses.
+jobfit-ai-backend application. Requests are dispatched in process through
+`httpx.AsyncClient` over an `ASGITransport`, so independent LLM round-trips
+can overlap on one event loop instead of blocking the test process in turn.
+
+The tests are independent, so pytest-xdist also spreads them over worker
+processes (see `addopts` in pyproject.toml). Within a process, the tests
+share one client and one event loop (see the `aclient` fixture in conftest.py).
+The route tests are kept together in xdist groups, so the app's lifespan and
+services, or the replicated server, are set up on one worker only.
+
+Tests marked `integration` talk to stubbed services unless pytest is run
+with `--integration` (see conftest.py).
 """
 
-from fastapi.testclient import TestClient
+import asyncio
+import inspect
+import re
+import statistics
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 
-from main import app
 from tests.mock_data.mock_jd import job_description
 
-client = TestClient(app)
+# Read once per process, so each xdist worker loads the sample resume a single time
+SAMPLE_RESUME = Path("tests/mock_data/sample_resume.pdf").read_bytes()
+
+# Any of "#", "*", "-", "```" or "**", found in a single scan
+MARKDOWN_TAG_PATTERN = re.compile(r"[#*-]|```")
+
+# Concurrent /health requests in the load test, and the floors they must clear
+HEALTH_LOAD_REQUESTS = 500
+HEALTH_MIN_REQUESTS_PER_SECOND = 200
+HEALTH_MAX_MEDIAN_LATENCY_SECONDS = 0.5
+
+# How long a queued resume job may take to finish, and the polling interval
+RESUME_JOB_TIMEOUT_SECONDS = 600
+RESUME_JOB_POLL_INTERVAL_SECONDS = 0.05
+
+# Sample form fields shared by the resume tailoring requests
+RESUME_FORM = {
+    "github_url": "https://github.com/octocat",
+    "write_up": "Backend engineer focused on data pipelines.",
+}
+RESUME_JOB_POSTING_URLS = [
+    "https://autonomize.keka.com/careers/jobdetails/722",
+    "https://autonomize.keka.com/careers/jobdetails/723",
+]
+
+# Paths whose handlers are deliberately plain `def` (run on the threadpool)
+ALLOWED_SYNC_ROUTES: frozenset[str] = frozenset()
+
+# Run every test on the session loop the shared client was created on
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+def assert_markdown_response(response: httpx.Response) -> None:
+    """Check for a 200 response whose 'response' field is a markdown-like string"""
+    assert response.status_code == 200
+
+    content = response.json().get("response")
+    assert content is not None
+    assert isinstance(content, str)
+
+    # Optional: Check if response looks like Markdown
+    assert MARKDOWN_TAG_PATTERN.search(content) is not None
+
+
+async def analyze_job_posting(aclient: httpx.AsyncClient) -> None:
+    """POST a sample job posting URL to /api/job-analysis/analyze and check the reply"""
+    data={"url": "https://autonomize.keka.com/careers/jobdetails/722"}
+    response = await aclient.post("/api/job-analysis/analyze", json=data) # Use json=data for FastAPI
+    assert_markdown_response(response)
+
+
+async def answer_hr_question(aclient: httpx.AsyncClient) -> None:
+    """POST a sample HR query to /api/hr-qa/answer and check the reply"""
+    data={"query": "How do you handle stress?"} # This should be a raw string as per hr_qa_routes
+    response = await aclient.post("/api/hr-qa/answer", json=data["query"]) # Send raw string in body
+    assert_markdown_response(response)
+
 
+async def check_ats(aclient: httpx.AsyncClient) -> None:
+    """POST the sample resume and job description to /api/ats-checker/check and check the reply"""
+    response = await aclient.post(
+        "/api/ats-checker/check",
+        files={"file": ("sample_resume.pdf", SAMPLE_RESUME, "application/pdf")},
+        data={"job_description":job_description }
+    )
+    assert_markdown_response(response)
 
-def test_api_health():
+
+async def test_api_health(aclient):
     """
     Tests the /health endpoint.
 
     Verifies that the endpoint returns a 200 OK status and the expected
-    JSON response: `{"status": "healthy"}`.
+    JSON response: `{"status": "healthy"}`, served as application/json.
     """
-    response = client.get("/health")
+    response = await aclient.get("/health")
     assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
     assert response.json() == {"status": "healthy"}
 
-def test_job_posting_analyzer_route(): # Corrected typo: jop -> job, analyseer -> analyzer
+def test_default_response_class(fastapi_app):
     """
-    Tests the /api/job-analysis/analyze endpoint.
+    Checks that the app serializes responses with orjson by default.
 
-    Sends a POST request with a sample job posting URL. Verifies that the
-    endpoint returns a 200 OK status and that the 'response' field in the
-    JSON payload is a non-null string, potentially containing markdown.
+    Routes that don't pick a response class fall back to `ORJSONResponse`
+    instead of FastAPI's stdlib-json `JSONResponse`.
     """
-    data={"url": "https://autonomize.keka.com/careers/jobdetails/722"}
-    response = client.post("/api/job-analysis/analyze",json=data) # Use json=data for FastAPI
-    assert response.status_code == 200
+    assert fastapi_app.router.default_response_class is ORJSONResponse
 
-    content = response.json().get("response")
-    assert content is not None
-    assert isinstance(content, str)
+def test_no_blocking_handlers(fastapi_app):
+    """
+    Checks that every API route handler is a coroutine function.
 
-    # Optional: Check if response looks like Markdown
-    assert any(tag in content for tag in ["#", "*", "-", "```", "**"])  # noqa: Q000
+    Plain `def` handlers run on the shared threadpool, where slow ones starve
+    concurrent requests. Handlers that are intentionally sync must be listed
+    in ALLOWED_SYNC_ROUTES.
+    """
+    blocking = [
+        route.path for route in fastapi_app.routes
+        if isinstance(route, APIRoute)
+        and not inspect.iscoroutinefunction(route.endpoint)
+        and route.path not in ALLOWED_SYNC_ROUTES
+    ]
+    assert not blocking, blocking
 
-def test_hr_qa_service_route():
+@pytest.mark.load
+async def test_health_throughput(aclient):
     """
-    Tests the /api/hr-qa/answer endpoint.
+    Load-checks the /health endpoint.
 
-    Sends a POST request with a sample HR query. Verifies that the endpoint
-    returns a 200 OK status and that the 'response' field in the JSON payload
-    is a non-null string, potentially containing markdown.
+    Sends HEALTH_LOAD_REQUESTS concurrent requests and verifies that all of them
+    succeed, that the overall throughput and the median latency clear their
+    floors. A handler or middleware that blocks the event loop serializes the
+    requests and fails both.
     """
-    data={"query": "How do you handle stress?"} # This should be a raw string as per hr_qa_routes
-    response = client.post("/api/hr-qa/answer", json=data["query"]) # Send raw string in body
-    assert response.status_code == 200
+    async def timed_get() -> float:
+        start = time.perf_counter()
+        response = await aclient.get("/health")
+        assert response.status_code == 200
+        return time.perf_counter() - start
 
-    content = response.json().get("response")
-    assert content is not None
-    assert isinstance(content, str)
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(timed_get() for _ in range(HEALTH_LOAD_REQUESTS)))
+    elapsed = time.perf_counter() - start
 
-    # Optional: Check if response looks like Markdown
-    assert any(tag in content for tag in ["#", "*", "-", "```", "**"]) 
+    assert HEALTH_LOAD_REQUESTS / elapsed >= HEALTH_MIN_REQUESTS_PER_SECOND
+    assert statistics.median(latencies) <= HEALTH_MAX_MEDIAN_LATENCY_SECONDS
 
-def test_ats_checker_route():
+# Route smoke checks, shared by the per-route test and the concurrent run
+ROUTE_CHECKS = {
+    "jd": analyze_job_posting,
+    "hr": answer_hr_question,
+    "ats": check_ats,
+}
+
+
+@pytest.mark.integration
+@pytest.mark.xdist_group(name="routes")
+@pytest.mark.parametrize("check_route", ROUTE_CHECKS.values(), ids=ROUTE_CHECKS.keys())
+async def test_route(aclient, check_route):
+    """
+    Tests the job analysis, HR QA and ATS checker endpoints.
+
+    Each case posts a sample input (a job posting URL, an HR question, or a
+    PDF resume with a job description) and verifies that the endpoint returns
+    a 200 OK status and that the 'response' field in the JSON payload is a
+    non-null string, potentially containing markdown.
+    """
+    await check_route(aclient)
+
+@pytest.mark.integration
+@pytest.mark.xdist_group(name="replicated")
+@pytest.mark.parametrize("check_route", ROUTE_CHECKS.values(), ids=ROUTE_CHECKS.keys())
+async def test_route_replicated(replicated_aclient, check_route):
+    """
+    Runs the route checks against the app served by several worker processes.
+
+    Catches state that only works within one process, such as caches or job
+    records a later request expects to find on the same worker. Needs
+    `--integration`, since the stubs can't be installed in the workers.
+    """
+    await check_route(replicated_aclient)
+
+@pytest.mark.integration
+@pytest.mark.xdist_group(name="routes")
+async def test_all_routes_concurrent(aclient):
     """
-    Tests the /api/ats-checker/check endpoint.
+    Runs the job analysis, HR QA and ATS requests at the same time.
+
+    Checks that the routes answer correctly while sharing the event loop and
+    worker pools, and takes about as long as the slowest of the three.
+    """
+    await asyncio.gather(*(check_route(aclient) for check_route in ROUTE_CHECKS.values()))
+
+
+def resume_file() -> dict[str, tuple[str, bytes, str]]:
+    """The sample resume as a multipart `file` field"""
+    return {"file": ("sample_resume.pdf", SAMPLE_RESUME, "application/pdf")}
+
+async def poll_resume_job(aclient: httpx.AsyncClient, task_id: str) -> dict:
+    """Poll GET /api/resume-builder/jobs/{task_id} until the job has finished"""
+    deadline = time.monotonic() + RESUME_JOB_TIMEOUT_SECONDS
+    while True:
+        response = await aclient.get(f"/api/resume-builder/jobs/{task_id}")
+        assert response.status_code == 200
+        job = response.json()
+        assert job["task_id"] == task_id
+        if job["status"] not in ("pending", "running"):
+            return job
+        assert time.monotonic() < deadline, "resume job did not finish in time"
+        await asyncio.sleep(RESUME_JOB_POLL_INTERVAL_SECONDS)
+
+@pytest.mark.integration
+@pytest.mark.xdist_group(name="routes")
+async def test_resume_job(aclient):
+    """
+    Tests queuing a resume tailoring job and polling it to completion.
+
+    Verifies that POST /api/resume-builder/jobs answers 202 Accepted with a
+    pending task id, and that polling the task id reports success with the
+    tailored resume.
+    """
+    response = await aclient.post(
+        "/api/resume-builder/jobs",
+        files=resume_file(),
+        data={**RESUME_FORM, "job_posting_url": RESUME_JOB_POSTING_URLS[0]}
+    )
+    assert response.status_code == 202
+    queued = response.json()
+    assert queued["status"] == "pending"
+
+    job = await poll_resume_job(aclient, queued["task_id"])
+    assert job["status"] == "success"
+    assert isinstance(job["result"], str) and job["result"]
+    assert isinstance(job["resume_json"], dict)
 
-    Sends a POST request with a sample PDF resume file and a job description string.
-    Verifies that the endpoint returns a 200 OK status and that the 'response'
-    field in the JSON payload is a non-null string, potentially containing markdown.
+@pytest.mark.xdist_group(name="routes")
+async def test_resume_job_visible_to_other_workers(aclient):
     """
-    file_path = "tests/mock_data/sample_resume.pdf"  # make sure this test file exists
-    with open(file_path, "rb") as f:
-        response = client.post(
-            "/api/ats-checker/check",
-            files={"file": ("sample_resume.pdf", f, "application/pdf")},
-            data={"job_description":job_description }
-        )
+    Checks that a queued job's state can be read by another worker process.
+
+    Another worker is emulated by a separate `FileJobStore` on the same
+    directory, which shares nothing with the route's store but the files.
+    """
+    from app.api.routes.resume_tailor import resume_jobs
+    from app.utils.job_store import FileJobStore
+
+    response = await aclient.post(
+        "/api/resume-builder/jobs",
+        files=resume_file(),
+        data={**RESUME_FORM, "job_posting_url": RESUME_JOB_POSTING_URLS[0]}
+    )
+    assert response.status_code == 202
+    task_id = response.json()["task_id"]
+
+    other_worker_jobs = FileJobStore(
+        directory=resume_jobs.directory, maxsize=resume_jobs.maxsize, ttl=resume_jobs.ttl
+    )
+    assert await other_worker_jobs.get(task_id) is not None
+    await poll_resume_job(aclient, task_id)
+
+@pytest.mark.parametrize("task_id", ["0" * 32, "not-a-task-id"])
+async def test_resume_job_unknown_id(aclient, task_id):
+    """
+    Tests polling a task id that was never issued.
+
+    Verifies that GET /api/resume-builder/jobs/{task_id} answers 404 Not Found,
+    including for ids that aren't valid job ids at all.
+    """
+    response = await aclient.get(f"/api/resume-builder/jobs/{task_id}")
+    assert response.status_code == 404
+
+@pytest.mark.integration
+@pytest.mark.xdist_group(name="routes")
+async def test_resume_batch(aclient):
+    """
+    Tests tailoring one resume for several job postings.
+
+    Verifies that POST /api/resume-builder/batch returns one successful result
+    per job posting, in request order.
+    """
+    response = await aclient.post(
+        "/api/resume-builder/batch",
+        files=resume_file(),
+        data={**RESUME_FORM, "job_posting_urls": RESUME_JOB_POSTING_URLS}
+    )
     assert response.status_code == 200
-    content = response.json().get("response")
-    assert content is not None
-    assert isinstance(content, str)
+    results = response.json()["results"]
+    assert [result["job_posting_url"] for result in results] == RESUME_JOB_POSTING_URLS
+    assert all(result["status"] == "success" for result in results)
 
-    # Optional: Check if response looks like Markdown
-    assert any(tag in content for tag in ["#", "*", "-", "```", "**"]) 
\ No newline at end of file
+@pytest.mark.xdist_group(name="routes")
+async def test_resume_batch_too_many_postings(aclient):
+    """
+    Tests that a batch over RESUME_BATCH_MAX_POSTINGS is rejected with 400.
+    """
+    from app.core.config import settings
+
+    urls = [
+        f"https://example.com/jobs/{index}"
+        for index in range(settings.RESUME_BATCH_MAX_POSTINGS + 1)
+    ]
+    response = await aclient.post(
+        "/api/resume-builder/batch",
+        files=resume_file(),
+        data={**RESUME_FORM, "job_posting_urls": urls}
+    )
+    assert response.status_code == 400
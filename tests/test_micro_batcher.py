@@ -0,0 +1,59 @@
+"""
+MicroBatcher Tests.
+
+Cover how the batcher copes with callers that give up on their request while
+it is queued or being processed, with and without a handler executor.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.utils.micro_batcher import MicroBatcher
+
+# How long the test handler takes per batch, and the batch window
+HANDLER_SECONDS = 0.1
+MAX_WAIT_MS = 20
+
+# Upper bound for any single await, so a hung worker fails the test
+TIMEOUT_SECONDS = 5
+
+
+def double_slowly(items: list[int]) -> list[int]:
+    time.sleep(HANDLER_SECONDS)
+    return [item * 2 for item in items]
+
+
+@pytest.fixture(params=["worker-thread", "executor"])
+def batcher(request):
+    executor = ThreadPoolExecutor(max_workers=2) if request.param == "executor" else None
+    batcher = MicroBatcher(double_slowly, max_wait_ms=MAX_WAIT_MS, executor=executor)
+    yield batcher
+    batcher.close()
+
+
+async def test_cancelled_caller_mid_batch(batcher):
+    """
+    Cancels one caller while its batch is being handled.
+
+    The other caller in the batch still gets its result, and the batcher keeps
+    serving later submissions.
+    """
+    cancelled = asyncio.ensure_future(batcher.run(1))
+    kept = asyncio.ensure_future(batcher.run(3))
+    await asyncio.sleep(HANDLER_SECONDS / 2 + MAX_WAIT_MS / 1000)
+    cancelled.cancel()
+
+    assert await asyncio.wait_for(kept, TIMEOUT_SECONDS) == 6
+    assert await asyncio.wait_for(batcher.run(2), TIMEOUT_SECONDS) == 4
+
+
+async def test_cancelled_before_batch(batcher):
+    """Cancels a queued future before its batch forms; it is skipped"""
+    future = batcher.submit(5)
+    future.cancel()
+
+    assert await asyncio.wait_for(batcher.run(4), TIMEOUT_SECONDS) == 8
+    assert future.cancelled()
@@ -0,0 +1,158 @@
+"""
+Service-level Tests.
+
+These tests exercise the service classes directly rather than through the
+HTTP routes, with the LLM replaced by a local stand-in, so they run without
+network access or API keys.
+"""
+
+import io
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from crewai.llms.base_llm import BaseLLM
+
+from app.core.config import settings
+from app.llm.provider import GoogleProvider
+from app.rag.rag_system import PDFRAGSystem
+from app.service.ats_checker_service import ATSCheckerService
+from app.service.semantic_cache import SemanticCache
+
+SAMPLE_RESUME = Path("tests/mock_data/sample_resume.pdf").read_bytes()
+
+# Request markers the stand-in LLM copies from its prompt into its answer
+MARKER_PATTERN = re.compile(r"MARKER-[A-Z]+")
+
+# Concurrent requests per input in the isolation test
+CONCURRENT_ROUNDS = 4
+
+# A cached HR question, and different questions that must not be answered with it
+CACHED_QUESTION = "How do you handle stress?"
+NEAR_MISS_QUESTIONS = [
+    "How do you handle conflict?",
+    "How do you handle criticism?",
+    "How do you handle failure?",
+    "How do you handle tight deadlines?",
+]
+
+
+class MarkerEchoLLM(BaseLLM):
+    """
+    LLM stand-in whose final answer lists the request markers in its prompt.
+
+    Task descriptions carry the request's inputs and later tasks receive earlier
+    outputs as context, so a run's answer names exactly the markers its own
+    inputs contained, unless state from another run leaked in.
+    """
+
+    def __init__(self):
+        super().__init__(model="marker-echo")
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None):
+        if isinstance(messages, str):
+            prompt = messages
+        else:
+            prompt = "\n".join(str(message.get("content", "")) for message in messages)
+        # Give concurrent runs time to interleave
+        time.sleep(0.01)
+        markers = " ".join(sorted(set(MARKER_PATTERN.findall(prompt))))
+        return f"Thought: I now can give a great answer\nFinal Answer: {markers}"
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def supports_stop_words(self) -> bool:
+        return False
+
+    def get_context_window_size(self) -> int:
+        return 1_000_000
+
+
+@pytest.fixture
+def marker_echo_llm(monkeypatch):
+    """Make every service built during the test use `MarkerEchoLLM`"""
+    llm = MarkerEchoLLM()
+    monkeypatch.setattr(GoogleProvider, "gemini_llm", lambda self: llm)
+    return llm
+
+
+def test_ats_concurrent_requests_do_not_mix(marker_echo_llm):
+    """
+    Runs ATS analyses for two different job descriptions concurrently.
+
+    Verifies that every report carries its own job description's marker and
+    never the other one's, i.e. that concurrent kickoffs don't share task state.
+    """
+    service = ATSCheckerService()
+    job_descriptions = {
+        "MARKER-ALPHA": "Job Title: Data Engineer (MARKER-ALPHA). Build Spark and Airflow pipelines.",
+        "MARKER-BETA": "Job Title: Frontend Developer (MARKER-BETA). Build React interfaces.",
+    }
+
+    def analyze(marker: str) -> tuple[str, str]:
+        report = service.analyze(io.BytesIO(SAMPLE_RESUME), job_descriptions[marker])
+        return marker, report
+
+    markers = list(job_descriptions) * CONCURRENT_ROUNDS
+    with ThreadPoolExecutor(max_workers=len(markers)) as executor:
+        results = list(executor.map(analyze, markers))
+
+    for marker, report in results:
+        other_markers = set(job_descriptions) - {marker}
+        assert marker in report
+        assert not any(other in report for other in other_markers)
+
+
+def test_ats_instances_share_templates_but_not_runs(marker_echo_llm):
+    """
+    Runs two ATS service instances concurrently on different job descriptions.
+
+    Instances with the same LLM and configuration share their agent and task
+    templates; every report must still carry only its own job description's
+    marker, since each request kicks off its own copy of the crews.
+    """
+    services = {"MARKER-ALPHA": ATSCheckerService(), "MARKER-BETA": ATSCheckerService()}
+    first, second = services.values()
+    assert first.tasks[0] is second.tasks[0]
+
+    def analyze(marker: str) -> tuple[str, str]:
+        job_description = f"Job Title: Backend Engineer ({marker}). Build Python APIs."
+        report = services[marker].analyze(io.BytesIO(SAMPLE_RESUME), job_description)
+        return marker, report
+
+    markers = list(services) * CONCURRENT_ROUNDS
+    with ThreadPoolExecutor(max_workers=len(markers)) as executor:
+        results = list(executor.map(analyze, markers))
+
+    for marker, report in results:
+        assert marker in report
+        assert not any(other in report for other in set(services) - {marker})
+
+
+@pytest.fixture(scope="module")
+def hr_embedder(request):
+    """The HR QA service's query embedding model"""
+    if not request.config.getoption("--integration"):
+        # Loading it downloads the model and starts torch
+        pytest.skip("loads the embedding model, run with --integration")
+    return PDFRAGSystem().embedder
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("question", NEAR_MISS_QUESTIONS)
+def test_semantic_cache_near_miss(hr_embedder, question):
+    """
+    Checks that the HR answer cache doesn't serve a related but different question.
+
+    Questions sharing most of their wording with a cached one embed close to it,
+    so with too low a SEMANTIC_CACHE_THRESHOLD they would get its answer. Needs
+    `--integration`, since it embeds the questions with the real model.
+    """
+    cache = SemanticCache(dim=settings.EMBEDDING_DIM, threshold=settings.SEMANTIC_CACHE_THRESHOLD)
+    cache.put(hr_embedder.embed_query(CACHED_QUESTION), "answer about stress")
+
+    assert cache.get(hr_embedder.embed_query(CACHED_QUESTION)) == "answer about stress"
+    assert cache.get(hr_embedder.embed_query(question)) is None
@@ -0,0 +1,34 @@
+"""
+WorkerPool Tests.
+
+Cover pools outliving one application lifespan: after `shutdown`, and on a
+new event loop, the same module-level pool must keep accepting work.
+"""
+
+import asyncio
+
+from app.utils.worker_pool import WorkerPool
+
+
+async def sleep_briefly() -> str:
+    await asyncio.sleep(0.01)
+    return "async"
+
+
+async def use_pool(pool: WorkerPool) -> tuple[str, str]:
+    """Start the pool on the running loop and run one blocking and one async call"""
+    pool.start()
+    return await pool.run(lambda: "sync"), await pool.run_async(sleep_briefly)
+
+
+def test_pool_survives_consecutive_lifespans():
+    """
+    Uses one pool across two event loops with a shutdown in between.
+
+    This is what two app lifespans in one process (two test sessions, two
+    clients, an embedded server) do to the module-level pools.
+    """
+    pool = WorkerPool("test", size=2, rate=100)
+    for _ in range(2):
+        assert asyncio.run(use_pool(pool)) == ("sync", "async")
+        pool.shutdown()